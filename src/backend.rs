@@ -26,7 +26,7 @@ pub fn dialect_from_url(url: &str) -> Result<Dialect, UnsupportedDatabaseUrl> {
 /// Everything needed to (re)build a connection pool. Owned by `EngineHandle`
 /// so the engine can atomically replace its pool after schema-changing DDL
 /// (see [`EngineHandle::refresh_pool`]).
-#[derive(Clone, Debug)]
+#[derive(Clone, Debug, PartialEq, Eq)]
 pub struct PoolSpec {
     /// Classified backend for pool construction.
     pub backend: Dialect,
@@ -340,6 +340,21 @@ impl EngineHandle {
         Ok(())
     }
 
+    /// Whether this handle was built from an identical [`PoolSpec`] with the same
+    /// per-connection flags, so a repeated `connect()` for the same URL can reuse the
+    /// live pool instead of opening a new one.
+    #[must_use]
+    pub fn is_built_from(
+        &self,
+        spec: &PoolSpec,
+        identity_map_enabled: bool,
+        shadow_runtime_enabled: bool,
+    ) -> bool {
+        self.spec.as_ref() == Some(spec)
+            && self.identity_map_enabled == identity_map_enabled
+            && self.shadow_runtime_enabled == shadow_runtime_enabled
+    }
+
     /// Returns whether this connection uses the identity map (singleton instances per PK).
     #[must_use]
     pub fn is_identity_map_enabled(&self) -> bool {
@@ -494,6 +509,43 @@ impl EngineHandle {
         }
     }
 
+    /// Run `statements` as one atomic unit on a pooled connection.
+    ///
+    /// Uses sqlx's `Transaction`, which rolls back when dropped: a failed
+    /// statement, a failed `COMMIT`, or a future cancelled between statements
+    /// never returns the connection to the pool with a transaction still open.
+    pub async fn execute_batch_atomic(
+        &self,
+        statements: &[(String, Vec<EngineBindValue>)],
+    ) -> Result<u64, sqlx::Error> {
+        let mut rows_affected = 0;
+        match &self.pool_snapshot() {
+            BackendPool::Sqlite(pool) => {
+                let mut tx = pool.begin().await?;
+                for (sql, values) in statements {
+                    let mut query = sqlx::query(sql);
+                    for value in values {
+                        query = bind_engine_value(query, value);
+                    }
+                    rows_affected += query.execute(&mut *tx).await?.rows_affected();
+                }
+                tx.commit().await?;
+            }
+            BackendPool::Postgres(pool) => {
+                let mut tx = pool.begin().await?;
+                for (sql, values) in statements {
+                    let mut query = sqlx::query(sql);
+                    for value in values {
+                        query = bind_engine_value(query, value);
+                    }
+                    rows_affected += query.execute(&mut *tx).await?.rows_affected();
+                }
+                tx.commit().await?;
+            }
+        }
+        Ok(rows_affected)
+    }
+
     pub async fn fetch_all_sql_with_binds(
         &self,
         sql: &str,
@@ -519,7 +571,6 @@ impl EngineHandle {
         }
     }
 
-    #[allow(dead_code)]
     pub async fn begin_transaction_connection(&self) -> Result<EngineConnection, sqlx::Error> {
         match &self.pool_snapshot() {
             BackendPool::Sqlite(pool) => {
@@ -1057,6 +1108,45 @@ mod tests {
         assert!(rows.is_empty());
     }
 
+    #[tokio::test]
+    async fn engine_handle_batch_rolls_back_and_releases_clean_connection() {
+        let pool = SqlitePoolOptions::new()
+            .max_connections(1)
+            .connect("sqlite::memory:")
+            .await
+            .unwrap();
+        let engine = EngineHandle::new_sqlite(pool);
+
+        engine
+            .execute_sql("CREATE TABLE typed_batch_check (id integer primary key, name text)")
+            .await
+            .unwrap();
+
+        let insert = "INSERT INTO typed_batch_check (id, name) VALUES (?, ?)".to_string();
+        let row = |id: i64| {
+            vec![
+                EngineBindValue::I64(id),
+                EngineBindValue::String("ferro".to_string()),
+            ]
+        };
+        let duplicate = engine
+            .execute_batch_atomic(&[(insert.clone(), row(1)), (insert.clone(), row(1))])
+            .await;
+        assert!(duplicate.is_err());
+
+        // The only pooled connection must come back without an open transaction.
+        let affected = engine
+            .execute_batch_atomic(&[(insert.clone(), row(1)), (insert, row(2))])
+            .await
+            .unwrap();
+        assert_eq!(affected, 2);
+        let rows = engine
+            .fetch_all_sql_with_binds("SELECT name FROM typed_batch_check", &[])
+            .await
+            .unwrap();
+        assert_eq!(rows.len(), 2);
+    }
+
     #[test]
     fn engine_value_converts_integer_like_values_to_i64() {
         assert_eq!(EngineValue::I64(42).as_i64(), Some(42));
@@ -6,7 +6,9 @@
 
 use crate::backend::{EngineRow, EngineValue};
 use crate::state::{Dialect, MODEL_REGISTRY, RustValue};
-use sea_query::{Alias, Expr, SelectStatement, SimpleExpr, Value as SeaValue};
+use sea_query::{
+    Alias, Expr, Query, ReturningClause, SelectStatement, SimpleExpr, Value as SeaValue,
+};
 use serde_json::Value;
 use std::collections::{HashMap, HashSet};
 
@@ -142,6 +144,19 @@ fn model_schema_property(model_name: &str, col_name: &str) -> Option<Value> {
     Some(col_info.clone())
 }
 
+fn needs_postgres_text_projection(
+    col_name: &str,
+    col_info: &Value,
+    pg_native_enum_columns: &HashSet<String>,
+) -> bool {
+    matches!(
+        format(col_info),
+        Some("uuid" | "date-time" | "date" | "decimal")
+    ) || matches!(json_type(col_info), Some("object" | "array"))
+        || is_enum(col_info)
+        || pg_native_enum_columns.contains(col_name)
+}
+
 /// Expand a `SELECT` column list on Postgres so text-like columns hydrate identically to SQLite.
 ///
 /// UUID, temporal, decimal, JSON, enum, and native enum UDT columns are wrapped in
@@ -169,31 +184,58 @@ pub fn apply_postgres_text_select_columns(
         select.column((tbl.clone(), sea_query::Asterisk));
         return;
     };
-    let need_text_from_schema = properties.values().any(|col_info| {
-        let resolved = resolve_ref(schema, col_info);
-        matches!(
-            format(resolved),
-            Some("uuid" | "date-time" | "date" | "decimal")
-        ) || matches!(json_type(resolved), Some("object" | "array"))
-            || is_enum(resolved)
+    let needs_text = properties.iter().any(|(col_name, col_info)| {
+        needs_postgres_text_projection(
+            col_name,
+            resolve_ref(schema, col_info),
+            pg_native_enum_columns,
+        )
     });
-    let need_text_from_native_enum = properties
-        .keys()
-        .any(|k| pg_native_enum_columns.contains(k.as_str()));
-    if !need_text_from_schema && !need_text_from_native_enum {
+    if !needs_text {
         select.column((tbl.clone(), sea_query::Asterisk));
         return;
     }
     for (col_name, col_info) in properties {
         let col_iden = Alias::new(col_name.as_str());
         let col_info = resolve_ref(schema, col_info);
-        if matches!(
-            format(col_info),
-            Some("uuid" | "date-time" | "date" | "decimal")
-        ) || matches!(json_type(col_info), Some("object" | "array"))
-            || is_enum(col_info)
-            || pg_native_enum_columns.contains(col_name.as_str())
-        {
+        if needs_postgres_text_projection(col_name, col_info, pg_native_enum_columns) {
+            let expr = Expr::cast_as(
+                Expr::col((tbl.clone(), col_iden.clone())),
+                Alias::new("text"),
+            );
+            select.expr_as(expr, col_iden);
+        } else {
+            select.column((tbl.clone(), col_iden));
+        }
+    }
+}
+
+/// Select only `columns`, casting text-like columns on Postgres exactly as
+/// [`apply_postgres_text_select_columns`] does for full-row projections.
+///
+/// # Arguments
+/// * `select` — SeaQuery select under construction (mutated in place).
+/// * `table_name` — Physical table name for column qualification.
+/// * `schema` — Model JSON schema (`properties` map).
+/// * `columns` — Requested column names, in output order.
+/// * `pg_native_enum_columns` — Columns whose live type is `typtype = 'e'` in `pg_catalog`.
+/// * `backend` — Active dialect.
+pub fn apply_postgres_text_named_columns(
+    select: &mut SelectStatement,
+    table_name: &str,
+    schema: &Value,
+    columns: &[String],
+    pg_native_enum_columns: &HashSet<String>,
+    backend: Dialect,
+) {
+    let tbl = Alias::new(table_name);
+    for col_name in columns {
+        let col_iden = Alias::new(col_name.as_str());
+        let needs_text = backend == Dialect::Postgres
+            && schema_property(schema, col_name).is_some_and(|col_info| {
+                needs_postgres_text_projection(col_name, col_info, pg_native_enum_columns)
+            });
+        if needs_text {
             let expr = Expr::cast_as(
                 Expr::col((tbl.clone(), col_iden.clone())),
                 Alias::new("text"),
@@ -205,6 +247,55 @@ pub fn apply_postgres_text_select_columns(
     }
 }
 
+/// Build the `RETURNING` projection for write statements that hydrate model rows.
+///
+/// Mirrors [`apply_postgres_text_select_columns`]: Postgres casts the same text-like columns
+/// to `text` (a bare `CAST(col AS text)` keeps `col` as its output column name); every other
+/// case returns `*`.
+///
+/// # Arguments
+/// * `schema` — Model JSON schema (`properties` map).
+/// * `pg_native_enum_columns` — Columns whose live type is `typtype = 'e'` in `pg_catalog`.
+/// * `backend` — Active dialect.
+pub fn postgres_text_returning_clause(
+    schema: &Value,
+    pg_native_enum_columns: &HashSet<String>,
+    backend: Dialect,
+) -> ReturningClause {
+    if backend != Dialect::Postgres {
+        return Query::returning().all();
+    }
+    let Some(properties) = schema.get("properties").and_then(|p| p.as_object()) else {
+        return Query::returning().all();
+    };
+    let needs_text = properties.iter().any(|(col_name, col_info)| {
+        needs_postgres_text_projection(
+            col_name,
+            resolve_ref(schema, col_info),
+            pg_native_enum_columns,
+        )
+    });
+    if !needs_text {
+        return Query::returning().all();
+    }
+    let exprs: Vec<SimpleExpr> = properties
+        .iter()
+        .map(|(col_name, col_info)| {
+            let col = Expr::col(Alias::new(col_name.as_str()));
+            if needs_postgres_text_projection(
+                col_name,
+                resolve_ref(schema, col_info),
+                pg_native_enum_columns,
+            ) {
+                col.cast_as(Alias::new("text"))
+            } else {
+                col.into()
+            }
+        })
+        .collect();
+    Query::returning().exprs(exprs)
+}
+
 /// Build a typed SeaQuery RHS expression for INSERT/UPDATE from JSON field values.
 ///
 /// Uses model schema metadata plus live Postgres catalog hints (`enum_udt`, `uuid_columns`,
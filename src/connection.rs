@@ -146,21 +146,42 @@ fn shadow_runtime_enabled_from_env() -> bool {
         .unwrap_or(false)
 }
 
-async fn connect_engine_handle(
+fn pool_spec(
     connection_url: &str,
     backend: crate::state::Dialect,
     search_path: Option<String>,
     max_connections: u32,
     min_connections: u32,
-) -> Result<EngineHandle, sqlx::Error> {
-    EngineHandle::connect(PoolSpec {
+) -> PoolSpec {
+    PoolSpec {
         backend,
         url: connection_url.to_string(),
         search_path,
         max_connections,
         min_connections,
-    })
-    .await
+    }
+}
+
+/// Return the live implicit-default engine when `connect()` is repeated with an identical
+/// URL and pool settings, so the caller reuses its pool instead of opening another one.
+/// Named connections never reuse: registering one twice is an error.
+fn reusable_default_engine(
+    connection_name: &str,
+    is_implicit_default: bool,
+    spec: &PoolSpec,
+    identity_map: bool,
+    shadow_runtime_enabled: bool,
+) -> PyResult<Option<Arc<EngineHandle>>> {
+    if !is_implicit_default {
+        return Ok(None);
+    }
+    let registry = CONNECTION_REGISTRY.read().map_err(|_| {
+        pyo3::exceptions::PyRuntimeError::new_err("Failed to lock Connection Registry")
+    })?;
+    Ok(registry
+        .get(connection_name)
+        .filter(|existing| existing.is_built_from(spec, identity_map, shadow_runtime_enabled))
+        .cloned())
 }
 
 /// Initializes the global database connection pool.
@@ -231,24 +252,35 @@ pub fn connect(
             )));
         }
 
-        let engine_handle = connect_engine_handle(
+        let shadow_runtime_enabled = shadow_runtime_enabled_from_env();
+        let spec = pool_spec(
             &connection_url,
             backend,
             search_path.clone(),
             max_connections,
             min_connections,
-        )
-        .await
-        .map_err(|e| {
-            pyo3::exceptions::PyConnectionError::new_err(format!(
-                "DB Connection failed for {}: {}",
-                redacted_url, e
-            ))
-        })?
-        .with_identity_map_enabled(identity_map)
-        .with_shadow_runtime_enabled(shadow_runtime_enabled_from_env());
-
-        let engine_handle = Arc::new(engine_handle);
+        );
+        let engine_handle = match reusable_default_engine(
+            &connection_name,
+            is_implicit_default,
+            &spec,
+            identity_map,
+            shadow_runtime_enabled,
+        )? {
+            Some(existing) => existing,
+            None => Arc::new(
+                EngineHandle::connect(spec)
+                    .await
+                    .map_err(|e| {
+                        pyo3::exceptions::PyConnectionError::new_err(format!(
+                            "DB Connection failed for {}: {}",
+                            redacted_url, e
+                        ))
+                    })?
+                    .with_identity_map_enabled(identity_map)
+                    .with_shadow_runtime_enabled(shadow_runtime_enabled),
+            ),
+        };
 
         // Flag ladder: migrate_destructive ⇒ migrate_updates ⇒ auto_migrate.
         // There is no coherent "alter existing tables but don't create missing
@@ -354,28 +386,57 @@ pub fn set_default_connection(name: String) -> PyResult<()> {
 
 #[cfg(test)]
 mod tests {
-    use super::connect_engine_handle;
+    use super::{pool_spec, reusable_default_engine};
+    use crate::backend::EngineHandle;
+    use crate::state::CONNECTION_REGISTRY;
     use ferro_ddl_lowering::Dialect;
+    use std::sync::Arc;
+
+    async fn register_sqlite_engine(name: &str) -> Arc<EngineHandle> {
+        let engine = Arc::new(
+            EngineHandle::connect(pool_spec("sqlite::memory:", Dialect::Sqlite, None, 5, 0))
+                .await
+                .unwrap(),
+        );
+        CONNECTION_REGISTRY
+            .write()
+            .unwrap()
+            .insert(name.to_string(), engine.clone());
+        engine
+    }
 
     #[tokio::test]
-    async fn connect_engine_handle_uses_typed_sqlite_backend() {
-        let engine = connect_engine_handle("sqlite::memory:", Dialect::Sqlite, None, 5, 0)
-            .await
-            .unwrap();
-
-        assert_eq!(engine.backend(), Dialect::Sqlite);
-        assert!(engine.sqlite_pool().is_some());
-        assert!(engine.postgres_pool().is_none());
+    async fn reconnecting_default_with_same_spec_reuses_live_engine() {
+        let name = "reuse_same_spec";
+        let engine = register_sqlite_engine(name).await;
+        let spec = pool_spec("sqlite::memory:", Dialect::Sqlite, None, 5, 0);
+
+        let reused = reusable_default_engine(name, true, &spec, true, false)
+            .unwrap()
+            .expect("identical default connect() should reuse the registered engine");
+        CONNECTION_REGISTRY.write().unwrap().remove(name);
+
+        assert!(Arc::ptr_eq(&reused, &engine));
+        assert_eq!(reused.backend(), Dialect::Sqlite);
+        assert!(reused.sqlite_pool().is_some());
+        assert!(reused.postgres_pool().is_none());
+        assert_eq!(reused.execute_sql("SELECT 1").await.unwrap(), 0);
     }
 
     #[tokio::test]
-    async fn connect_engine_handle_supports_sqlite_runtime_execution() {
-        let engine = connect_engine_handle("sqlite::memory:", Dialect::Sqlite, None, 5, 0)
-            .await
-            .unwrap();
-
-        assert_eq!(engine.backend(), Dialect::Sqlite);
-        assert!(engine.sqlite_pool().is_some());
-        assert_eq!(engine.execute_sql("SELECT 1").await.unwrap(), 0);
+    async fn reconnecting_with_different_settings_opens_new_engine() {
+        let name = "reuse_changed_spec";
+        register_sqlite_engine(name).await;
+        let spec = pool_spec("sqlite::memory:", Dialect::Sqlite, None, 5, 0);
+        let resized = pool_spec("sqlite::memory:", Dialect::Sqlite, None, 10, 0);
+
+        let named = reusable_default_engine(name, false, &spec, true, false).unwrap();
+        let pool_changed = reusable_default_engine(name, true, &resized, true, false).unwrap();
+        let flags_changed = reusable_default_engine(name, true, &spec, false, false).unwrap();
+        CONNECTION_REGISTRY.write().unwrap().remove(name);
+
+        assert!(named.is_none());
+        assert!(pool_changed.is_none());
+        assert!(flags_changed.is_none());
     }
 }
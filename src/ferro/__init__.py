@@ -16,6 +16,7 @@ from ._core import (
     clear_registry as _core_clear_registry,
     create_tables as _core_create_tables,
     evict_instance,
+    flush_identity_map as _core_flush_identity_map,
     migrate as _core_migrate,
     reset_engine,
     set_default_connection,
@@ -69,6 +70,35 @@ def clear_registry() -> None:
     _JOIN_TABLE_REGISTRY.clear()
 
 
+def flush_identity_map(
+    model: type[Model] | None = None, *, session: Session | None = None
+) -> None:
+    """Drop tracked instances from the identity map, keeping the engine connected.
+
+    Subsequent loads re-hydrate from the database instead of returning the
+    previously tracked objects. This is the cheap alternative to
+    ``reset_engine()`` followed by ``connect()`` when only the in-memory
+    instances need to go.
+
+    Args:
+        model: Only forget instances of this model class. ``None`` clears
+            every model.
+        session: Flush this session's identity map instead of the global one.
+            Defaults to the active session, if any.
+
+    Examples:
+        >>> flush_identity_map(User)
+        >>> flush_identity_map()
+    """
+    from .state import _CURRENT_SESSION
+
+    active_session = session if session is not None else _CURRENT_SESSION.get()
+    _core_flush_identity_map(
+        model.__name__ if model is not None else None,
+        session_id=active_session.session_id if active_session is not None else None,
+    )
+
+
 class PoolConfig(BaseModel):
     """Connection pool settings for a named Ferro connection."""
 
@@ -103,7 +133,9 @@ async def connect(
         auto_migrate: If True, automatically create tables for all registered models.
             Existing tables are left untouched unless ``migrate_updates`` /
             ``migrate_destructive`` are also set.
-        name: Optional connection name. Omitted connections register as "default".
+        name: Optional connection name. Omitted connections register as "default";
+            calling ``connect()`` again for the same URL and pool settings reuses the
+            live default pool instead of opening a new one.
         default: If True, make this named connection the default for unqualified operations.
         pool: Optional per-connection pool configuration.
         identity_map: If True (default), keep a per-connection identity map so the same primary
@@ -223,6 +255,7 @@ __all__ = [
     "set_default_connection",
     "clear_registry",
     "evict_instance",
+    "flush_identity_map",
     "transaction",
     "execute",
     "fetch_all",
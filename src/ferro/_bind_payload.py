@@ -16,11 +16,16 @@ from pydantic_core import to_json
 
 def _bytes_field_names(instance: Any) -> set[str]:
     """Fields whose *current value* is bytes-like (value-driven: catches
-    ``bytes``, ``bytes | None``, and ``Any``-typed bytes)."""
+    ``bytes``, ``bytes | None``, and ``Any``-typed bytes).
+
+    Reads ``__dict__`` directly: field values live there, and a plain dict
+    lookup skips attribute resolution (and any descriptor) for every field.
+    """
+    values = instance.__dict__
     return {
         name
         for name in type(instance).model_fields
-        if isinstance(getattr(instance, name, None), (bytes, bytearray))
+        if isinstance(values.get(name), (bytes, bytearray))
     }
 
 
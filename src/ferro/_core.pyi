@@ -43,6 +43,14 @@ def _render_create_table_sql_for_test(
     """
     ...
 
+def _table_creation_order_for_test() -> list[str]:
+    """Test-only: registered model and join-table names in FK creation order.
+
+    Mirrors the order ``create_tables`` / ``migrate`` create tables in; the test
+    suite empties shared tables in the reverse of this order.
+    """
+    ...
+
 def _render_migration_sql_for_test(
     name: str,
     schema_ir_json: str,
@@ -106,6 +114,21 @@ async def count_filtered(
     using: Optional[str] = None,
     session_id: Optional[str] = None,
 ) -> int: ...
+async def exists_filtered(
+    name: str,
+    query_ir_json: str,
+    tx_id: Optional[str] = None,
+    using: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> bool: ...
+async def fetch_filtered_values(
+    name: str,
+    query_ir_json: str,
+    columns: list[str],
+    tx_id: Optional[str] = None,
+    using: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> list[dict[str, Any]]: ...
 async def fetch_one(
     cls: object,
     pk_val: str,
@@ -149,6 +172,14 @@ async def update_filtered(
     using: Optional[str] = None,
     session_id: Optional[str] = None,
 ) -> int: ...
+async def update_filtered_returning(
+    cls: object,
+    query_ir_json: str,
+    updates: dict[str, Any],
+    tx_id: Optional[str] = None,
+    using: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> list[Any]: ...
 async def add_m2m_links(
     join_table: str,
     source_col: str,
@@ -218,6 +249,9 @@ def register_instance(
 def evict_instance(
     name: str, pk: str, using: Optional[str] = None, session_id: Optional[str] = None
 ) -> None: ...
+def flush_identity_map(
+    name: Optional[str] = None, session_id: Optional[str] = None
+) -> None: ...
 def reset_engine() -> None: ...
 def set_default_connection(name: str) -> None: ...
 def clear_registry() -> None: ...
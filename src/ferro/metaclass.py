@@ -13,7 +13,6 @@ from typing import (
 )
 
 from pydantic import BaseModel
-from pydantic import Field as PydanticField
 from pydantic.fields import FieldInfo
 
 from ._annotation_utils import (
@@ -25,12 +24,19 @@ from ._core import register_model_schema
 from ._shadow_fk_types import shadow_annotation_for_foreign_key
 from .base import FerroField, ForeignKey, ManyToManyRelation
 from .fields import FERRO_FIELD_EXTRA_KEY
-from .ir import compile_model_schema_ir, compile_registry_schema_ir
+from .ir import compile_model_schema_ir
 from .query import FieldProxy, Relation
 from .relations.descriptors import ForwardDescriptor
 from .schema_metadata import _enum_subclass_from_annotation, build_model_schema
 from .state import _MODEL_REGISTRY_PY, _PENDING_RELATIONS
 
+# Unevaluated annotation types mapped to their source text. Checked with an
+# exact ``type(hint)`` lookup so evaluated hints skip the scan entirely.
+_ANNOTATION_SOURCE = {
+    str: lambda hint: hint,
+    ForwardRef: lambda hint: hint.__forward_arg__,
+}
+
 
 class ModelMetaclass(type(BaseModel)):
     """
@@ -111,13 +117,12 @@ class ModelMetaclass(type(BaseModel)):
         field_name: str, hint: Any, namespace: dict
     ) -> dict[str, Any]:
         """Return relationship metadata supplied by ferro.Field helpers."""
-        origin = get_origin(hint)
         default_val = namespace.get(field_name)
         payload = ModelMetaclass._field_ferro_payload(default_val)
         if payload:
             return payload
 
-        if origin is Annotated:
+        if get_origin(hint) is Annotated:
             for metadata in get_args(hint)[1:]:
                 payload = ModelMetaclass._field_ferro_payload(metadata)
                 if payload:
@@ -174,11 +179,8 @@ class ModelMetaclass(type(BaseModel)):
 
     @staticmethod
     def _annotation_looks_like_back_ref(hint: Any) -> bool:
-        if isinstance(hint, str) and "BackRef" in hint:
-            return True
-        if isinstance(hint, ForwardRef) and "BackRef" in hint.__forward_arg__:
-            return True
-        return False
+        source = _ANNOTATION_SOURCE.get(type(hint))
+        return source is not None and "BackRef" in source(hint)
 
     @staticmethod
     def _resolve_deferred_annotations(namespace: dict) -> dict[str, Any]:
@@ -190,6 +192,11 @@ class ModelMetaclass(type(BaseModel)):
         """
         # Handle Python 3.14+ deferred annotations
         # We need a complete __annotations__ dict so we can safely modify it.
+        # Format 1 stays first for every class: `from __future__ import
+        # annotations` modules never reach this branch (their __annotations__
+        # are strings), and a compiler-generated annotate function called with
+        # format 2 evaluates against the same globals, so it only rescues
+        # hand-written annotate functions.
         if "__annotate_func__" in namespace and "__annotations__" not in namespace:
             try:
                 # Format 1: Value (evaluated)
@@ -323,8 +330,10 @@ class ModelMetaclass(type(BaseModel)):
                 # INJECT SHADOW FIELD into annotations
                 id_field = f"{field_name}_id"
                 annotations[id_field] = shadow_annotation_for_foreign_key(metadata)
-                # Set a default so Pydantic doesn't make it required
-                namespace[id_field] = PydanticField(default=None)
+                # Set a default so Pydantic doesn't make it required. FieldInfo
+                # directly skips Field()'s argument normalization, several times
+                # the cost of the FieldInfo itself.
+                namespace[id_field] = FieldInfo(default=None)
 
     @staticmethod
     def _prepare_namespace_for_pydantic(
@@ -551,7 +560,10 @@ class ModelMetaclass(type(BaseModel)):
             if schema:
                 setattr(cls, "__ferro_schema__", schema)
                 register_model_schema(name, json.dumps(schema))
-                compile_model_schema_ir(name, cls)
-                compile_registry_schema_ir()
+                # Only this model is compiled here. The registry-wide modelset
+                # is compiled by connect/create_tables/migrate right before
+                # use; recompiling it here made each class definition rebuild
+                # every registered model's JSON schema.
+                compile_model_schema_ir(name, cls, schema)
         except Exception as e:
             raise RuntimeError(f"Ferro failed to register model '{name}': {e}")
@@ -1,6 +1,7 @@
 """Define the core ORM model base and transaction helpers for Ferro."""
 
 import json
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from enum import Enum
 from typing import (
@@ -33,6 +34,7 @@ from .base import ForeignKey, foreign_key_allows_none
 from .exceptions import ModelDoesNotExist
 from .metaclass import ModelMetaclass
 from .query import Predicate, Query, QueryNode
+from .relations.descriptors import _PREFETCH_CACHE_ATTR
 from .state import (
     _CURRENT_TRANSACTION,
     _CURRENT_TRANSACTION_CONNECTION,
@@ -49,6 +51,28 @@ def _field_eq(field_name: str, value: Any) -> Predicate[Any]:
     return lambda t, f=field_name, v=value: getattr(t, f) == v
 
 
+async def _create_or_fetch_winner(
+    query: Query[Any], create: Callable[[], Awaitable[Any]]
+) -> tuple[Any, bool]:
+    """Run the create half of ``get_or_create`` / ``update_or_create``.
+
+    If the INSERT fails because a concurrent writer inserted a matching row
+    after our lookup, return that row as ``(instance, False)``. Any other
+    failure (no matching row afterwards) re-raises the original error.
+    """
+    try:
+        return await create(), True
+    except RuntimeError:
+        try:
+            winner = await query.first()
+        except RuntimeError:
+            # e.g. Postgres refuses further statements in a failed transaction.
+            winner = None
+        if winner is None:
+            raise
+        return winner, False
+
+
 def _transaction_or_using(
     using: str | None, session: "Session | None"
 ) -> tuple[str | None, str | None, str | None]:
@@ -221,10 +245,18 @@ class Model(BaseModel, metaclass=ModelMetaclass):
         return self
 
     async def save(
-        self, *, using: str | None = None, session: "Session | None" = None
+        self,
+        *,
+        using: str | None = None,
+        session: "Session | None" = None,
+        track: bool = True,
     ) -> None:
         """Persist the current model instance
 
+        Args:
+            track: Register the instance in the identity map. Pass ``False``
+                for write-only paths that never look the row up again.
+
         Returns:
             None
 
@@ -265,13 +297,14 @@ class Model(BaseModel, metaclass=ModelMetaclass):
                     break
 
         if pk_val is not None:
-            register_instance(
-                self.__class__.__name__,
-                str(pk_val),
-                self,
-                identity_using,
-                session_id=session_id,
-            )
+            if track:
+                register_instance(
+                    self.__class__.__name__,
+                    str(pk_val),
+                    self,
+                    identity_using,
+                    session_id=session_id,
+                )
             _set_instance_origin(self, identity_using)
 
     async def delete(
@@ -352,6 +385,9 @@ class Model(BaseModel, metaclass=ModelMetaclass):
         tx_id, using, session_id = _transaction_or_using(using, session)
         results = await fetch_all(cls, tx_id, using, session_id=session_id)
         for instance in results:
+            # Same as Query.all(): identity-mapped instances must not keep
+            # relations prefetched by an earlier query.
+            instance.__dict__.pop(_PREFETCH_CACHE_ATTR, None)
             cls._fix_types(instance)
         return results
 
@@ -439,6 +475,7 @@ class Model(BaseModel, metaclass=ModelMetaclass):
         if fresh_instance is None:
             raise RuntimeError(f"Instance not found in database: {name}({pk_val})")
 
+        self.__dict__.pop(_PREFETCH_CACHE_ATTR, None)
         self.__dict__.update(fresh_instance.__dict__)
         register_instance(
             name, str(pk_val), self, identity_using, session_id=session_id
@@ -590,7 +627,9 @@ class Model(BaseModel, metaclass=ModelMetaclass):
             return instance, False
 
         params = {**fields, **(defaults or {})}
-        return await cls.create(session=session, **params), True
+        return await _create_or_fetch_winner(
+            query, lambda: cls.create(session=session, **params)
+        )
 
     @classmethod
     async def update_or_create(
@@ -614,14 +653,18 @@ class Model(BaseModel, metaclass=ModelMetaclass):
             query = query.where(_field_eq(key, val))
 
         instance = await query.first()
-        if instance:
-            for key, val in (defaults or {}).items():
-                setattr(instance, key, val)
-            await instance.save(session=session)
-            return instance, False
+        if instance is None:
+            params = {**fields, **(defaults or {})}
+            instance, created = await _create_or_fetch_winner(
+                query, lambda: cls.create(session=session, **params)
+            )
+            if created:
+                return instance, True
 
-        params = {**fields, **(defaults or {})}
-        return await cls.create(session=session, **params), True
+        for key, val in (defaults or {}).items():
+            setattr(instance, key, val)
+        await instance.save(session=session)
+        return instance, False
 
 
 class ModelConnection[M: Model]:
@@ -689,7 +732,7 @@ class ModelConnection[M: Model]:
             return instance, False
 
         params = {**fields, **(defaults or {})}
-        return await self.create(**params), True
+        return await _create_or_fetch_winner(query, lambda: self.create(**params))
 
     async def update_or_create(
         self, defaults: dict[str, Any] | None = None, **fields: Any
@@ -699,11 +742,15 @@ class ModelConnection[M: Model]:
             query = query.where(_field_eq(key, val))
 
         instance = await query.first()
-        if instance:
-            for key, val in (defaults or {}).items():
-                setattr(instance, key, val)
-            await instance.save(using=self._connection_name)
-            return instance, False
+        if instance is None:
+            params = {**fields, **(defaults or {})}
+            instance, created = await _create_or_fetch_winner(
+                query, lambda: self.create(**params)
+            )
+            if created:
+                return instance, True
 
-        params = {**fields, **(defaults or {})}
-        return await self.create(**params), True
+        for key, val in (defaults or {}).items():
+            setattr(instance, key, val)
+        await instance.save(using=self._connection_name)
+        return instance, False
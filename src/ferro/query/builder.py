@@ -1,5 +1,6 @@
 """Build fluent query objects that serialize QueryIR payloads for the Rust core."""
 
+import json
 from typing import TYPE_CHECKING, Any, Generic, Type, TypeVar, overload
 
 from .._bind_payload import update_bind_payload
@@ -14,10 +15,15 @@ from .._core import (
     clear_m2m_links,
     count_filtered,
     delete_filtered,
+    exists_filtered,
     fetch_filtered,
+    fetch_filtered_values,
     remove_m2m_links,
     update_filtered,
+    update_filtered_returning,
 )
+from ..relations.descriptors import _PREFETCH_CACHE_ATTR
+from ..relations.prefetch import prefetch_descriptor, prefetch_related_objects
 from .nodes import QueryNode, QueryProxy, _serialize_query_value
 
 if TYPE_CHECKING:
@@ -27,16 +33,27 @@ T = TypeVar("T")
 E = TypeVar("E")
 
 
+def _encode_query_ir_value(value: Any) -> Any:
+    """``json.dumps`` fallback for values the encoder cannot write natively."""
+    serialized = _serialize_query_value(value)
+    if serialized is value:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+    return serialized
+
+
 def _query_ir_payload_to_json(query_payload: dict[str, Any]) -> str:
-    """Serialize a QueryIR payload into a versioned IR envelope JSON string."""
-    import json
+    """Serialize a QueryIR payload into a versioned IR envelope JSON string.
 
+    Leaf values are already normalized by ``QueryNode.to_ir_dict``, so the
+    encoder only calls back into Python for the rare non-JSON value (such as a
+    UUID many-to-many source id) instead of walking the whole payload a
+    second time.
+    """
     return json.dumps(
-        {
-            "ir_kind": "query",
-            "ir_version": 1,
-            "payload": _serialize_query_value(query_payload),
-        }
+        {"ir_kind": "query", "ir_version": 1, "payload": query_payload},
+        default=_encode_query_ir_value,
     )
 
 
@@ -73,8 +90,7 @@ def _resolve_where_node(node: Any) -> QueryNode:
             )
         return result
     raise TypeError(
-        "where() expected QueryNode or predicate callable, "
-        f"got {type(node).__name__}"
+        f"where() expected QueryNode or predicate callable, got {type(node).__name__}"
     )
 
 
@@ -108,6 +124,7 @@ class Query(Generic[T]):
         self._limit: int | None = None
         self._offset: int | None = None
         self._m2m_context: dict[str, Any] | None = None
+        self._prefetch_related: tuple[str, ...] = ()
 
     def _transaction_or_using(self) -> tuple[str | None, str | None, str | None]:
         from ..state import resolve_operation_scope
@@ -231,6 +248,34 @@ class Query(Generic[T]):
         self._offset = value
         return self
 
+    def prefetch_related(self, *relations: str) -> "Query[T]":
+        """Batch-load relationships for every returned instance
+
+        After the main query runs, each named relationship is loaded with a
+        single ``IN (...)`` query over all returned rows instead of one query
+        per instance. Awaiting ``instance.<relation>`` afterwards returns the
+        prefetched value without touching the database. Forward ``ForeignKey``
+        fields and reverse ``BackRef`` fields are supported.
+
+        Args:
+            *relations: Relationship field names on the queried model.
+
+        Returns:
+            The current Query instance for chaining.
+
+        Raises:
+            ValueError: If a name is not a relationship on the queried model.
+            NotImplementedError: For many-to-many relationships.
+
+        Examples:
+            >>> posts = await Post.select().prefetch_related("author").all()
+            >>> author = await posts[0].author  # no query
+        """
+        for name in relations:
+            prefetch_descriptor(self.model_cls, name)
+        self._prefetch_related = (*self._prefetch_related, *relations)
+        return self
+
     async def all(self) -> list[T]:
         """Return all model instances that match the current query
 
@@ -242,6 +287,10 @@ class Query(Generic[T]):
             >>> isinstance(users, list)
             True
         """
+        return await self._fetch_all()
+
+    async def _fetch_all(self, *, reset_prefetched: bool = True) -> list[T]:
+        """Run the query; ``prefetch_related`` loads pass ``reset_prefetched=False``."""
         query_def = {
             "model_name": self.model_cls.__name__,
             "where": [node.to_ir_dict() for node in self.where_clause],
@@ -259,8 +308,20 @@ class Query(Generic[T]):
             session_id=session_id,
         )
         for instance in results:
+            # Identity-mapped instances may carry relations prefetched by an
+            # earlier query; drop them so they reflect this load.
+            if reset_prefetched:
+                instance.__dict__.pop(_PREFETCH_CACHE_ATTR, None)
             if hasattr(self.model_cls, "_fix_types"):
                 self.model_cls._fix_types(instance)
+        if self._prefetch_related and results:
+            await prefetch_related_objects(
+                results,
+                self.model_cls,
+                self._prefetch_related,
+                using=self._using,
+                session=self._session,
+            )
         return results
 
     async def count(self) -> int:
@@ -305,23 +366,59 @@ class Query(Generic[T]):
             >>> isinstance(updated, int)
             True
         """
-        query_def = {
-            "model_name": self.model_cls.__name__,
-            "where": [node.to_ir_dict() for node in self.where_clause],
-            "order_by": [],
-            "limit": self._limit,
-            "offset": self._offset,
-            "m2m": None,
-        }
         tx_id, using, session_id = self._transaction_or_using()
         return await update_filtered(
             self.model_cls.__name__,
-            _query_ir_payload_to_json(query_def),
+            _query_ir_payload_to_json(self._update_query_def()),
+            update_bind_payload(fields),
+            tx_id,
+            using,
+            session_id=session_id,
+        )
+
+    async def update_returning(self, **fields) -> list[T]:
+        """Update all records matching the current query and return them
+
+        Emits ``UPDATE ... RETURNING``, so the updated rows come back from the
+        same statement. Instances already tracked by the identity map are
+        refreshed in place; no follow-up ``refresh()`` is needed.
+
+        Args:
+            **fields: Field names and values to update.
+
+        Returns:
+            The updated model instances.
+
+        Examples:
+            >>> users = await User.where(lambda user: user.id == 1).update_returning(
+            ...     name="Taylor"
+            ... )
+            >>> all(user.name == "Taylor" for user in users)
+            True
+        """
+        tx_id, using, session_id = self._transaction_or_using()
+        results = await update_filtered_returning(
+            self.model_cls,
+            _query_ir_payload_to_json(self._update_query_def()),
             update_bind_payload(fields),
             tx_id,
             using,
             session_id=session_id,
         )
+        for instance in results:
+            if hasattr(self.model_cls, "_fix_types"):
+                self.model_cls._fix_types(instance)
+        return results
+
+    def _update_query_def(self) -> dict[str, Any]:
+        return {
+            "model_name": self.model_cls.__name__,
+            "where": [node.to_ir_dict() for node in self.where_clause],
+            "order_by": [],
+            "limit": self._limit,
+            "offset": self._offset,
+            "m2m": None,
+        }
 
     async def first(self) -> T | None:
         """Return the first matching record, or None
@@ -381,7 +478,78 @@ class Query(Generic[T]):
             >>> isinstance(found, bool)
             True
         """
-        return await self.count() > 0
+        query_def = {
+            "model_name": self.model_cls.__name__,
+            "where": [node.to_ir_dict() for node in self.where_clause],
+            "order_by": [],
+            "limit": None,
+            "offset": None,
+            "m2m": self._m2m_context,
+        }
+        tx_id, using, session_id = self._transaction_or_using()
+        return await exists_filtered(
+            self.model_cls.__name__,
+            _query_ir_payload_to_json(query_def),
+            tx_id,
+            using,
+            session_id=session_id,
+        )
+
+    async def values(self, *fields: str) -> list[dict[str, Any]]:
+        """Return selected columns of each matching record as plain dicts
+
+        Only the named columns are selected, and rows are returned without
+        building model instances or touching the identity map.
+
+        Args:
+            *fields: Column names to select. Defaults to every column.
+
+        Returns:
+            One ``{field: value}`` dict per matching row, in query order.
+
+        Raises:
+            ValueError: If a name is not a column of the model.
+
+        Examples:
+            >>> rows = await User.where(lambda user: user.active == True).values("email")  # noqa: E712
+            >>> isinstance(rows, list)
+            True
+        """
+        model_fields = self.model_cls.model_fields
+        columns = list(fields or model_fields)
+        for column in columns:
+            if column not in model_fields:
+                raise ValueError(
+                    f"'{column}' is not a column on {self.model_cls.__name__}"
+                )
+        query_def = {
+            "model_name": self.model_cls.__name__,
+            "where": [node.to_ir_dict() for node in self.where_clause],
+            "order_by": self.order_by_clause,
+            "limit": self._limit,
+            "offset": self._offset,
+            "m2m": self._m2m_context,
+        }
+        tx_id, using, session_id = self._transaction_or_using()
+        rows = await fetch_filtered_values(
+            self.model_cls.__name__,
+            _query_ir_payload_to_json(query_def),
+            columns,
+            tx_id,
+            using,
+            session_id=session_id,
+        )
+        enum_fields = {
+            name: enum_cls
+            for name, enum_cls in getattr(self.model_cls, "_enum_fields", {}).items()
+            if name in columns
+        }
+        if enum_fields:
+            for row in rows:
+                for name, enum_cls in enum_fields.items():
+                    if row[name] is not None:
+                        row[name] = enum_cls(row[name])
+        return rows
 
     async def add(self, *instances: Any) -> None:
         """Add links to a many-to-many relationship
@@ -523,20 +691,33 @@ class Relation(Query[T]):
     @overload
     def where(self, node: "Predicate[T]") -> "Relation[T]": ...
 
+    #: Rows loaded by ``prefetch_related`` for this relation; any further
+    #: filtering, ordering, or slicing falls back to a database query.
+    _prefetched: list[Any] | None = None
+
     def where(self, node: "QueryNode | Predicate[T]") -> "Relation[T]":
         super().where(node)  # type: ignore[arg-type]
+        self._prefetched = None
         return self
 
     def order_by(self, field: Any, direction: str = "asc") -> "Relation[T]":
         super().order_by(field, direction)
+        self._prefetched = None
         return self
 
     def limit(self, value: int) -> "Relation[T]":
         super().limit(value)
+        self._prefetched = None
         return self
 
     def offset(self, value: int) -> "Relation[T]":
         super().offset(value)
+        self._prefetched = None
+        return self
+
+    def prefetch_related(self, *relations: str) -> "Relation[T]":
+        super().prefetch_related(*relations)
+        self._prefetched = None
         return self
 
     # NOTE ON TYPING:
@@ -563,6 +744,8 @@ class Relation(Query[T]):
         async def first(self: "Relation[E]") -> E | None: ...
 
     async def all(self):  # type: ignore[override]
+        if self._prefetched is not None:
+            return list(self._prefetched)
         return await super().all()
 
     async def first(self):  # type: ignore[override]
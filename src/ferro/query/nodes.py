@@ -28,6 +28,16 @@ class QueryNode:
         True
     """
 
+    __slots__ = (
+        "column",
+        "operator",
+        "value",
+        "left",
+        "right",
+        "is_compound",
+        "predicate_style",
+    )
+
     def __init__(
         self,
         column: str | None = None,
@@ -167,8 +177,15 @@ class QueryNode:
         )
 
 
+_JSON_NATIVE_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
 def _serialize_query_value(value: Any) -> Any:
     """Normalize Python values into JSON-friendly query payloads."""
+    # Exact-type check: builtin scalars dominate predicate values and need no
+    # conversion; subclasses (e.g. ``str`` enums) still take the slow path.
+    if type(value) in _JSON_NATIVE_SCALARS:
+        return value
     if hasattr(value, "isoformat"):
         return value.isoformat()
     if isinstance(value, (Decimal, uuid.UUID)):
@@ -214,6 +231,8 @@ class FieldProxy(Generic[TField]):
         True
     """
 
+    __slots__ = ("column", "predicate_style")
+
     def __init__(self, column: str, predicate_style: str = "operator"):
         """Initialize a field proxy for a specific column
 
@@ -293,6 +312,10 @@ class FieldProxy(Generic[TField]):
         accepting ``.like(...)`` on non-string columns; at runtime the method
         is available on any ``FieldProxy``.
 
+        The pattern is passed to the database as-is. A backslash escapes the
+        next ``%`` or ``_`` on every backend (``ESCAPE '\\'`` is added only
+        when the pattern contains one).
+
         Args:
             pattern: SQL LIKE pattern such as ``"%@example.com"``.
 
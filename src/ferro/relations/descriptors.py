@@ -9,6 +9,10 @@ if TYPE_CHECKING:
 
 from ..state import _MODEL_REGISTRY_PY
 
+#: Per-instance ``__dict__`` key holding relationships loaded by
+#: ``Query.prefetch_related``; keyed by each descriptor's ``_prefetch_key()``.
+_PREFETCH_CACHE_ATTR = "__ferro_prefetched"
+
 
 def _instance_origin_outside_transaction(instance: object) -> str | None:
     from ..models import _instance_origin
@@ -19,6 +23,18 @@ def _instance_origin_outside_transaction(instance: object) -> str | None:
     return _instance_origin(instance)
 
 
+def _prefetched_value(instance: object, key: str) -> tuple[bool, object]:
+    """Return ``(hit, value)`` for a relationship cached by ``prefetch_related``."""
+    cache = instance.__dict__.get(_PREFETCH_CACHE_ATTR)
+    if cache is None or key not in cache:
+        return False, None
+    return True, cache[key]
+
+
+async def _resolved(value: object) -> object:
+    return value
+
+
 class RelationshipDescriptor(BaseModel):
     """Descriptor that returns either a Query object or a single object (for 1:1)."""
 
@@ -31,16 +47,25 @@ class RelationshipDescriptor(BaseModel):
     target_col: str | None = None
     _target_model: Model | None = None
 
-    def __get__(self, instance, owner):
-        if instance is None:
-            return self
-
+    def _resolve_target_model(self) -> type[Model]:
         if self._target_model is None:
             self._target_model = _MODEL_REGISTRY_PY.get(self.target_model_name)
             if self._target_model is None:
                 raise RuntimeError(
                     f"Model '{self.target_model_name}' not found in registry"
                 )
+        return self._target_model
+
+    def _prefetch_key(self) -> str:
+        # The attribute name on the owning model is not known here; the
+        # (child model, FK field) pair identifies a reverse relation uniquely.
+        return f"{self.target_model_name}.{self.field_name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        self._resolve_target_model()
 
         # Find the primary key value of the current instance
         pk_field = "id"
@@ -70,17 +95,23 @@ class RelationshipDescriptor(BaseModel):
         pk_val = getattr(instance, pk_field)
 
         fk_field = f"{self.field_name}_id"
+        hit, prefetched = _prefetched_value(instance, self._prefetch_key())
         if self.is_one_to_one:
+            if hit:
+                return _resolved(prefetched)
             return self._target_model.where(
                 lambda t, f=fk_field, v=pk_val: getattr(t, f) == v
             ).first()
 
         from ..query.builder import Relation
 
-        return Relation(
+        relation = Relation(
             self._target_model,
             using=_instance_origin_outside_transaction(instance),
         ).where(lambda t, f=fk_field, v=pk_val: getattr(t, f) == v)
+        if hit:
+            relation._prefetched = list(prefetched)
+        return relation
 
 
 class ForwardDescriptor(BaseModel):
@@ -90,16 +121,31 @@ class ForwardDescriptor(BaseModel):
     field_name: str
     _target_model: Model | None = None
 
-    def __get__(self, instance, owner):
-        if instance is None:
-            return self
-
+    def _resolve_target_model(self) -> type[Model]:
         if self._target_model is None:
             self._target_model = _MODEL_REGISTRY_PY.get(self.target_model_name)
             if self._target_model is None:
                 raise RuntimeError(
                     f"Model '{self.target_model_name}' not found in registry"
                 )
+        return self._target_model
+
+    def _prefetch_key(self) -> str:
+        return self.field_name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        self._resolve_target_model()
+
+        # Prefetched entries are ``(fk_value, target)``; reassigning the FK
+        # after the prefetch falls back to a fresh lookup.
+        hit, prefetched = _prefetched_value(instance, self._prefetch_key())
+        if hit:
+            fk_value, target = prefetched
+            if fk_value == getattr(instance, f"{self.field_name}_id"):
+                return _resolved(target)
 
         async def _fetch():
             id_val = getattr(instance, f"{self.field_name}_id")
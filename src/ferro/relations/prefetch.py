@@ -0,0 +1,131 @@
+"""Batch relationship loading behind ``Query.prefetch_related``."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from .descriptors import _PREFETCH_CACHE_ATTR, ForwardDescriptor, RelationshipDescriptor
+
+if TYPE_CHECKING:
+    from ferro.models import Model
+
+#: Most values one prefetch ``IN (...)`` list may bind. SQLite allows 32766
+#: bind parameters per statement (Postgres 65535, see ``operations.rs``); the
+#: lower limit keeps one chunk valid on both backends.
+_PREFETCH_CHUNK_SIZE = 32766
+
+
+def _store_prefetched(instance: object, key: str, value: object) -> None:
+    cache = instance.__dict__.get(_PREFETCH_CACHE_ATTR)
+    if cache is None:
+        cache = {}
+        object.__setattr__(instance, _PREFETCH_CACHE_ATTR, cache)
+    cache[key] = value
+
+
+def prefetch_descriptor(
+    model_cls: type[Model], name: str
+) -> ForwardDescriptor | RelationshipDescriptor:
+    """Return the descriptor ``prefetch_related`` loads ``name`` through.
+
+    Raises:
+        ValueError: If ``name`` is not a relationship on ``model_cls``.
+        NotImplementedError: For many-to-many relationships.
+    """
+    descriptor = getattr(model_cls, name, None)
+    if isinstance(descriptor, ForwardDescriptor):
+        return descriptor
+    if isinstance(descriptor, RelationshipDescriptor):
+        if descriptor.is_m2m:
+            raise NotImplementedError(
+                f"prefetch_related() does not support many-to-many "
+                f"relationship '{name}'"
+            )
+        return descriptor
+    raise ValueError(f"'{name}' is not a relationship on {model_cls.__name__}")
+
+
+async def _fetch_in_chunks(
+    target: type[Model],
+    field: str,
+    values: Sequence[Any],
+    *,
+    using: str | None,
+    session: Any | None,
+) -> list[Any]:
+    """Load ``target`` rows whose ``field`` is in ``values``, one query per chunk."""
+    from ..query.builder import Query
+
+    rows: list[Any] = []
+    for start in range(0, len(values), _PREFETCH_CHUNK_SIZE):
+        chunk = list(values[start : start + _PREFETCH_CHUNK_SIZE])
+        rows.extend(
+            await Query(target, using=using, session=session)
+            .where(lambda t, f=field, v=chunk: getattr(t, f).in_(v))
+            ._fetch_all(reset_prefetched=False)
+        )
+    return rows
+
+
+async def prefetch_related_objects(
+    instances: Sequence[Any],
+    model_cls: type[Model],
+    relations: Sequence[str],
+    *,
+    using: str | None = None,
+    session: Any | None = None,
+) -> None:
+    """Load ``relations`` for every instance with one ``IN (...)`` query each.
+
+    Forward ``ForeignKey`` fields collect the distinct ``{field}_id`` values and
+    fetch the targets by primary key; reverse ``BackRef`` fields collect the
+    parents' primary keys and fetch children by their shadow FK column. Results
+    are cached on each instance, so awaiting the relationship afterwards does
+    no I/O. Key sets past the bind-parameter limit are split into several
+    ``IN`` queries whose results are merged.
+
+    Raises:
+        ValueError: If a name is not a relationship on ``model_cls``.
+        NotImplementedError: For many-to-many relationships.
+    """
+    for name in relations:
+        descriptor = prefetch_descriptor(model_cls, name)
+
+        if isinstance(descriptor, ForwardDescriptor):
+            target = descriptor._resolve_target_model()
+            fk_attr = f"{name}_id"
+            fk_values = {getattr(instance, fk_attr) for instance in instances}
+            fk_values.discard(None)
+            by_pk: dict[Any, Any] = {}
+            if fk_values:
+                pk_field = target._primary_key_field_name()
+                rows = await _fetch_in_chunks(
+                    target, pk_field, list(fk_values), using=using, session=session
+                )
+                by_pk = {getattr(row, pk_field): row for row in rows}
+            for instance in instances:
+                fk_value = getattr(instance, fk_attr)
+                _store_prefetched(
+                    instance,
+                    descriptor._prefetch_key(),
+                    (fk_value, by_pk.get(fk_value)),
+                )
+
+        else:
+            target = descriptor._resolve_target_model()
+            fk_attr = f"{descriptor.field_name}_id"
+            pk_field = model_cls._primary_key_field_name()
+            pk_values = list({getattr(instance, pk_field) for instance in instances})
+            children: dict[Any, list[Any]] = {}
+            if pk_values:
+                rows = await _fetch_in_chunks(
+                    target, fk_attr, pk_values, using=using, session=session
+                )
+                for row in rows:
+                    children.setdefault(getattr(row, fk_attr), []).append(row)
+            for instance in instances:
+                related = children.get(getattr(instance, pk_field), [])
+                if descriptor.is_one_to_one:
+                    related = related[0] if related else None
+                _store_prefetched(instance, descriptor._prefetch_key(), related)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import types
+import weakref
 from decimal import Decimal
 from enum import Enum
 from typing import (
@@ -23,6 +25,24 @@ from .composite_indexes import (
 )
 from .composite_uniques import apply_composite_uniques_to_schema
 
+# model_json_schema() output keyed by model class, tagged with the core schema it
+# was generated from. resolve_relationships() re-registers every model on each
+# connect; only classes that were model_rebuild()-ed need Pydantic to run again.
+_PYDANTIC_JSON_SCHEMAS: weakref.WeakKeyDictionary[type[Any], tuple[Any, dict]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pydantic_json_schema(model_cls: type[Any]) -> dict[str, Any]:
+    """Return a private copy of ``model_cls.model_json_schema()``."""
+    core_schema = getattr(model_cls, "__pydantic_core_schema__", None)
+    cached = _PYDANTIC_JSON_SCHEMAS.get(model_cls)
+    if cached is None or cached[0] is not core_schema:
+        cached = (core_schema, model_cls.model_json_schema())
+        _PYDANTIC_JSON_SCHEMAS[model_cls] = cached
+    # Callers enrich nested property dicts in place.
+    return copy.deepcopy(cached[1])
+
 
 def _property_is_integer(prop: dict[str, Any]) -> bool:
     return prop.get("type") == "integer" or any(
@@ -80,7 +100,7 @@ def build_model_schema(
 ) -> dict[str, Any]:
     """Return the canonical Ferro-enriched schema for one model class."""
     if schema is None:
-        schema = model_cls.model_json_schema()
+        schema = _pydantic_json_schema(model_cls)
     else:
         schema = dict(schema)
 
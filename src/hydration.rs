@@ -7,79 +7,106 @@
 
 use crate::state::RustValue;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PySet, PyString};
 use std::collections::HashMap;
 
-/// Initialize Pydantic v2 hydration slots on a freshly allocated instance.
+/// Class-level state shared by every instance hydrated from one result set.
 ///
-/// Mirrors `BaseModel.__init__` slot assignment so attribute access on hydrated instances
-/// matches conventionally constructed models.
-fn set_pydantic_hydration_slots<'py>(
-    py: Python<'py>,
-    cls: &Bound<'py, PyAny>,
-    instance: &Bound<'py, PyAny>,
-) -> PyResult<()> {
-    let model_config = cls.getattr(pyo3::intern!(py, "model_config"))?;
-    let extra_policy = model_config.call_method1(
-        pyo3::intern!(py, "get"),
-        (pyo3::intern!(py, "extra"), pyo3::intern!(py, "ignore")),
-    )?;
-    let extra_slot = if extra_policy.eq(pyo3::intern!(py, "allow"))? {
-        pyo3::types::PyDict::new(py).into_any().unbind()
-    } else {
-        py.None()
-    };
-    instance.setattr(pyo3::intern!(py, "__pydantic_extra__"), extra_slot)?;
-    instance.setattr(pyo3::intern!(py, "__pydantic_private__"), py.None())?;
-    Ok(())
+/// `cls.__new__`, the model's `extra` policy, the connection name, and the column-name
+/// strings are resolved once per batch, so the per-row loop is only allocation plus
+/// `__dict__` and slot writes. Column names are interned, so `__dict__` keys are the
+/// same objects as the field-name identifiers used for attribute access and
+/// `model_fields`, and later lookups hit CPython's pointer-equality fast path.
+pub struct HydrationBatch<'py> {
+    cls: Bound<'py, PyAny>,
+    new: Bound<'py, PyAny>,
+    connection_name: Bound<'py, PyString>,
+    extra_allow: bool,
+    py_col_names: HashMap<String, Py<PyString>>,
 }
 
-/// Hydrate a model instance from pre-decoded column values.
-///
-/// Allocates via `cls.__new__(cls)`, writes fields into `__dict__`, sets
-/// `__ferro_connection_name`, and initializes Pydantic tracking slots.
-///
-/// # Arguments
-/// * `py` — Active Python interpreter token.
-/// * `cls` — Model class object (e.g. `User`).
-/// * `connection_name` — Registered connection name stored on the instance for routing.
-/// * `fields` — `(column_name, decoded_value)` pairs in query result order.
-/// * `py_col_names` — Interned `PyString` handles for column names (avoids per-row allocation).
-///
-/// # Returns
-/// A bound model instance with `__pydantic_fields_set__` populated for assigned columns.
-///
-/// # Errors
-/// Returns `PyErr` if `__new__`, dict/slot assignment, or `RustValue` → Python conversion fails.
-pub fn hydrate_model_instance<'py>(
-    py: Python<'py>,
-    cls: &Bound<'py, PyAny>,
-    connection_name: &str,
-    fields: Vec<(String, RustValue)>,
-    py_col_names: &HashMap<String, pyo3::Py<pyo3::types::PyString>>,
-) -> PyResult<Bound<'py, PyAny>> {
-    let instance = cls.call_method1(pyo3::intern!(py, "__new__"), (cls,))?;
-    let dict_attr = instance.getattr(pyo3::intern!(py, "__dict__"))?;
-    let dict = dict_attr.cast::<pyo3::types::PyDict>()?;
-    dict.set_item(
-        pyo3::intern!(py, "__ferro_connection_name"),
-        connection_name,
-    )?;
-    let fields_set = pyo3::types::PySet::empty(py)?;
+impl<'py> HydrationBatch<'py> {
+    /// Prepare hydration for rows of `cls` loaded through `connection_name`.
+    ///
+    /// # Arguments
+    /// * `cls` — Model class object (e.g. `User`).
+    /// * `connection_name` — Registered connection name stored on each instance for routing.
+    /// * `columns` — Any row of the result set; its column names are interned once and
+    ///   reused for every row. Pass an empty slice to intern names per row instead.
+    ///
+    /// # Errors
+    /// Returns `PyErr` if `__new__` or `model_config` cannot be read from `cls`.
+    pub fn new(
+        cls: &Bound<'py, PyAny>,
+        connection_name: &str,
+        columns: &[(String, RustValue)],
+    ) -> PyResult<Self> {
+        let py = cls.py();
+        let model_config = cls.getattr(pyo3::intern!(py, "model_config"))?;
+        let extra_policy = model_config.call_method1(
+            pyo3::intern!(py, "get"),
+            (pyo3::intern!(py, "extra"), pyo3::intern!(py, "ignore")),
+        )?;
+        let py_col_names = columns
+            .iter()
+            .map(|(col_name, _)| (col_name.clone(), PyString::intern(py, col_name).unbind()))
+            .collect();
 
-    for (col_name, val) in fields {
-        let py_val = val.into_py_any(py)?;
-        if let Some(py_name) = py_col_names.get(&col_name) {
-            let py_name = py_name.bind(py);
-            dict.set_item(py_name, py_val)?;
-            fields_set.add(py_name)?;
-        } else {
-            let py_name = pyo3::types::PyString::new(py, &col_name);
-            dict.set_item(&py_name, py_val)?;
-            fields_set.add(&py_name)?;
-        }
+        Ok(Self {
+            cls: cls.clone(),
+            new: cls.getattr(pyo3::intern!(py, "__new__"))?,
+            connection_name: PyString::new(py, connection_name),
+            extra_allow: extra_policy.eq(pyo3::intern!(py, "allow"))?,
+            py_col_names,
+        })
     }
 
-    let _ = instance.setattr(pyo3::intern!(py, "__pydantic_fields_set__"), fields_set);
-    set_pydantic_hydration_slots(py, cls, &instance)?;
-    Ok(instance)
+    /// Hydrate a model instance from pre-decoded column values.
+    ///
+    /// Allocates via `cls.__new__(cls)`, writes fields into `__dict__`, sets
+    /// `__ferro_connection_name`, and initializes Pydantic tracking slots the way
+    /// `BaseModel.__init__` would.
+    ///
+    /// # Arguments
+    /// * `fields` — `(column_name, decoded_value)` pairs in query result order.
+    ///
+    /// # Returns
+    /// A bound model instance with `__pydantic_fields_set__` populated for assigned columns.
+    ///
+    /// # Errors
+    /// Returns `PyErr` if `__new__`, dict/slot assignment, or `RustValue` → Python conversion fails.
+    pub fn hydrate(&self, fields: Vec<(String, RustValue)>) -> PyResult<Bound<'py, PyAny>> {
+        let py = self.cls.py();
+        let instance = self.new.call1((&self.cls,))?;
+        let dict_attr = instance.getattr(pyo3::intern!(py, "__dict__"))?;
+        let dict = dict_attr.cast::<PyDict>()?;
+        dict.set_item(
+            pyo3::intern!(py, "__ferro_connection_name"),
+            &self.connection_name,
+        )?;
+        let fields_set = PySet::empty(py)?;
+
+        for (col_name, val) in fields {
+            let py_val = val.into_py_any(py)?;
+            if let Some(py_name) = self.py_col_names.get(&col_name) {
+                let py_name = py_name.bind(py);
+                dict.set_item(py_name, py_val)?;
+                fields_set.add(py_name)?;
+            } else {
+                let py_name = PyString::intern(py, &col_name);
+                dict.set_item(&py_name, py_val)?;
+                fields_set.add(&py_name)?;
+            }
+        }
+
+        let _ = instance.setattr(pyo3::intern!(py, "__pydantic_fields_set__"), fields_set);
+        let extra_slot = if self.extra_allow {
+            PyDict::new(py).into_any().unbind()
+        } else {
+            py.None()
+        };
+        instance.setattr(pyo3::intern!(py, "__pydantic_extra__"), extra_slot)?;
+        instance.setattr(pyo3::intern!(py, "__pydantic_private__"), py.None())?;
+        Ok(instance)
+    }
 }
@@ -8,6 +8,7 @@
 use crate::backend::{EngineBindValue, EngineHandle, EngineRow, EngineValue};
 use crate::state::Dialect;
 use pyo3::prelude::*;
+use std::collections::HashSet;
 
 fn serde_default_true() -> bool {
     true
@@ -110,6 +111,24 @@ fn introspection_error(context: &str, table: &str, err: sqlx::Error) -> PyErr {
     ))
 }
 
+/// Names of every table that already exists in the live schema, read in a single
+/// catalog query (`sqlite_master` / `information_schema.tables`) so auto-migrate can
+/// skip per-table work for tables it is about to create or has just created.
+pub async fn live_table_names(engine: &EngineHandle) -> PyResult<HashSet<String>> {
+    let sql = match engine.backend() {
+        Dialect::Sqlite => "SELECT name FROM sqlite_master WHERE type = 'table'",
+        Dialect::Postgres => {
+            "SELECT table_name::text AS name FROM information_schema.tables \
+             WHERE table_schema = current_schema()"
+        }
+    };
+    let rows = engine
+        .fetch_all_sql_unprepared(sql)
+        .await
+        .map_err(|e| introspection_error("table list", "*", e))?;
+    Ok(rows.iter().filter_map(|row| row_string(row, "name")).collect())
+}
+
 /// Read the live columns of `table`. Returns `None` when the table does not
 /// exist (a table cannot have zero columns on either backend).
 pub async fn live_table_columns(
@@ -391,6 +410,23 @@ mod tests {
         );
     }
 
+    #[tokio::test]
+    async fn live_table_names_lists_sqlite_tables_only() {
+        let engine = memory_engine().await;
+        engine
+            .execute_sql("CREATE TABLE author (id INTEGER PRIMARY KEY, name TEXT)")
+            .await
+            .unwrap();
+        engine
+            .execute_sql("CREATE INDEX idx_author_name ON author (name)")
+            .await
+            .unwrap();
+
+        let names = live_table_names(&engine).await.unwrap();
+        assert!(names.contains("author"));
+        assert!(!names.contains("idx_author_name"));
+    }
+
     #[tokio::test]
     async fn sqlite_indexes_covering_column_distinguishes_origin() {
         let engine = memory_engine().await;
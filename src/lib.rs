@@ -96,14 +96,18 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(operations::fetch_all, m)?)?;
     m.add_function(wrap_pyfunction!(operations::fetch_filtered, m)?)?;
     m.add_function(wrap_pyfunction!(operations::count_filtered, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::exists_filtered, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::fetch_filtered_values, m)?)?;
     m.add_function(wrap_pyfunction!(operations::fetch_one, m)?)?;
     m.add_function(wrap_pyfunction!(operations::register_instance, m)?)?;
     m.add_function(wrap_pyfunction!(operations::evict_instance, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::flush_identity_map, m)?)?;
     m.add_function(wrap_pyfunction!(operations::save_record, m)?)?;
     m.add_function(wrap_pyfunction!(operations::save_bulk_records, m)?)?;
     m.add_function(wrap_pyfunction!(operations::delete_record, m)?)?;
     m.add_function(wrap_pyfunction!(operations::delete_filtered, m)?)?;
     m.add_function(wrap_pyfunction!(operations::update_filtered, m)?)?;
+    m.add_function(wrap_pyfunction!(operations::update_filtered_returning, m)?)?;
     m.add_function(wrap_pyfunction!(operations::add_m2m_links, m)?)?;
     m.add_function(wrap_pyfunction!(operations::remove_m2m_links, m)?)?;
     m.add_function(wrap_pyfunction!(operations::clear_m2m_links, m)?)?;
@@ -138,6 +142,7 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
         schema::_render_create_table_sql_for_test,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(schema::_table_creation_order_for_test, m)?)?;
     m.add_function(wrap_pyfunction!(
         migrate::_shadow_compare_migration_plan_for_test,
         m
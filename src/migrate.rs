@@ -868,7 +868,7 @@ async fn execute_drop_column(
 /// Returns a `PyErr` if introspection, DDL execution, or the pool refresh
 /// fails, or if the diff contains a change that cannot be applied safely.
 pub async fn internal_migrate(engine: Arc<EngineHandle>, opts: MigrateOptions) -> PyResult<()> {
-    internal_create_tables(engine.clone()).await?;
+    let created_tables = internal_create_tables(engine.clone()).await?;
     if !opts.updates {
         return Ok(());
     }
@@ -894,6 +894,10 @@ pub async fn internal_migrate(engine: Arc<EngineHandle>, opts: MigrateOptions) -
 
     for (name, schema) in order_schemas_for_creation(schemas) {
         let table_lower = name.to_lowercase();
+        if created_tables.contains(&table_lower) {
+            // Just created from the declared schema: the diff is empty by construction.
+            continue;
+        }
         let Some(live) = live_table_columns(&engine, &table_lower).await? else {
             // Freshly created (or otherwise absent) tables have nothing to diff.
             continue;
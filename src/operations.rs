@@ -583,42 +583,71 @@ async fn postgres_uuid_column_names(
     )
 }
 
-/// For each column whose SQL type is a date or timestamp family, the ``CAST ( … AS … )`` target
-/// (``date``, ``timestamp``, ``timestamptz``) so parameters are not sent as untyped text.
-async fn postgres_temporal_cast_by_column(
+/// Postgres column types that need typed binds on write paths.
+#[derive(Default)]
+struct PostgresBindTypes {
+    /// Native enum columns mapped to their `typname`.
+    enum_udt: HashMap<String, String>,
+    /// Columns whose SQL type (or domain base type) is `uuid`.
+    uuid_columns: HashSet<String>,
+    /// Date/timestamp columns mapped to their ``CAST ( … AS … )`` target
+    /// (``date``, ``timestamp``, ``timestamptz``) so parameters are not sent as
+    /// untyped text.
+    ts_cast: HashMap<String, String>,
+}
+
+/// Read every typed-bind column of `table_name` in one catalog round-trip.
+///
+/// INSERT/UPDATE paths need enum, uuid and temporal column sets together;
+/// fetching them separately cost three extra queries per write on Postgres.
+async fn postgres_bind_types(
     table_name: &str,
     engine: &EngineHandle,
     tx_conn: &Option<TransactionConnection>,
     backend: Dialect,
-) -> PyResult<HashMap<String, String>> {
+) -> PyResult<PostgresBindTypes> {
     if backend != Dialect::Postgres {
-        return Ok(HashMap::new());
+        return Ok(PostgresBindTypes::default());
     }
 
     let sql = r#"
-        SELECT column_name::text,
-               CASE data_type::text
-                   WHEN 'timestamp without time zone' THEN 'timestamp'
-                   WHEN 'timestamp with time zone' THEN 'timestamptz'
-                   WHEN 'date' THEN 'date'
-                   ELSE NULL
-               END AS cast_type
-        FROM information_schema.columns
-        WHERE table_schema = current_schema()
-          AND table_name = $1
-          AND data_type::text IN (
-              'timestamp without time zone',
-              'timestamp with time zone',
-              'date'
-          )
+        SELECT a.attname::text AS column_name,
+               t.typname::text AS udt_name,
+               t.typtype::text AS type_kind,
+               b.typname::text AS base_name
+        FROM pg_attribute a
+        JOIN pg_class c ON a.attrelid = c.oid
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        JOIN pg_type t ON a.atttypid = t.oid
+        JOIN pg_type b ON b.oid = CASE WHEN t.typtype = 'd' THEN t.typbasetype ELSE t.oid END
+        WHERE n.nspname = current_schema()
+          AND c.relname = $1
+          AND a.attnum > 0
+          AND NOT a.attisdropped
+          AND (t.typtype = 'e' OR b.typname IN ('uuid', 'date', 'timestamp', 'timestamptz'))
         "#;
 
-    let mut out = HashMap::new();
-    for row in postgres_catalog_rows(engine, tx_conn, sql, table_name, "temporal columns").await? {
+    let mut out = PostgresBindTypes::default();
+    for row in postgres_catalog_rows(engine, tx_conn, sql, table_name, "typed columns").await? {
         let column_name = engine_row_string(&row, "column_name").unwrap_or_default();
-        let cast_type = engine_row_string(&row, "cast_type").unwrap_or_default();
-        if !column_name.is_empty() && !cast_type.is_empty() {
-            out.insert(column_name, cast_type);
+        if column_name.is_empty() {
+            continue;
+        }
+        if engine_row_string(&row, "type_kind").as_deref() == Some("e") {
+            let udt_name = engine_row_string(&row, "udt_name").unwrap_or_default();
+            if !udt_name.is_empty() {
+                out.enum_udt.insert(column_name, udt_name);
+            }
+            continue;
+        }
+        match engine_row_string(&row, "base_name").as_deref() {
+            Some("uuid") => {
+                out.uuid_columns.insert(column_name);
+            }
+            Some(cast @ ("date" | "timestamp" | "timestamptz")) => {
+                out.ts_cast.insert(column_name, cast.to_string());
+            }
+            _ => {}
         }
     }
     Ok(out)
@@ -1002,17 +1031,14 @@ pub fn fetch_all<'py>(
 
         Python::attach(|py| {
             let results = pyo3::types::PyList::empty(py);
-            let cls = cls_py.bind(py);
-
-            let mut py_col_names = HashMap::new();
-            if let Some(first_row) = parsed_data.first() {
-                for (col_name, _) in &first_row.1 {
-                    py_col_names.insert(
-                        col_name.clone(),
-                        pyo3::types::PyString::new(py, col_name).unbind(),
-                    );
-                }
-            }
+            let batch = crate::hydration::HydrationBatch::new(
+                cls_py.bind(py),
+                &connection_name,
+                parsed_data
+                    .first()
+                    .map(|(_, fields)| fields.as_slice())
+                    .unwrap_or_default(),
+            )?;
 
             for (row_pk_val, fields) in parsed_data {
                 if use_identity_map
@@ -1026,13 +1052,7 @@ pub fn fetch_all<'py>(
                     continue;
                 }
 
-                let instance = crate::hydration::hydrate_model_instance(
-                    py,
-                    cls,
-                    &connection_name,
-                    fields,
-                    &py_col_names,
-                )?;
+                let instance = batch.hydrate(fields)?;
 
                 if use_identity_map && let Some(pk_val) = row_pk_val {
                     identity_map_insert(
@@ -1181,15 +1201,12 @@ pub fn fetch_one<'py>(
 
         match parsed_row {
             Some(fields) => Python::attach(|py| {
-                let cls = cls_py.bind(py);
-                let py_col_names = HashMap::new();
-                let instance = crate::hydration::hydrate_model_instance(
-                    py,
-                    cls,
+                let batch = crate::hydration::HydrationBatch::new(
+                    cls_py.bind(py),
                     &connection_name,
-                    fields,
-                    &py_col_names,
+                    &fields,
                 )?;
+                let instance = batch.hydrate(fields)?;
                 if use_identity_map {
                     identity_map_insert(
                         session_id.as_deref(),
@@ -1261,11 +1278,11 @@ pub fn save_record<'py>(
         }
 
         let table_name = name.to_lowercase();
-        let enum_udt = postgres_enum_udt_by_column(&table_name, &engine, &tx_conn, backend).await?;
-        let uuid_columns =
-            postgres_uuid_column_names(&table_name, &engine, &tx_conn, backend).await?;
-        let ts_cast =
-            postgres_temporal_cast_by_column(&table_name, &engine, &tx_conn, backend).await?;
+        let PostgresBindTypes {
+            enum_udt,
+            uuid_columns,
+            ts_cast,
+        } = postgres_bind_types(&table_name, &engine, &tx_conn, backend).await?;
         let (sql, bind_values, needs_postgres_returning) = {
             let mut columns = Vec::new();
             let mut values = Vec::new();
@@ -1450,29 +1467,32 @@ pub fn save_bulk_records<'py>(
         }
 
         let table_name = name.to_lowercase();
-        let enum_udt = postgres_enum_udt_by_column(&table_name, &engine, &tx_conn, backend).await?;
-        let uuid_columns =
-            postgres_uuid_column_names(&table_name, &engine, &tx_conn, backend).await?;
-        let ts_cast =
-            postgres_temporal_cast_by_column(&table_name, &engine, &tx_conn, backend).await?;
-        let (sql, bind_values) = {
+        let PostgresBindTypes {
+            enum_udt,
+            uuid_columns,
+            ts_cast,
+        } = postgres_bind_types(&table_name, &engine, &tx_conn, backend).await?;
+        // Columns come from the first row's order (skip a null auto-pk).
+        let mut column_names: Vec<String> = Vec::new();
+        for (key, input) in &record_inputs[0] {
+            let is_pk = pk_col.as_deref() == Some(key.as_str());
+            if is_pk && pk_is_auto && input.is_json_null() {
+                continue;
+            }
+            column_names.push(key.clone());
+        }
+
+        // One multi-row INSERT per chunk, sized so no statement exceeds the
+        // backend's bind-parameter limit.
+        let null_input = BindInput::Json(serde_json::Value::Null);
+        let mut statements = Vec::new();
+        for chunk in record_inputs.chunks(bulk_insert_chunk_rows(column_names.len(), backend)) {
             let mut insert_stmt = InsertStatement::new()
                 .into_table(Alias::new(&table_name))
                 .to_owned();
-
-            // Columns come from the first row's order (skip a null auto-pk).
-            let mut column_names: Vec<String> = Vec::new();
-            for (key, input) in &record_inputs[0] {
-                let is_pk = pk_col.as_deref() == Some(key.as_str());
-                if is_pk && pk_is_auto && input.is_json_null() {
-                    continue;
-                }
-                column_names.push(key.clone());
-            }
             insert_stmt.columns(column_names.iter().map(|c| Alias::new(c)));
 
-            let null_input = BindInput::Json(serde_json::Value::Null);
-            for row in &record_inputs {
+            for row in chunk {
                 let lookup: std::collections::HashMap<&str, &BindInput> =
                     row.iter().map(|(k, v)| (k.as_str(), v)).collect();
                 let mut row_values = Vec::with_capacity(column_names.len());
@@ -1491,24 +1511,57 @@ pub fn save_bulk_records<'py>(
                 })?;
             }
 
-            let (s, values) = sea_query_build_for_backend!(insert_stmt, backend);
-            (s, values)
+            let (sql, values) = sea_query_build_for_backend!(insert_stmt, backend);
+            statements.push((sql, engine_bind_values_from_sea(&values.0)));
+        }
+
+        let bulk_error = |e: sqlx::Error| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!(
+                "Bulk save failed for '{}': {}",
+                name, e
+            ))
         };
 
-        let rows_affected =
-            execute_statement_with_optional_tx(&engine, tx_conn, &sql, &bind_values.0)
+        let mut rows_affected = 0;
+        if let Some(conn_arc) = tx_conn {
+            let mut conn = conn_arc.lock().await;
+            for (sql, binds) in &statements {
+                rows_affected += conn
+                    .execute_sql_with_binds(sql, binds)
+                    .await
+                    .map_err(bulk_error)?;
+            }
+        } else if statements.len() == 1 {
+            let (sql, binds) = &statements[0];
+            rows_affected = engine
+                .execute_sql_with_binds(sql, binds)
                 .await
-                .map_err(|e| {
-                    pyo3::exceptions::PyRuntimeError::new_err(format!(
-                        "Bulk save failed for '{}': {}",
-                        name, e
-                    ))
-                })?;
+                .map_err(bulk_error)?;
+        } else {
+            // Several chunks outside a transaction: keep the batch atomic.
+            rows_affected = engine
+                .execute_batch_atomic(&statements)
+                .await
+                .map_err(bulk_error)?;
+        }
 
         Ok(rows_affected)
     })
 }
 
+/// Bind parameters a single statement may carry on each backend.
+const SQLITE_MAX_BIND_PARAMS: usize = 32766;
+const POSTGRES_MAX_BIND_PARAMS: usize = 65535;
+
+/// Rows per multi-row `INSERT` so one chunk stays under the bind limit.
+fn bulk_insert_chunk_rows(column_count: usize, backend: Dialect) -> usize {
+    let limit = match backend {
+        Dialect::Sqlite => SQLITE_MAX_BIND_PARAMS,
+        Dialect::Postgres => POSTGRES_MAX_BIND_PARAMS,
+    };
+    (limit / column_count.max(1)).max(1)
+}
+
 /// Fetches records for a given model class based on a QueryIR-defined query.
 ///
 /// Args:
@@ -1650,17 +1703,14 @@ pub fn fetch_filtered<'py>(
 
         Python::attach(|py| {
             let results = pyo3::types::PyList::empty(py);
-            let cls = cls_py.bind(py);
-
-            let mut py_col_names = HashMap::new();
-            if let Some(first_row) = parsed_data.first() {
-                for (col_name, _) in &first_row.1 {
-                    py_col_names.insert(
-                        col_name.clone(),
-                        pyo3::types::PyString::new(py, col_name).unbind(),
-                    );
-                }
-            }
+            let batch = crate::hydration::HydrationBatch::new(
+                cls_py.bind(py),
+                &connection_name,
+                parsed_data
+                    .first()
+                    .map(|(_, fields)| fields.as_slice())
+                    .unwrap_or_default(),
+            )?;
 
             for (row_pk_val, fields) in parsed_data {
                 if use_identity_map
@@ -1674,13 +1724,7 @@ pub fn fetch_filtered<'py>(
                     continue;
                 }
 
-                let instance = crate::hydration::hydrate_model_instance(
-                    py,
-                    cls,
-                    &connection_name,
-                    fields,
-                    &py_col_names,
-                )?;
+                let instance = batch.hydrate(fields)?;
 
                 if use_identity_map && let Some(pk_val) = row_pk_val {
                     identity_map_insert(
@@ -1697,6 +1741,67 @@ pub fn fetch_filtered<'py>(
     })
 }
 
+/// Build the `FROM`/`JOIN`/`WHERE` part of a filtered query without a projection.
+///
+/// Shared by [`count_filtered`] and [`exists_filtered`], which only differ in the
+/// selected expression and `LIMIT`.
+fn filtered_select_without_projection(
+    name: &str,
+    table_name: &str,
+    query_def: &QueryDef,
+    backend: Dialect,
+) -> PyResult<sea_query::SelectStatement> {
+    let mut select = Query::select();
+    if let Some(m2m) = &query_def.m2m {
+        let join_table = Alias::new(&m2m.join_table);
+        let source_col = Alias::new(&m2m.source_col);
+        let target_col = Alias::new(&m2m.target_col);
+
+        // We need the PK name of the target table to join
+        let registry = MODEL_REGISTRY.read().map_err(|_| {
+            pyo3::exceptions::PyRuntimeError::new_err("Failed to lock registry")
+        })?;
+        let schema = registry.get(name).ok_or_else(|| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!("Model '{}' not found", name))
+        })?;
+        let mut pk = None;
+        if let Some(properties) = schema.get("properties").and_then(|p| p.as_object()) {
+            for (col_name, col_info) in properties {
+                if col_info
+                    .get("primary_key")
+                    .and_then(|pk| pk.as_bool())
+                    .unwrap_or(false)
+                {
+                    pk = Some(col_name.clone());
+                    break;
+                }
+            }
+        }
+        let pk_name =
+            pk.ok_or_else(|| pyo3::exceptions::PyRuntimeError::new_err("No primary key"))?;
+
+        select.from(Alias::new(table_name));
+        select.inner_join(
+            join_table.clone(),
+            Expr::col((Alias::new(table_name), Alias::new(pk_name)))
+                .equals((join_table.clone(), target_col.clone())),
+        );
+        select.and_where(Expr::col((join_table.clone(), source_col.clone())).eq(
+            query_def.value_rhs_simple_expr_for_backend(
+                &m2m.source_col,
+                &m2m.source_id,
+                true,
+                backend,
+            ),
+        ));
+    } else {
+        select.from(Alias::new(table_name));
+    }
+
+    select.cond_where(query_condition_for_backend(query_def, backend)?);
+    Ok(select)
+}
+
 /// Return the number of rows matching a filtered query.
 ///
 /// Args:
@@ -1731,56 +1836,9 @@ pub fn count_filtered(
             postgres_enum_udt_by_column(&table_name, &engine, &tx_conn, backend).await?;
         // ... sql ...
         let (sql, bind_values) = {
-            let mut select = Query::select();
+            let mut select =
+                filtered_select_without_projection(&name, &table_name, &query_def, backend)?;
             select.expr(Expr::cust("COUNT(*)"));
-
-            if let Some(m2m) = &query_def.m2m {
-                let join_table = Alias::new(&m2m.join_table);
-                let source_col = Alias::new(&m2m.source_col);
-                let target_col = Alias::new(&m2m.target_col);
-
-                // We need the PK name of the target table to join
-                let registry = MODEL_REGISTRY.read().map_err(|_| {
-                    pyo3::exceptions::PyRuntimeError::new_err("Failed to lock registry")
-                })?;
-                let schema = registry.get(&name).ok_or_else(|| {
-                    pyo3::exceptions::PyRuntimeError::new_err(format!("Model '{}' not found", name))
-                })?;
-                let mut pk = None;
-                if let Some(properties) = schema.get("properties").and_then(|p| p.as_object()) {
-                    for (col_name, col_info) in properties {
-                        if col_info
-                            .get("primary_key")
-                            .and_then(|pk| pk.as_bool())
-                            .unwrap_or(false)
-                        {
-                            pk = Some(col_name.clone());
-                            break;
-                        }
-                    }
-                }
-                let pk_name =
-                    pk.ok_or_else(|| pyo3::exceptions::PyRuntimeError::new_err("No primary key"))?;
-
-                select.from(Alias::new(&table_name));
-                select.inner_join(
-                    join_table.clone(),
-                    Expr::col((Alias::new(&table_name), Alias::new(pk_name)))
-                        .equals((join_table.clone(), target_col.clone())),
-                );
-                select.and_where(Expr::col((join_table.clone(), source_col.clone())).eq(
-                    query_def.value_rhs_simple_expr_for_backend(
-                        &m2m.source_col,
-                        &m2m.source_id,
-                        true,
-                        backend,
-                    ),
-                ));
-            } else {
-                select.from(Alias::new(&table_name));
-            }
-
-            select.cond_where(query_condition_for_backend(&query_def, backend)?);
             sea_query_build_for_backend!(select, backend)
         };
         maybe_compare_shadow_query_artifacts(
@@ -1823,6 +1881,181 @@ pub fn count_filtered(
     })
 }
 
+/// Return whether any row matches a filtered query.
+///
+/// Emits `SELECT 1 ... LIMIT 1` so the database can stop at the first match
+/// instead of counting every row.
+///
+/// Args:
+///     name (str): Model class name.
+///     query_ir_json (str): Serialized Query IR envelope JSON.
+///     tx_id (str | None): Optional active transaction.
+///     using (str | None): Connection override.
+///     session_id (str | None): Session-scoped routing when set.
+///
+/// Returns:
+///     bool: ``True`` when at least one row matches.
+///
+/// # Errors
+/// `PyRuntimeError` on registry, planning, or SQL failures.
+#[pyfunction]
+#[pyo3(signature = (name, query_ir_json, tx_id=None, using=None, session_id=None))]
+pub fn exists_filtered(
+    py: Python<'_>,
+    name: String,
+    query_ir_json: String,
+    tx_id: Option<String>,
+    using: Option<String>,
+    session_id: Option<String>,
+) -> PyResult<Bound<'_, PyAny>> {
+    let mut query_def = query_def_from_ir_json(&query_ir_json)?;
+
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        let (_, engine, tx_conn, backend) = active_route_for_operation(tx_id, using, session_id.clone())?;
+
+        let table_name = name.to_lowercase();
+        query_def.postgres_enum_udt =
+            postgres_enum_udt_by_column(&table_name, &engine, &tx_conn, backend).await?;
+        let (sql, bind_values) = {
+            let mut select =
+                filtered_select_without_projection(&name, &table_name, &query_def, backend)?;
+            select.expr(Expr::cust("1")).limit(1);
+            sea_query_build_for_backend!(select, backend)
+        };
+        maybe_compare_shadow_query_artifacts(
+            &engine,
+            "exists_filtered",
+            &query_def,
+            &bind_values.0,
+        )?;
+
+        let engine_bind_values = engine_bind_values_from_sea(&bind_values.0);
+        let rows = match tx_conn {
+            Some(conn_arc) => {
+                let mut conn = conn_arc.lock().await;
+                conn.fetch_all_sql_with_binds(&sql, &engine_bind_values).await
+            }
+            None => engine.fetch_all_sql_with_binds(&sql, &engine_bind_values).await,
+        }
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("Exists failed: {}", e)))?;
+
+        Ok(!rows.is_empty())
+    })
+}
+
+/// Fetch selected columns of the rows matching a filtered query.
+///
+/// Emits `SELECT col, ... FROM ... WHERE ... ORDER BY ... LIMIT ... OFFSET ...`
+/// and decodes each value with the model schema, but builds plain dicts
+/// instead of model instances: no hydration and no identity-map traffic.
+///
+/// Args:
+///     name (str): Model class name.
+///     query_ir_json (str): Serialized Query IR envelope JSON.
+///     columns (list[str]): Column names to select, in output order.
+///     tx_id (str | None): Optional active transaction.
+///     using (str | None): Connection override.
+///     session_id (str | None): Session-scoped routing when set.
+///
+/// Returns:
+///     list[dict[str, Any]]: One ``{column: value}`` dict per row.
+///
+/// # Errors
+/// `PyRuntimeError` on registry, planning, or SQL failures.
+#[pyfunction]
+#[pyo3(signature = (name, query_ir_json, columns, tx_id=None, using=None, session_id=None))]
+pub fn fetch_filtered_values(
+    py: Python<'_>,
+    name: String,
+    query_ir_json: String,
+    columns: Vec<String>,
+    tx_id: Option<String>,
+    using: Option<String>,
+    session_id: Option<String>,
+) -> PyResult<Bound<'_, PyAny>> {
+    let mut query_def = query_def_from_ir_json(&query_ir_json)?;
+
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        let (_, engine, tx_conn, backend) = active_route_for_operation(tx_id, using, session_id.clone())?;
+
+        let table_name = name.to_lowercase();
+        let postgres_enum_udt =
+            postgres_enum_udt_by_column(&table_name, &engine, &tx_conn, backend).await?;
+        let pg_native_enum_cols: HashSet<String> = postgres_enum_udt.keys().cloned().collect();
+        query_def.postgres_enum_udt = postgres_enum_udt;
+        let schema = {
+            let registry = MODEL_REGISTRY.read().map_err(|_| {
+                pyo3::exceptions::PyRuntimeError::new_err("Failed to lock registry")
+            })?;
+            registry.get(&name).cloned().ok_or_else(|| {
+                pyo3::exceptions::PyRuntimeError::new_err(format!("Model '{}' not found", name))
+            })?
+        };
+        let (sql, bind_values) = {
+            let mut select =
+                filtered_select_without_projection(&name, &table_name, &query_def, backend)?;
+            crate::codec::apply_postgres_text_named_columns(
+                &mut select,
+                &table_name,
+                &schema,
+                &columns,
+                &pg_native_enum_cols,
+                backend,
+            );
+            if let Some(ref orders) = query_def.order_by {
+                for order in orders {
+                    let dir = if order.direction.to_lowercase() == "desc" {
+                        Order::Desc
+                    } else {
+                        Order::Asc
+                    };
+                    select.order_by((Alias::new(&table_name), Alias::new(&order.column)), dir);
+                }
+            }
+            if let Some(limit) = query_def.limit {
+                select.limit(limit);
+            }
+            if let Some(offset) = query_def.offset {
+                select.offset(offset);
+            }
+            sea_query_build_for_backend!(select, backend)
+        };
+        maybe_compare_shadow_query_artifacts(
+            &engine,
+            "fetch_filtered_values",
+            &query_def,
+            &bind_values.0,
+        )?;
+
+        let engine_bind_values = engine_bind_values_from_sea(&bind_values.0);
+        let rows = match tx_conn {
+            Some(conn_arc) => {
+                let mut conn = conn_arc.lock().await;
+                conn.fetch_all_sql_with_binds(&sql, &engine_bind_values).await
+            }
+            None => engine.fetch_all_sql_with_binds(&sql, &engine_bind_values).await,
+        }
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("Fetch failed: {}", e)))?;
+        let parsed_data = typed_rows_to_parsed_data(rows, &schema, None);
+
+        Python::attach(|py| {
+            let py_col_names: Vec<_> = columns
+                .iter()
+                .map(|col| pyo3::types::PyString::new(py, col))
+                .collect();
+            let out = pyo3::types::PyList::empty(py);
+            for (_, fields) in parsed_data {
+                let row = pyo3::types::PyDict::new(py);
+                for ((_, value), py_name) in fields.into_iter().zip(&py_col_names) {
+                    row.set_item(py_name, value.into_py_any(py)?)?;
+                }
+                out.append(row)?;
+            }
+            Ok(out.into_any().unbind())
+        })
+    })
+}
+
 /// Register a live Python instance in the identity map for deduplication.
 ///
 /// Args:
@@ -1886,6 +2119,26 @@ pub fn evict_instance(
     Ok(())
 }
 
+/// Drop tracked instances from the identity map without tearing down the engine.
+///
+/// Args:
+///     name (str | None): Model class name; `None` clears every model.
+///     session_id (str | None): Clear the session-local map instead of the global one.
+///
+/// Returns:
+///     None
+///
+/// # Errors
+/// `PyRuntimeError` when `session_id` names an unknown session.
+#[pyfunction]
+#[pyo3(signature = (name=None, session_id=None))]
+pub fn flush_identity_map(name: Option<String>, session_id: Option<String>) -> PyResult<()> {
+    match name {
+        Some(name) => identity_map_retain_model(session_id.as_deref(), &name),
+        None => identity_map_clear(session_id.as_deref()),
+    }
+}
+
 /// Deletes a record by its primary key.
 #[pyfunction]
 #[pyo3(signature = (name, pk_val, tx_id=None, using=None, session_id=None))]
@@ -2054,12 +2307,12 @@ pub fn update_filtered<'py>(
         let (_, engine, tx_conn, backend) = active_route_for_operation(tx_id, using, session_id.clone())?;
 
         let table_name = name.to_lowercase();
-        let enum_udt = postgres_enum_udt_by_column(&table_name, &engine, &tx_conn, backend).await?;
+        let PostgresBindTypes {
+            enum_udt,
+            uuid_columns,
+            ts_cast,
+        } = postgres_bind_types(&table_name, &engine, &tx_conn, backend).await?;
         query_def.postgres_enum_udt = enum_udt.clone();
-        let uuid_columns =
-            postgres_uuid_column_names(&table_name, &engine, &tx_conn, backend).await?;
-        let ts_cast =
-            postgres_temporal_cast_by_column(&table_name, &engine, &tx_conn, backend).await?;
         // ... sql ...
         let (sql, bind_values) = {
             let registry = MODEL_REGISTRY.read().map_err(|_| {
@@ -2112,6 +2365,154 @@ pub fn update_filtered<'py>(
     })
 }
 
+/// Update rows matching a filtered query and hydrate the updated rows via `RETURNING`.
+///
+/// Args:
+///     cls (PyAny): The Python model class.
+///     query_ir_json (str): Serialized Query IR envelope JSON.
+///     updates (dict): Per-column value map (same contract as `update_filtered`).
+///     tx_id (str | None): Optional active transaction.
+///     using (str | None): Connection override.
+///     session_id (str | None): Session-scoped routing when set.
+///
+/// Returns:
+///     list[PyAny]: Updated model instances. Instances already tracked by the identity map
+///     are refreshed in place and returned, so callers holding them see the new values
+///     without a follow-up `SELECT`.
+///
+/// # Errors
+/// `PyTypeError` for unbindable column values; `PyRuntimeError` on execute failure.
+#[pyfunction]
+#[pyo3(signature = (cls, query_ir_json, updates, tx_id=None, using=None, session_id=None))]
+pub fn update_filtered_returning<'py>(
+    py: Python<'py>,
+    cls: Bound<'py, PyAny>,
+    query_ir_json: String,
+    updates: Bound<'py, pyo3::types::PyDict>,
+    tx_id: Option<String>,
+    using: Option<String>,
+    session_id: Option<String>,
+) -> PyResult<Bound<'py, PyAny>> {
+    let name = cls.getattr("__name__")?.extract::<String>()?;
+    let cls_py = cls.unbind();
+    let mut query_def = query_def_from_ir_json(&query_ir_json)?;
+    let update_inputs = bind_inputs_from_py(&updates)?;
+
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        let (connection_name, engine, tx_conn, backend) =
+            active_route_for_operation(tx_id, using, session_id.clone())?;
+        let use_identity_map = engine.is_identity_map_enabled();
+
+        let table_name = name.to_lowercase();
+        let PostgresBindTypes {
+            enum_udt,
+            uuid_columns,
+            ts_cast,
+        } = postgres_bind_types(&table_name, &engine, &tx_conn, backend).await?;
+        query_def.postgres_enum_udt = enum_udt.clone();
+        let pg_native_enum_cols: HashSet<String> = enum_udt.keys().cloned().collect();
+
+        let (sql, bind_values, pk_col, schema_for_decode) = {
+            let registry = MODEL_REGISTRY.read().map_err(|_| {
+                pyo3::exceptions::PyRuntimeError::new_err("Failed to lock registry")
+            })?;
+            let schema = registry.get(&name).ok_or_else(|| {
+                pyo3::exceptions::PyRuntimeError::new_err(format!("Model '{}' not found", name))
+            })?;
+            let pk = schema
+                .get("properties")
+                .and_then(|p| p.as_object())
+                .and_then(|properties| {
+                    properties.iter().find_map(|(col_name, col_info)| {
+                        col_info
+                            .get("primary_key")
+                            .and_then(|pk| pk.as_bool())
+                            .unwrap_or(false)
+                            .then(|| col_name.clone())
+                    })
+                });
+            let mut update = UpdateStatement::new()
+                .table(Alias::new(&table_name))
+                .cond_where(query_condition_for_backend(&query_def, backend)?)
+                .to_owned();
+            for (key, input) in &update_inputs {
+                update.value(
+                    Alias::new(key),
+                    bind_input_to_expr(
+                        schema,
+                        &table_name,
+                        key,
+                        input,
+                        &enum_udt,
+                        &uuid_columns,
+                        &ts_cast,
+                        backend,
+                    )?,
+                );
+            }
+            update.returning(crate::codec::postgres_text_returning_clause(
+                schema,
+                &pg_native_enum_cols,
+                backend,
+            ));
+            let (s, values) = sea_query_build_for_backend!(update, backend);
+            (s, values, pk, schema.clone())
+        };
+        maybe_compare_shadow_query_artifacts(
+            &engine,
+            "update_filtered_returning",
+            &query_def,
+            &bind_values.0,
+        )?;
+
+        let engine_bind_values = engine_bind_values_from_sea(&bind_values.0);
+        let rows = match tx_conn {
+            Some(conn_arc) => {
+                let mut conn = conn_arc.lock().await;
+                conn.fetch_all_sql_with_binds(&sql, &engine_bind_values).await
+            }
+            None => engine.fetch_all_sql_with_binds(&sql, &engine_bind_values).await,
+        }
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("Update failed: {}", e)))?;
+        let parsed_data = typed_rows_to_parsed_data(rows, &schema_for_decode, pk_col.as_deref());
+
+        Python::attach(|py| {
+            let results = pyo3::types::PyList::empty(py);
+            let batch = crate::hydration::HydrationBatch::new(
+                cls_py.bind(py),
+                &connection_name,
+                parsed_data
+                    .first()
+                    .map(|(_, fields)| fields.as_slice())
+                    .unwrap_or_default(),
+            )?;
+
+            for (row_pk_val, fields) in parsed_data {
+                let instance = batch.hydrate(fields)?;
+
+                if use_identity_map && let Some(pk_val) = row_pk_val {
+                    let key = (connection_name.clone(), name.clone(), pk_val);
+                    if let Some(existing_obj) = identity_map_get(session_id.as_deref(), &key)? {
+                        // Refresh the tracked instance in place: every row touched by the
+                        // UPDATE comes back here, so no identity-map purge is needed.
+                        let existing = existing_obj.bind(py);
+                        let fresh_dict = instance.getattr(pyo3::intern!(py, "__dict__"))?;
+                        existing
+                            .getattr(pyo3::intern!(py, "__dict__"))?
+                            .call_method1(pyo3::intern!(py, "update"), (fresh_dict,))?;
+                        results.append(existing)?;
+                        continue;
+                    }
+                    identity_map_insert(session_id.as_deref(), key, instance.clone().unbind())?;
+                }
+
+                results.append(instance)?;
+            }
+            Ok(results.into_any().unbind())
+        })
+    })
+}
+
 /// Insert many-to-many association rows into a join table.
 ///
 /// Args:
@@ -3615,3 +4016,47 @@ mod engine_value_to_rust_value_tests {
         );
     }
 }
+
+#[cfg(test)]
+mod filtered_select_tests {
+    use super::{filtered_select_without_projection, query_def_from_ir_json};
+    use crate::state::Dialect;
+    use sea_query::{Expr, SqliteQueryBuilder};
+
+    fn unfiltered_query_def() -> super::QueryDef {
+        query_def_from_ir_json(
+            r#"{"ir_kind":"query","ir_version":1,"payload":{"model_name":"User","where":[],"order_by":[],"limit":null,"offset":null,"m2m":null}}"#,
+        )
+        .expect("valid IR")
+    }
+
+    #[test]
+    fn exists_projection_stops_at_first_row() {
+        let query_def = unfiltered_query_def();
+        let mut select =
+            filtered_select_without_projection("User", "user", &query_def, Dialect::Sqlite)
+                .expect("select builds");
+        select.expr(Expr::cust("1")).limit(1);
+        let (sql, _) = select.build(SqliteQueryBuilder);
+        assert_eq!(sql, r#"SELECT 1 FROM "user" LIMIT ?"#);
+    }
+}
+
+#[cfg(test)]
+mod bulk_insert_chunk_tests {
+    use super::{POSTGRES_MAX_BIND_PARAMS, SQLITE_MAX_BIND_PARAMS, bulk_insert_chunk_rows};
+    use crate::state::Dialect;
+
+    #[test]
+    fn chunks_stay_under_the_backend_bind_limit() {
+        assert_eq!(bulk_insert_chunk_rows(2, Dialect::Sqlite), 16383);
+        assert_eq!(bulk_insert_chunk_rows(3, Dialect::Postgres), 21845);
+        for columns in [1, 7, 40, 70000] {
+            let rows = bulk_insert_chunk_rows(columns, Dialect::Sqlite);
+            assert!(rows >= 1);
+            assert!(rows == 1 || rows * columns <= SQLITE_MAX_BIND_PARAMS);
+            let rows = bulk_insert_chunk_rows(columns, Dialect::Postgres);
+            assert!(rows == 1 || rows * columns <= POSTGRES_MAX_BIND_PARAMS);
+        }
+    }
+}
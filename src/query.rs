@@ -7,7 +7,7 @@ use crate::state::Dialect;
 use ferro_schema_ir::{
     QueryIrPayload, QueryNode as QueryIrNode, QueryOrderBy as QueryIrOrderBy, QueryValue,
 };
-use sea_query::{Alias, Condition, Expr, SimpleExpr};
+use sea_query::{Alias, Condition, Expr, LikeExpr, SimpleExpr};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::HashMap;
@@ -182,8 +182,7 @@ impl QueryDef {
                     "IN" => {
                         let val = node.value.as_ref().unwrap_or(&Value::Null);
                         if let Some(vals) = val.as_array() {
-                            let rhs: Vec<SimpleExpr> = vals
-                                .iter()
+                            let rhs: Vec<SimpleExpr> = padded_in_values(vals)
                                 .map(|v| {
                                     self.value_rhs_simple_expr_for_backend(
                                         col_name, v, false, backend,
@@ -196,14 +195,9 @@ impl QueryDef {
                                 .value_rhs_simple_expr_for_backend(col_name, val, false, backend))
                         }
                     }
-                    "LIKE" => {
-                        let val = node.value.as_ref().unwrap_or(&Value::Null);
-                        let pattern = match val {
-                            Value::String(s) => s.clone(),
-                            _ => val.to_string(),
-                        };
-                        col.like(pattern)
-                    }
+                    "LIKE" => col.like(like_pattern_expr(
+                        node.value.as_ref().unwrap_or(&Value::Null),
+                    )),
                     _ => col.eq(self.value_rhs_simple_expr_for_backend(
                         col_name,
                         &Value::Null,
@@ -230,8 +224,7 @@ impl QueryDef {
                         .gte(self.value_rhs_simple_expr_for_backend(col_name, val, false, backend)),
                     "IN" => {
                         if let Some(vals) = val.as_array() {
-                            let rhs: Vec<SimpleExpr> = vals
-                                .iter()
+                            let rhs: Vec<SimpleExpr> = padded_in_values(vals)
                                 .map(|v| {
                                     self.value_rhs_simple_expr_for_backend(
                                         col_name, v, false, backend,
@@ -244,13 +237,7 @@ impl QueryDef {
                                 .value_rhs_simple_expr_for_backend(col_name, val, false, backend))
                         }
                     }
-                    "LIKE" => {
-                        let pattern = match val {
-                            Value::String(s) => s.clone(),
-                            _ => val.to_string(),
-                        };
-                        col.like(pattern)
-                    }
+                    "LIKE" => col.like(like_pattern_expr(val)),
                     _ => col
                         .eq(self.value_rhs_simple_expr_for_backend(col_name, val, false, backend)),
                 }
@@ -537,9 +524,49 @@ fn query_value_semantic_string(value: &Value) -> String {
     }
 }
 
+/// `IN (...)` lists longer than this are bound as-is.
+const IN_LIST_PADDING_LIMIT: usize = 1024;
+
+/// Values for an `IN (...)` filter, padded with the last value up to the next
+/// power of two.
+///
+/// Each distinct list length renders distinct SQL, and every distinct SQL
+/// string takes a slot in the connection's prepared-statement cache. Padding
+/// collapses lengths 5..=8 onto one statement (and so on), so prefetches and
+/// `in_()` filters over varying batches reuse a handful of cached statements
+/// instead of evicting hot ones. Repeating a member does not change the result.
+fn padded_in_values(values: &[Value]) -> impl Iterator<Item = &Value> {
+    let padded_len = if values.is_empty() || values.len() > IN_LIST_PADDING_LIMIT {
+        values.len()
+    } else {
+        values.len().next_power_of_two()
+    };
+    let padding = std::iter::repeat(values.last())
+        .take(padded_len - values.len())
+        .flatten();
+    values.iter().chain(padding)
+}
+
+/// Build the RHS of a `LIKE` filter, passing the pattern through untouched.
+///
+/// `ESCAPE '\'` is only attached when the pattern contains a backslash: Postgres already
+/// treats `\` as the default escape while SQLite has none, so naming it keeps `\%` / `\_`
+/// literal matches identical across backends without taxing plain patterns.
+fn like_pattern_expr(value: &Value) -> LikeExpr {
+    let pattern = match value {
+        Value::String(s) => s.clone(),
+        _ => value.to_string(),
+    };
+    if pattern.contains('\\') {
+        LikeExpr::new(pattern).escape('\\')
+    } else {
+        LikeExpr::new(pattern)
+    }
+}
+
 #[cfg(test)]
 mod tests {
-    use super::{QueryDef, QueryNode};
+    use super::{IN_LIST_PADDING_LIMIT, QueryDef, QueryNode, padded_in_values};
     use crate::state::Dialect;
     use sea_query::{Alias, PostgresQueryBuilder, Query, SqliteQueryBuilder, Value as SeaValue};
     use serde_json::json;
@@ -914,4 +941,34 @@ mod tests {
 
         assert_eq!(before, after);
     }
+
+    #[test]
+    fn like_pattern_expr_adds_escape_only_for_backslash_patterns() {
+        let plain = super::like_pattern_expr(&json!("Tay%"));
+        let sql = Query::select()
+            .column(Alias::new("name"))
+            .from(Alias::new("users"))
+            .and_where(sea_query::Expr::col(Alias::new("name")).like(plain))
+            .to_string(SqliteQueryBuilder);
+        assert!(!sql.contains("ESCAPE"), "plain pattern must not escape: {sql}");
+
+        let escaped = super::like_pattern_expr(&json!("100\\%"));
+        let sql = Query::select()
+            .column(Alias::new("name"))
+            .from(Alias::new("users"))
+            .and_where(sea_query::Expr::col(Alias::new("name")).like(escaped))
+            .to_string(SqliteQueryBuilder);
+        assert!(sql.contains("ESCAPE"), "backslash pattern must escape: {sql}");
+    }
+
+    #[test]
+    fn in_lists_pad_to_power_of_two_arity() {
+        let values: Vec<serde_json::Value> = (1..=5).map(|i| json!(i)).collect();
+        let padded: Vec<_> = padded_in_values(&values).cloned().collect();
+        assert_eq!(padded, [1, 2, 3, 4, 5, 5, 5, 5].map(|i| json!(i)).to_vec());
+
+        assert_eq!(padded_in_values(&[]).count(), 0);
+        let long: Vec<serde_json::Value> = (0..=IN_LIST_PADDING_LIMIT).map(|i| json!(i)).collect();
+        assert_eq!(padded_in_values(&long).count(), IN_LIST_PADDING_LIMIT + 1);
+    }
 }
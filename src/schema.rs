@@ -331,14 +331,30 @@ pub(crate) fn build_column_plan(
     }
 }
 
+/// Whether `table` is already present among the live `existing` table names.
+///
+/// SQLite resolves table names case-insensitively, so a live `User` table turns
+/// `CREATE TABLE IF NOT EXISTS "user"` into a silent no-op; Postgres quoted
+/// identifiers are case-sensitive.
+fn live_table_exists(existing: &HashSet<String>, table: &str, dialect: Dialect) -> bool {
+    match dialect {
+        Dialect::Sqlite => existing.iter().any(|name| name.eq_ignore_ascii_case(table)),
+        Dialect::Postgres => existing.contains(table),
+    }
+}
+
 /// Internal utility to create all registered tables in the database.
 ///
 /// This is used by both the `connect(auto_migrate=True)` flow and the
-/// manual `create_tables()` function.
+/// manual `create_tables()` function. Existing tables are listed once up front
+/// and their `CREATE TABLE` is skipped; post-create statements (indexes, checks)
+/// are idempotent and still run so newly declared indexes land on old tables.
+///
+/// Returns the names of the tables this call created.
 ///
 /// # Errors
 /// Returns a `PyErr` if the SQL execution fails.
-pub async fn internal_create_tables(engine: Arc<EngineHandle>) -> PyResult<()> {
+pub async fn internal_create_tables(engine: Arc<EngineHandle>) -> PyResult<HashSet<String>> {
     // The runtime CREATE TABLE path is emitted from the Python-compiled SchemaIR
     // via the shared `ferro_migrate` emitter (issue #153). The modelset must have
     // been pushed by the `connect`/`create_tables` Python wrappers first — a
@@ -355,6 +371,8 @@ pub async fn internal_create_tables(engine: Arc<EngineHandle>) -> PyResult<()> {
     };
 
     let dialect = engine.backend();
+    let existing_tables = crate::introspect::live_table_names(&engine).await?;
+    let mut created_tables = HashSet::new();
 
     let model_refs: Vec<&ferro_schema_ir::SchemaModel> =
         modelset.payload.models.iter().collect();
@@ -366,12 +384,19 @@ pub async fn internal_create_tables(engine: Arc<EngineHandle>) -> PyResult<()> {
             ))
         })?;
 
-        engine.execute_sql(&emission.create_sql).await.map_err(|e| {
-            pyo3::exceptions::PyRuntimeError::new_err(format!(
-                "SQL Execution failed for '{}' table: {}",
-                model.table_name, e
-            ))
-        })?;
+        if !live_table_exists(&existing_tables, &model.table_name, dialect) {
+            engine.execute_sql(&emission.create_sql).await.map_err(|e| {
+                pyo3::exceptions::PyRuntimeError::new_err(format!(
+                    "SQL Execution failed for '{}' table: {}",
+                    model.table_name, e
+                ))
+            })?;
+            created_tables.insert(model.table_name.clone());
+            crate::log_debug(format!(
+                "✅ Ferro Engine: Table '{}' created",
+                model.table_name
+            ));
+        }
 
         for post_sql in &emission.post_create_sqls {
             engine.execute_sql(post_sql).await.map_err(|e| {
@@ -385,11 +410,9 @@ pub async fn internal_create_tables(engine: Arc<EngineHandle>) -> PyResult<()> {
         for warning in &emission.warnings {
             crate::emit_user_warning(warning);
         }
-
-        crate::log_debug(format!("✅ Ferro Engine: Table '{}' created", model.table_name));
     }
 
-    Ok(())
+    Ok(created_tables)
 }
 
 /// Registers a model's JSON schema with the Rust core.
@@ -426,10 +449,30 @@ pub fn register_model_schema(name: String, schema: String) -> PyResult<()> {
 pub fn create_tables(py: Python<'_>, using: Option<String>) -> PyResult<Bound<'_, PyAny>> {
     pyo3_async_runtimes::tokio::future_into_py(py, async move {
         let engine = engine_for_connection(using)?;
-        internal_create_tables(engine).await
+        internal_create_tables(engine).await?;
+        Ok(())
     })
 }
 
+/// Test-only helper: names of every registered schema (models and M2M join
+/// tables) in the FK dependency order `order_schemas_for_creation` creates them.
+/// The test suite empties shared tables in the reverse of this order.
+///
+/// # Errors
+/// Returns a `PyErr` if the model registry lock cannot be acquired.
+#[pyfunction]
+#[pyo3(name = "_table_creation_order_for_test")]
+pub fn _table_creation_order_for_test() -> PyResult<Vec<String>> {
+    let schemas = MODEL_REGISTRY
+        .read()
+        .map_err(|_| pyo3::exceptions::PyRuntimeError::new_err("Failed to lock Model Registry"))?
+        .clone();
+    Ok(order_schemas_for_creation(schemas)
+        .into_iter()
+        .map(|(name, _)| name)
+        .collect())
+}
+
 /// Test-only helper: render the Rust emitter's CREATE TABLE SQL plus any
 /// post-create SQL fragments (CHECK constraints, composite indexes) without
 /// requiring a live database. Used by the cross-emitter parity test (U5 of
@@ -493,6 +536,15 @@ mod tests {
     use super::*;
     use serde_json::json;
 
+    #[test]
+    fn live_table_exists_ignores_case_only_on_sqlite() {
+        let existing: HashSet<String> = ["User".to_string()].into_iter().collect();
+        assert!(live_table_exists(&existing, "user", Dialect::Sqlite));
+        assert!(!live_table_exists(&existing, "user", Dialect::Postgres));
+        assert!(live_table_exists(&existing, "User", Dialect::Postgres));
+        assert!(!live_table_exists(&existing, "post", Dialect::Sqlite));
+    }
+
     #[test]
     fn test_composite_index_name_short() {
         assert_eq!(composite_index_name("users", &["a", "b"]), "idx_users_a_b");
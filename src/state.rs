@@ -9,6 +9,8 @@ use ferro_schema_ir::{IrEnvelope, SchemaIrPayload};
 use once_cell::sync::Lazy;
 use pyo3::IntoPyObjectExt;
 use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::PyType;
 use std::collections::HashMap;
 use std::sync::{Arc, RwLock};
 use tokio::sync::Mutex;
@@ -319,6 +321,14 @@ pub enum RustValue {
     None,
 }
 
+// Python types and callables used to decode column values, resolved once per
+// process instead of importing their module for every hydrated cell.
+static DATETIME_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+static DATE_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+static UUID_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+static DECIMAL_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+static JSON_LOADS: PyOnceLock<Py<PyAny>> = PyOnceLock::new();
+
 impl RustValue {
     /// Converts the Rust-native value into a Python object.
     ///
@@ -330,35 +340,28 @@ impl RustValue {
             RustValue::Double(f) => Ok(f.into_py_any(py)?.into_bound(py)),
             RustValue::String(s) => Ok(s.into_py_any(py)?.into_bound(py)),
             RustValue::Bool(b) => Ok(b.into_py_any(py)?.into_bound(py)),
-            RustValue::DateTime(s) => {
-                let dt_module = py.import("datetime")?;
-                let dt_class = dt_module.getattr("datetime")?;
-                dt_class.call_method1("fromisoformat", (s.replace('Z', "+00:00"),))
-            }
-            RustValue::Date(s) => {
-                let dt_module = py.import("datetime")?;
-                let date_class = dt_module.getattr("date")?;
-                date_class.call_method1("fromisoformat", (s,))
-            }
+            RustValue::DateTime(s) => DATETIME_TYPE
+                .import(py, "datetime", "datetime")?
+                .call_method1(
+                    pyo3::intern!(py, "fromisoformat"),
+                    (s.replace('Z', "+00:00"),),
+                ),
+            RustValue::Date(s) => DATE_TYPE
+                .import(py, "datetime", "date")?
+                .call_method1(pyo3::intern!(py, "fromisoformat"), (s,)),
             RustValue::Json(v) => {
                 let json_str = v.to_string();
-                let json_module = py.import("json")?;
-                json_module.call_method1("loads", (json_str,))
+                let loads = JSON_LOADS.get_or_try_init(py, || {
+                    py.import("json")?.getattr("loads").map(Bound::unbind)
+                })?;
+                loads.bind(py).call1((json_str,))
             }
             RustValue::Blob(b) => {
                 let bytes = pyo3::types::PyBytes::new(py, &b);
                 Ok(bytes.into_any())
             }
-            RustValue::Uuid(s) => {
-                let uuid_module = py.import("uuid")?;
-                let uuid_class = uuid_module.getattr("UUID")?;
-                uuid_class.call1((s,))
-            }
-            RustValue::Decimal(s) => {
-                let decimal_module = py.import("decimal")?;
-                let decimal_class = decimal_module.getattr("Decimal")?;
-                decimal_class.call1((s,))
-            }
+            RustValue::Uuid(s) => UUID_TYPE.import(py, "uuid", "UUID")?.call1((s,)),
+            RustValue::Decimal(s) => DECIMAL_TYPE.import(py, "decimal", "Decimal")?.call1((s,)),
             RustValue::None => Ok(py.None().into_bound(py)),
         }
     }
@@ -1,9 +1,9 @@
-import asyncio
 import os
 import uuid
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from ferro import version
 from tests.db_backends import (
@@ -41,6 +41,11 @@ def pytest_configure(config):
         "markers",
         "postgres_only: run this test only against Postgres.",
     )
+    config.addinivalue_line(
+        "markers",
+        "sqlite_memory(enabled=True): give SQLite runs a private in-memory database "
+        "instead of a file. The database does not survive reset_engine().",
+    )
 
 
 def _selected_backends(config: pytest.Config) -> tuple[str, ...]:
@@ -132,21 +137,26 @@ def check_engine():
         pytest.fail("Ferro binary not found. Run 'uv run maturin develop' first.")
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create a persistent event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="function")
-def db_url(request: pytest.FixtureRequest, tmp_path: Path):
+def db_url(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+):
     backend = getattr(request, "param", "sqlite")
 
     if backend == "sqlite":
         request.node._ferro_db_schema = None
-        db_file = tmp_path / f"{request.node.name}.db"
+        memory_marker = request.node.get_closest_marker("sqlite_memory")
+        if memory_marker is not None and memory_marker.kwargs.get("enabled", True):
+            yield "sqlite::memory:"
+            return
+        if "shared_db" in request.fixturenames:
+            # Under pytest-xdist the base temp dir is already per worker, and
+            # --dist loadfile keeps every test of a module on one worker.
+            db_file = tmp_path_factory.getbasetemp() / f"{request.module.__name__}.db"
+        else:
+            db_file = tmp_path / f"{request.node.name}.db"
         yield f"sqlite:{db_file}?mode=rwc"
         return
 
@@ -199,12 +209,66 @@ async def db_engine():
     yield "sqlite::memory:"
 
 
+#: Database URL each test module is currently connected to via ``shared_db``.
+_SHARED_DB_URLS: dict[str, str] = {}
+
+
+@pytest_asyncio.fixture
+async def shared_db(request: pytest.FixtureRequest, db_url: str):
+    """Connect and auto-migrate once per module instead of once per test.
+
+    The first test in a module connects; later tests reuse that engine as long
+    as they resolve to the same URL. After each test the module's model tables
+    and the M2M join tables between them are emptied children-first, in the
+    reverse of the core's FK creation order. Model tables go through
+    ``Query.delete()``, which also drops their identity-map entries, so tests
+    still start from empty tables.
+    """
+    from ferro import connect, execute
+    from ferro._core import _table_creation_order_for_test
+    from ferro.state import _JOIN_TABLE_REGISTRY, _MODEL_REGISTRY_PY
+
+    module_name = request.module.__name__
+    if _SHARED_DB_URLS.get(module_name) != db_url:
+        await connect(db_url, auto_migrate=True)
+        _SHARED_DB_URLS[module_name] = db_url
+    yield db_url
+
+    module_models = {
+        name: model
+        for name, model in _MODEL_REGISTRY_PY.items()
+        if model.__module__ == module_name
+    }
+    module_tables = {name.lower() for name in module_models}
+    for name in reversed(_table_creation_order_for_test()):
+        if name in module_models:
+            await module_models[name].select().delete()
+        elif name in _JOIN_TABLE_REGISTRY and any(
+            column.get("foreign_key", {}).get("to_table") in module_tables
+            for column in _JOIN_TABLE_REGISTRY[name]["properties"].values()
+        ):
+            await execute(f'DELETE FROM "{name}"')
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _reset_shared_db(request: pytest.FixtureRequest):
+    yield
+    if _SHARED_DB_URLS.pop(request.module.__name__, None) is not None:
+        from ferro import reset_engine
+
+        reset_engine()
+
+
 @pytest.fixture(autouse=True)
-def cleanup_models():
+def cleanup_models(request: pytest.FixtureRequest):
     """Reset the engine between tests. Registry is not cleared so module-level
     models (e.g. in test_documentation_features) remain registered; tests that
-    need a clean registry call clear_registry() in their own fixture."""
+    need a clean registry call clear_registry() in their own fixture. Tests on
+    ``shared_db`` keep the module's connection open instead."""
     from ferro import reset_engine
 
     yield
+    if "shared_db" in request.fixturenames:
+        return
+    _SHARED_DB_URLS.pop(request.module.__name__, None)
     reset_engine()
@@ -60,3 +60,23 @@ async def test_bulk_update_evicts_identity_map(db_url):
     fresh_p1 = await BulkProduct.get(p1.id)
     assert fresh_p1 is not p1
     assert fresh_p1.price == 20.0
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_sets_column_named_returning(db_url):
+    """A column called ``returning`` is updated like any other field."""
+
+    class BulkShipment(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        returning: bool = False
+
+    await connect(db_url, auto_migrate=True)
+
+    shipment = await BulkShipment.create()
+    updated_count = await BulkShipment.where(
+        lambda bulkshipment: bulkshipment.id == shipment.id
+    ).update(returning=True)
+    assert updated_count == 1
+
+    await shipment.refresh()
+    assert shipment.returning is True
@@ -500,6 +500,21 @@ async def test_unqualified_operation_requires_default_connection(tmp_path):
         await ferro.execute("SELECT 1")
 
 
+@pytest.mark.asyncio
+@pytest.mark.sqlite_only
+async def test_reconnecting_same_url_reuses_default_engine():
+    """Repeating ``connect()`` for the same URL keeps the live pool."""
+    await ferro.connect("sqlite::memory:")
+    await ferro.execute("CREATE TABLE reuse_marker (id INTEGER PRIMARY KEY)")
+
+    await ferro.connect("sqlite::memory:")
+
+    row = await ferro.fetch_one(
+        "SELECT COUNT(*) AS c FROM sqlite_master WHERE name = 'reuse_marker'"
+    )
+    assert row == {"c": 1}
+
+
 @pytest.mark.asyncio
 async def test_invalid_connection_string():
     """Test that invalid connection strings raise the appropriate error."""
@@ -3,7 +3,7 @@ from pydantic import Field
 import ferro
 from ferro import Model, ModelDoesNotExist
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
 @pytest.mark.asyncio
@@ -70,15 +70,15 @@ async def test_upsert_does_not_duplicate(db_url):
     await ferro.connect(db_url, auto_migrate=True)
     user = CrudUser(id=42, username="original", email="original@example.com")
     await user.save()
-    users_before = await CrudUser.all()
-    assert len(users_before) == 1
+    assert await CrudUser.select().count() == 1
     user_dup = CrudUser(id=42, username="updated", email="original@example.com")
     await user_dup.save()
-    ferro.reset_engine()
-    await ferro.connect(db_url, auto_migrate=True)
+    ferro.flush_identity_map(CrudUser)
     fetched = await CrudUser.get(42)
     assert fetched is not None
+    assert fetched is not user_dup
     assert fetched.username == "updated"
+    assert await CrudUser.select().count() == 1
 
 
 @pytest.mark.asyncio
@@ -122,6 +122,38 @@ async def test_identity_map_disabled_returns_distinct_instances(db_url):
     assert user_a.username == user_b.username
 
 
+@pytest.mark.asyncio
+async def test_save_without_tracking_skips_identity_map(db_url):
+    """save(track=False) persists the row but leaves it out of the identity map."""
+
+    class CrudUser(Model):
+        id: int = Field(default=None, json_schema_extra={"primary_key": True})
+        username: str
+        email: str
+
+    await ferro.connect(db_url, auto_migrate=True)
+    created = CrudUser(username="untracked", email="u@test.com")
+    await created.save(track=False)
+    assert created.id is not None
+    fetched = await CrudUser.get(created.id)
+    assert fetched is not created
+    assert fetched.username == "untracked"
+
+
+@pytest.mark.asyncio
+async def test_create_sets_column_named_track(db_url):
+    """A model column called ``track`` is a plain field on create()."""
+
+    class CrudSong(Model):
+        id: int = Field(default=None, json_schema_extra={"primary_key": True})
+        track: int = 0
+
+    await ferro.connect(db_url, auto_migrate=True)
+    song = await CrudSong.create(track=7)
+    assert song.track == 7
+    assert await CrudSong.get(song.id) is song
+
+
 @pytest.mark.asyncio
 async def test_model_get_operation(db_url):
     """Test fetching a single record by primary key."""
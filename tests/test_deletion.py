@@ -2,7 +2,7 @@ import pytest
 from typing import Annotated
 from ferro import Model, connect, FerroField
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
 @pytest.mark.asyncio
@@ -13,8 +13,9 @@ from typing import Annotated
 
 
 import pytest
+import pytest_asyncio
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 from ferro import (
     BackRef,
@@ -138,9 +139,8 @@ async def test_basic_model_definition(db_url):
 
 
 @pytest.mark.asyncio
-async def test_field_types(db_url):
+async def test_field_types(shared_db):
     """Test all documented field types work correctly"""
-    await connect(db_url, auto_migrate=True)
     product = await Product.create(
         sku="PROD-001",
         name="Test Product",
@@ -157,9 +157,8 @@ async def test_field_types(db_url):
 
 
 @pytest.mark.asyncio
-async def test_enum_field_type(db_url):
+async def test_enum_field_type(shared_db):
     """Test enum field type works as documented"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(
         username="admin_user", email="admin@example.com", role=UserRole.ADMIN
     )
@@ -170,17 +169,15 @@ async def test_enum_field_type(db_url):
 
 
 @pytest.mark.asyncio
-async def test_field_constraints_pydantic_style(db_url):
+async def test_field_constraints_pydantic_style(shared_db):
     """Test Field() constraint syntax"""
-    await connect(db_url, auto_migrate=True)
     product = await Product.create(sku="TEST-001", name="Test", price=Decimal("10.00"))
     assert product.sku == "TEST-001"
 
 
 @pytest.mark.asyncio
-async def test_field_constraints_annotated_style(db_url):
+async def test_field_constraints_annotated_style(shared_db):
     """Test FerroField() annotated syntax"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(username="test", email="test@example.com")
     assert user.username == "test"
 
@@ -195,9 +192,8 @@ async def test_field_constraints_annotated_style(db_url):
 
 
 @pytest.mark.asyncio
-async def test_create_method(db_url):
+async def test_create_method(shared_db):
     """Test Model.create() as documented"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(
         username="alice", email="alice@example.com", is_active=True
     )
@@ -208,9 +204,8 @@ async def test_create_method(db_url):
 
 
 @pytest.mark.asyncio
-async def test_get_method(db_url):
+async def test_get_method(shared_db):
     """Test Model.get() as documented"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(username="bob", email="bob@example.com")
 
     fetched = await User.get(user.id)
@@ -220,9 +215,8 @@ async def test_get_method(db_url):
 
 
 @pytest.mark.asyncio
-async def test_all_method(db_url):
+async def test_all_method(shared_db):
     """Test Model.all() as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="user1", email="user1@example.com")
     await User.create(username="user2", email="user2@example.com")
 
@@ -231,9 +225,8 @@ async def test_all_method(db_url):
 
 
 @pytest.mark.asyncio
-async def test_save_method(db_url):
+async def test_save_method(shared_db):
     """Test instance.save() as documented"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(username="alice", email="alice@example.com")
 
     user.email = "alice.new@example.com"
@@ -246,9 +239,8 @@ async def test_save_method(db_url):
 
 
 @pytest.mark.asyncio
-async def test_delete_method(db_url):
+async def test_delete_method(shared_db):
     """Test instance.delete() as documented"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(username="alice", email="alice@example.com")
     user_id = user.id
 
@@ -258,9 +250,8 @@ async def test_delete_method(db_url):
 
 
 @pytest.mark.asyncio
-async def test_refresh_method(db_url):
+async def test_refresh_method(shared_db):
     """Test instance.refresh() as documented"""
-    await connect(db_url, auto_migrate=True)
     user = await User.create(username="alice", email="alice@example.com")
 
     # Simulate external update
@@ -272,9 +263,8 @@ async def test_refresh_method(db_url):
 
 
 @pytest.mark.asyncio
-async def test_bulk_create(db_url):
+async def test_bulk_create(shared_db):
     """Test Model.bulk_create() as documented"""
-    await connect(db_url, auto_migrate=True)
     users = [
         User(username=f"user_{i}", email=f"user{i}@example.com") for i in range(100)
     ]
@@ -282,14 +272,12 @@ async def test_bulk_create(db_url):
     count = await User.bulk_create(users)
     assert count == 100
 
-    all_users = await User.all()
-    assert len(all_users) == 100
+    assert await User.select().count() == 100
 
 
 @pytest.mark.asyncio
-async def test_get_or_create(db_url):
+async def test_get_or_create(shared_db):
     """Test Model.get_or_create() as documented"""
-    await connect(db_url, auto_migrate=True)
     # First call creates
     user1, created1 = await User.get_or_create(
         email="test@example.com", defaults={"username": "testuser"}
@@ -307,9 +295,8 @@ async def test_get_or_create(db_url):
 
 
 @pytest.mark.asyncio
-async def test_update_or_create(db_url):
+async def test_update_or_create(shared_db):
     """Test Model.update_or_create() as documented"""
-    await connect(db_url, auto_migrate=True)
     # First call creates
     user1, created1 = await User.update_or_create(
         email="test@example.com", defaults={"username": "testuser"}
@@ -331,9 +318,8 @@ async def test_update_or_create(db_url):
 
 
 @pytest.mark.asyncio
-async def test_where_equality(db_url):
+async def test_where_equality(shared_db):
     """Test .where() with equality operator"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", is_active=True)
     await User.create(username="bob", email="bob@example.com", is_active=False)
 
@@ -343,9 +329,8 @@ async def test_where_equality(db_url):
 
 
 @pytest.mark.asyncio
-async def test_where_comparison_operators(db_url):
+async def test_where_comparison_operators(shared_db):
     """Test comparison operators in queries"""
-    await connect(db_url, auto_migrate=True)
     for i in range(5):
         await Product.create(
             sku=f"PROD-{i}", name=f"Product {i}", price=Decimal(str(i * 10))
@@ -361,9 +346,8 @@ async def test_where_comparison_operators(db_url):
 
 
 @pytest.mark.asyncio
-async def test_where_like_operator(db_url):
+async def test_where_like_operator(shared_db):
     """Test .like() operator as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@gmail.com")
     await User.create(username="bob", email="bob@yahoo.com")
     await User.create(username="charlie", email="charlie@gmail.com")
@@ -373,9 +357,8 @@ async def test_where_like_operator(db_url):
 
 
 @pytest.mark.asyncio
-async def test_where_in_operator(db_url):
+async def test_where_in_operator(shared_db):
     """Test .in_() operator as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", role=UserRole.ADMIN)
     await User.create(username="bob", email="bob@example.com", role=UserRole.MODERATOR)
     await User.create(
@@ -390,9 +373,8 @@ async def test_where_in_operator(db_url):
 
 
 @pytest.mark.asyncio
-async def test_logical_and_operator(db_url):
+async def test_logical_and_operator(shared_db):
     """Test & (AND) operator in queries"""
-    await connect(db_url, auto_migrate=True)
     await User.create(
         username="alice", email="alice@example.com", is_active=True, role=UserRole.ADMIN
     )
@@ -414,9 +396,8 @@ async def test_logical_and_operator(db_url):
 
 
 @pytest.mark.asyncio
-async def test_logical_or_operator(db_url):
+async def test_logical_or_operator(shared_db):
     """Test | (OR) operator in queries"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", role=UserRole.ADMIN)
     await User.create(username="bob", email="bob@example.com", role=UserRole.MODERATOR)
     await User.create(
@@ -431,9 +412,8 @@ async def test_logical_or_operator(db_url):
 
 
 @pytest.mark.asyncio
-async def test_order_by(db_url):
+async def test_order_by(shared_db):
     """Test .order_by() as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="charlie", email="charlie@example.com")
     await User.create(username="alice", email="alice@example.com")
     await User.create(username="bob", email="bob@example.com")
@@ -450,9 +430,8 @@ async def test_order_by(db_url):
 
 
 @pytest.mark.asyncio
-async def test_limit_and_offset(db_url):
+async def test_limit_and_offset(shared_db):
     """Test .limit() and .offset() as documented"""
-    await connect(db_url, auto_migrate=True)
     for i in range(10):
         await User.create(username=f"user_{i}", email=f"user{i}@example.com")
 
@@ -467,9 +446,8 @@ async def test_limit_and_offset(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_first(db_url):
+async def test_query_first(shared_db):
     """Test .first() as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com")
 
     user = await User.where(lambda t: t.username == "alice").first()
@@ -481,9 +459,8 @@ async def test_query_first(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_count(db_url):
+async def test_query_count(shared_db):
     """Test .count() as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", is_active=True)
     await User.create(username="bob", email="bob@example.com", is_active=True)
     await User.create(username="charlie", email="charlie@example.com", is_active=False)
@@ -493,9 +470,8 @@ async def test_query_count(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_exists(db_url):
+async def test_query_exists(shared_db):
     """Test .exists() as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", role=UserRole.ADMIN)
 
     has_admin = await User.where(lambda t: t.role == UserRole.ADMIN.value).exists()
@@ -508,9 +484,8 @@ async def test_query_exists(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_update(db_url):
+async def test_query_update(shared_db):
     """Test .update() as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", is_active=True)
     await User.create(username="bob", email="bob@example.com", is_active=True)
 
@@ -524,9 +499,8 @@ async def test_query_update(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_delete(db_url):
+async def test_query_delete(shared_db):
     """Test .delete() on query as documented"""
-    await connect(db_url, auto_migrate=True)
     await User.create(username="alice", email="alice@example.com", is_active=True)
     await User.create(username="bob", email="bob@example.com", is_active=False)
 
@@ -544,9 +518,8 @@ async def test_query_delete(db_url):
 
 
 @pytest.mark.asyncio
-async def test_foreign_key_creation(db_url):
+async def test_foreign_key_creation(shared_db):
     """Test creating records with ForeignKey relationships"""
-    await connect(db_url, auto_migrate=True)
     author = await User.create(username="alice", email="alice@example.com")
 
     # Pass model instance
@@ -556,9 +529,8 @@ async def test_foreign_key_creation(db_url):
 
 
 @pytest.mark.asyncio
-async def test_foreign_key_forward_relation(db_url):
+async def test_foreign_key_forward_relation(shared_db):
     """Test accessing forward relation (ForeignKey)"""
-    await connect(db_url, auto_migrate=True)
     author = await User.create(username="alice", email="alice@example.com")
     post = await Post.create(title="Test", content="Content", author=author)
 
@@ -569,9 +541,8 @@ async def test_foreign_key_forward_relation(db_url):
 
 
 @pytest.mark.asyncio
-async def test_foreign_key_reverse_relation(db_url):
+async def test_foreign_key_reverse_relation(shared_db):
     """Test accessing reverse relation (BackRef)"""
-    await connect(db_url, auto_migrate=True)
     author = await User.create(username="alice", email="alice@example.com")
 
     await Post.create(title="Post 1", content="Content 1", author=author)
@@ -583,9 +554,8 @@ async def test_foreign_key_reverse_relation(db_url):
 
 
 @pytest.mark.asyncio
-async def test_reverse_relation_filtering(db_url):
+async def test_reverse_relation_filtering(shared_db):
     """Test filtering on reverse relations"""
-    await connect(db_url, auto_migrate=True)
     author = await User.create(username="alice", email="alice@example.com")
 
     await Post.create(
@@ -593,15 +563,15 @@ async def test_reverse_relation_filtering(db_url):
     )
     await Post.create(title="Draft", content="Content", author=author, published=False)
 
-    published = await author.posts.where(lambda t: t.published == True).all()  # noqa: E712
-    assert len(published) == 1
-    assert published[0].title == "Published"
+    published = await author.posts.where(lambda t: t.published == True).values(  # noqa: E712
+        "title"
+    )
+    assert published == [{"title": "Published"}]
 
 
 @pytest.mark.asyncio
-async def test_shadow_field_access(db_url):
+async def test_shadow_field_access(shared_db):
     """Test accessing shadow fields (author_id) as documented"""
-    await connect(db_url, auto_migrate=True)
     author = await User.create(username="alice", email="alice@example.com")
     post = await Post.create(title="Test", content="Content", author=author)
 
@@ -613,95 +583,39 @@ async def test_shadow_field_access(db_url):
     assert len(posts) == 1
 
 
-@pytest.mark.skip(
-    reason="Many-to-many join tables not automatically created - see coming-soon.md"
-)
-@pytest.mark.asyncio
-async def test_many_to_many_add(db_url):
-    """Test .add() for many-to-many relationships"""
-    await connect(db_url, auto_migrate=True)
+@pytest_asyncio.fixture
+async def m2m_post(shared_db):
+    """A post and two unattached tags, shared by the many-to-many cases."""
     post = await Post.create(
         title="Test Post",
         content="Content",
         author=await User.create(username="alice", email="alice@example.com"),
     )
-
-    tag1 = await Tag.create(name="python")
-    tag2 = await Tag.create(name="rust")
-
-    await post.tags.add(tag1, tag2)
-
-    post_tags = await post.tags.all()
-    assert len(post_tags) == 2
+    return post, await Tag.create(name="python"), await Tag.create(name="rust")
 
 
 @pytest.mark.skip(
     reason="Many-to-many join tables not automatically created - see coming-soon.md"
 )
+@pytest.mark.parametrize("op", ["add", "remove", "clear", "reverse"])
 @pytest.mark.asyncio
-async def test_many_to_many_remove(db_url):
-    """Test .remove() for many-to-many relationships"""
-    await connect(db_url, auto_migrate=True)
-    post = await Post.create(
-        title="Test Post",
-        content="Content",
-        author=await User.create(username="alice", email="alice@example.com"),
-    )
-
-    tag1 = await Tag.create(name="python")
-    tag2 = await Tag.create(name="rust")
-
-    await post.tags.add(tag1, tag2)
-    await post.tags.remove(tag1)
-
-    post_tags = await post.tags.all()
-    assert len(post_tags) == 1
-    assert post_tags[0].name == "rust"
-
-
-@pytest.mark.skip(
-    reason="Many-to-many join tables not automatically created - see coming-soon.md"
-)
-@pytest.mark.asyncio
-async def test_many_to_many_clear(db_url):
-    """Test .clear() for many-to-many relationships"""
-    await connect(db_url, auto_migrate=True)
-    post = await Post.create(
-        title="Test Post",
-        content="Content",
-        author=await User.create(username="alice", email="alice@example.com"),
-    )
-
-    tag1 = await Tag.create(name="python")
-    tag2 = await Tag.create(name="rust")
-
-    await post.tags.add(tag1, tag2)
-    await post.tags.clear()
-
-    post_tags = await post.tags.all()
-    assert len(post_tags) == 0
-
+async def test_many_to_many_operations(m2m_post, op):
+    """Test .add()/.remove()/.clear() and reverse access for many-to-many"""
+    post, python, rust = m2m_post
+    await post.tags.add(python, rust)
 
-@pytest.mark.skip(
-    reason="Many-to-many join tables not automatically created - see coming-soon.md"
-)
-@pytest.mark.asyncio
-async def test_many_to_many_reverse(db_url):
-    """Test many-to-many from both sides"""
-    await connect(db_url, auto_migrate=True)
-    post = await Post.create(
-        title="Test Post",
-        content="Content",
-        author=await User.create(username="alice", email="alice@example.com"),
-    )
-    tag = await Tag.create(name="python")
+    if op == "reverse":
+        tag_posts = await python.posts.all()
+        assert [p.id for p in tag_posts] == [post.id]
+        return
 
-    await post.tags.add(tag)
+    if op == "remove":
+        await post.tags.remove(python)
+    elif op == "clear":
+        await post.tags.clear()
 
-    # Access from reverse side
-    tag_posts = await tag.posts.all()
-    assert len(tag_posts) == 1
-    assert tag_posts[0].id == post.id
+    expected = {"add": {"python", "rust"}, "remove": {"rust"}, "clear": set()}[op]
+    assert {tag.name for tag in await post.tags.all()} == expected
 
 
 # ============================================================================
@@ -710,24 +624,20 @@ async def test_many_to_many_reverse(db_url):
 
 
 @pytest.mark.asyncio
-async def test_transaction_commit(db_url):
+async def test_transaction_commit(shared_db):
     """Test transaction commits on success"""
-    await connect(db_url, auto_migrate=True)
     async with transaction():
         user = await User.create(username="alice", email="alice@example.com")
         await Post.create(title="Test", content="Content", author=user)
 
     # Verify data persisted
-    users = await User.all()
-    posts = await Post.all()
-    assert len(users) == 1
-    assert len(posts) == 1
+    assert await User.select().count() == 1
+    assert await Post.select().count() == 1
 
 
 @pytest.mark.asyncio
-async def test_transaction_rollback(db_url):
+async def test_transaction_rollback(shared_db):
     """Test transaction rolls back on exception"""
-    await connect(db_url, auto_migrate=True)
     try:
         async with transaction():
             await User.create(username="alice", email="alice@example.com")
@@ -736,28 +646,28 @@ async def test_transaction_rollback(db_url):
         pass
 
     # Verify data was rolled back
-    users = await User.all()
-    assert len(users) == 0
+    assert await User.select().count() == 0
 
 
 @pytest.mark.asyncio
-async def test_transaction_isolation(db_url):
+async def test_transaction_isolation(shared_db):
     """Test transaction isolation between concurrent tasks"""
-    await connect(db_url, auto_migrate=True)
+    # Both transactions are open at the barrier; task_a has already written.
+    both_open = asyncio.Barrier(2)
 
     async def task_a():
         async with transaction():
             await User.create(username="task_a_user", email="a@example.com")
-            await asyncio.sleep(0.1)
+            await both_open.wait()
 
     async def task_b():
         async with transaction():
+            await both_open.wait()
             await User.create(username="task_b_user", email="b@example.com")
 
     await asyncio.gather(task_a(), task_b())
 
-    users = await User.all()
-    assert len(users) == 2
+    assert await User.select().count() == 2
 
 
 # ============================================================================
@@ -766,9 +676,8 @@ async def test_transaction_isolation(db_url):
 
 
 @pytest.mark.asyncio
-async def test_tutorial_blog_example(db_url):
+async def test_tutorial_blog_example(shared_db):
     """Test the complete tutorial blog example"""
-    await connect(db_url, auto_migrate=True)
     # Create users
     alice = await User.create(username="alice", email="alice@example.com")
     bob = await User.create(username="bob", email="bob@example.com")
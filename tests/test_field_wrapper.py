@@ -4,7 +4,7 @@ import pytest
 
 from ferro import FerroField, Field, Model, connect
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
 @pytest.mark.asyncio
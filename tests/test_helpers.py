@@ -1,21 +1,28 @@
 import pytest
 from typing import Annotated
-from ferro import Model, connect, FerroField
+from ferro import Model, FerroField
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
-@pytest.mark.asyncio
-async def test_create_helper(db_url):
-    """Test Model.create() convenience method."""
+class HelperUser(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    username: Annotated[str, FerroField(unique=True)]
+    is_active: bool = True
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
 
-    class HelperUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: Annotated[str, FerroField(unique=True)]
-        is_active: bool = True
+    HelperUser._reregister_ferro()
+    _MODEL_REGISTRY_PY[HelperUser.__name__] = HelperUser
+    yield
 
-    await connect(db_url, auto_migrate=True)
 
+@pytest.mark.asyncio
+async def test_create_helper(shared_db):
+    """Test Model.create() convenience method."""
     user = await HelperUser.create(username="taylor")
     assert user.id is not None
     assert user.username == "taylor"
@@ -26,16 +33,8 @@ async def test_create_helper(db_url):
 
 
 @pytest.mark.asyncio
-async def test_exists_helper(db_url):
+async def test_exists_helper(shared_db):
     """Test Query.exists() convenience method."""
-
-    class HelperUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: Annotated[str, FerroField(unique=True)]
-        is_active: bool = True
-
-    await connect(db_url, auto_migrate=True)
-
     await HelperUser.create(username="exists_check")
 
     assert (
@@ -48,16 +47,8 @@ async def test_exists_helper(db_url):
 
 
 @pytest.mark.asyncio
-async def test_bulk_create_helper(db_url):
+async def test_bulk_create_helper(shared_db):
     """Test Model.bulk_create() for efficient batch inserts."""
-
-    class HelperUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: Annotated[str, FerroField(unique=True)]
-        is_active: bool = True
-
-    await connect(db_url, auto_migrate=True)
-
     users = [
         HelperUser(username="user1"),
         HelperUser(username="user2"),
@@ -73,16 +64,17 @@ async def test_bulk_create_helper(db_url):
 
 
 @pytest.mark.asyncio
-async def test_get_or_create(db_url):
-    """Test Model.get_or_create() behavior."""
+async def test_bulk_create_splits_batches_past_the_bind_limit(shared_db):
+    """Batches above SQLite's 32766 bind parameters are chunked, not rejected."""
+    users = [HelperUser(username=f"bulk{i}") for i in range(17_000)]
 
-    class HelperUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: Annotated[str, FerroField(unique=True)]
-        is_active: bool = True
+    assert await HelperUser.bulk_create(users) == 17_000
+    assert await HelperUser.select().count() == 17_000
 
-    await connect(db_url, auto_migrate=True)
 
+@pytest.mark.asyncio
+async def test_get_or_create(shared_db):
+    """Test Model.get_or_create() behavior."""
     # 1. Create case
     user1, created = await HelperUser.get_or_create(
         username="new_user", defaults={"is_active": False}
@@ -98,17 +90,62 @@ async def test_get_or_create(db_url):
     assert user2 is user1  # Identity Map should return same object
 
 
+@pytest.fixture
+def lost_race(monkeypatch):
+    """Make the next ``Query.first()`` miss, as if a concurrent writer had
+    inserted the row between the lookup and the INSERT."""
+    from ferro.query import Query
+
+    original = Query.first
+    misses = [None]
+
+    async def first(self):
+        if misses:
+            return misses.pop()
+        return await original(self)
+
+    monkeypatch.setattr(Query, "first", first)
+
+
 @pytest.mark.asyncio
-async def test_update_or_create(db_url):
-    """Test Model.update_or_create() behavior."""
+async def test_get_or_create_returns_row_inserted_by_concurrent_writer(
+    shared_db, lost_race
+):
+    """A unique-constraint loss on the create path returns the winning row."""
+    winner = await HelperUser.create(username="raced")
+    user, created = await HelperUser.get_or_create(
+        username="raced", defaults={"is_active": False}
+    )
+    assert created is False
+    assert user is winner
+    assert user.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_update_or_create_updates_row_inserted_by_concurrent_writer(
+    shared_db, lost_race
+):
+    """update_or_create applies defaults to the row that won the race."""
+    winner = await HelperUser.create(username="raced")
+    user, created = await HelperUser.update_or_create(
+        username="raced", defaults={"is_active": False}
+    )
+    assert created is False
+    assert user is winner
+    assert (await HelperUser.get(winner.id)).is_active is False
 
-    class HelperUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: Annotated[str, FerroField(unique=True)]
-        is_active: bool = True
 
-    await connect(db_url, auto_migrate=True)
+@pytest.mark.asyncio
+async def test_get_or_create_reraises_when_no_row_matches(shared_db):
+    """Create failures not explained by a matching row propagate unchanged."""
+    await HelperUser.create(username="taken", is_active=True)
+    with pytest.raises(RuntimeError, match="(?i)unique|duplicate"):
+        await HelperUser.get_or_create(username="taken", is_active=False)
+
 
+@pytest.mark.asyncio
+async def test_update_or_create(shared_db):
+    """Test Model.update_or_create() behavior."""
     # 1. Create case
     user1, created = await HelperUser.update_or_create(
         username="up_user", defaults={"is_active": True}
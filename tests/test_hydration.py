@@ -1,10 +1,12 @@
+from datetime import datetime
+
 import pytest
 from pydantic import ConfigDict, Field
 
 import ferro
 from ferro import Model
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
 INIT_CALLED_COUNT = 0
@@ -46,9 +48,8 @@ async def test_direct_injection_bypasses_init(db_url):
     await user.save()
     assert INIT_CALLED_COUNT == 1
 
-    # 2. Reset engine to clear Identity Map (so we force a DB fetch)
-    ferro.reset_engine()
-    await ferro.connect(db_url, auto_migrate=True)
+    # 2. Clear the Identity Map (so we force a DB fetch)
+    ferro.flush_identity_map(HydrationTestUser)
 
     # 3. Fetch the record
     INIT_CALLED_COUNT = 0
@@ -62,6 +63,32 @@ async def test_direct_injection_bypasses_init(db_url):
     assert INIT_CALLED_COUNT == 0
 
 
+@pytest.mark.asyncio
+async def test_hydration_skips_default_factories(db_url):
+    """Loaded rows take stored values; ``default_factory`` runs only on construction."""
+    stamps = iter([datetime(2026, 1, 1, 9, 30), datetime(2027, 1, 1)])
+    calls = []
+
+    def stamp() -> datetime:
+        calls.append(1)
+        return next(stamps)
+
+    class StampedEvent(Model):
+        id: int = Field(default=None, json_schema_extra={"primary_key": True})
+        created_at: datetime = Field(default_factory=stamp)
+
+    await ferro.connect(db_url, auto_migrate=True)
+    await StampedEvent(id=1).save()
+    assert len(calls) == 1
+
+    ferro.flush_identity_map()
+
+    row = await StampedEvent.get(1)
+    assert row is not None
+    assert row.created_at.year == 2026
+    assert len(calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_hydrated_row_initializes_pydantic_slots(db_url):
     """Rust-hydrated instances must match __init__ for Pydantic slot attributes."""
@@ -74,8 +101,7 @@ async def test_hydrated_row_initializes_pydantic_slots(db_url):
     created = SlotCheckUser(id=1, name="slot-check")
     await created.save()
 
-    ferro.reset_engine()
-    await ferro.connect(db_url, auto_migrate=True)
+    ferro.flush_identity_map()
 
     row = await SlotCheckUser.get(1)
     assert row is not None
@@ -104,8 +130,7 @@ async def test_hydrated_extra_allow_starts_with_empty_extra_dict(db_url):
     created = ExtraAllowUser(id=1, name="ea")
     await created.save()
 
-    ferro.reset_engine()
-    await ferro.connect(db_url, auto_migrate=True)
+    ferro.flush_identity_map()
 
     row = await ExtraAllowUser.get(1)
     assert row is not None
@@ -126,8 +151,7 @@ async def test_hydration_slots_match_across_get_all_and_first(db_url):
     await ferro.connect(db_url, auto_migrate=True)
     await SlotPathUser(id=1, name="one").save()
 
-    ferro.reset_engine()
-    await ferro.connect(db_url, auto_migrate=True)
+    ferro.flush_identity_map()
 
     by_get = await SlotPathUser.get(1)
     by_all = (await SlotPathUser.all())[0]
@@ -155,8 +179,7 @@ async def test_hydrated_extra_forbid_initializes_slots(db_url):
     await ferro.connect(db_url, auto_migrate=True)
     await ExtraForbidUser(id=1, name="ef").save()
 
-    ferro.reset_engine()
-    await ferro.connect(db_url, auto_migrate=True)
+    ferro.flush_identity_map()
 
     row = await ExtraForbidUser.get(1)
     assert row is not None
@@ -6,8 +6,8 @@ before and after refactoring.
 """
 
 import sys
+from types import SimpleNamespace
 from typing import Annotated, ForwardRef, Union
-from unittest.mock import Mock
 
 import pytest
 from pydantic.fields import FieldInfo
@@ -82,6 +82,13 @@ class TestRelationshipFieldPayload:
         hint = ForwardRef("BackRef[User]")
         assert ModelMetaclass._annotation_looks_like_back_ref(hint) is True
 
+    @pytest.mark.parametrize(
+        "hint", [int, Relation[list[int]], "Relation[list[User]]", ForwardRef("User")]
+    )
+    def test_other_annotations_are_not_legacy(self, hint):
+        """Only str/ForwardRef text mentioning BackRef is treated as legacy."""
+        assert ModelMetaclass._annotation_looks_like_back_ref(hint) is False
+
     def test_field_with_back_ref_true(self):
         """Field(back_ref=True) in namespace should be returned as payload."""
         hint = Relation[list[int]]
@@ -336,37 +343,36 @@ class TestParseFerroFieldMetadata:
 
     def test_no_ferro_fields_returns_empty(self):
         """Model without FerroField metadata should return empty dict."""
-        mock_cls = Mock()
-        mock_cls.model_fields = {"name": FieldInfo(annotation=str, default=None)}
+        fake_cls = SimpleNamespace(
+            model_fields={"name": FieldInfo(annotation=str, default=None)}
+        )
 
-        result = ModelMetaclass._parse_ferro_field_metadata(mock_cls)
+        result = ModelMetaclass._parse_ferro_field_metadata(fake_cls)
 
         assert result == {}
 
     def test_annotated_ferro_field(self):
         """FerroField in Annotated metadata should be detected."""
         ferro_meta = FerroField(primary_key=True)
-        mock_cls = Mock()
         field_info = FieldInfo(annotation=int, default=None)
         # Simulate Pydantic's metadata field
         field_info.metadata = [ferro_meta]
-        mock_cls.model_fields = {"id": field_info}
+        fake_cls = SimpleNamespace(model_fields={"id": field_info})
 
-        result = ModelMetaclass._parse_ferro_field_metadata(mock_cls)
+        result = ModelMetaclass._parse_ferro_field_metadata(fake_cls)
 
         assert "id" in result
         assert result["id"] is ferro_meta
 
     def test_wrapped_ferro_field(self):
         """FerroField in json_schema_extra should be detected."""
-        mock_cls = Mock()
         field_info = FieldInfo(annotation=int, default=None)
         field_info.json_schema_extra = {
             FERRO_FIELD_EXTRA_KEY: {"primary_key": True, "autoincrement": True}
         }
-        mock_cls.model_fields = {"id": field_info}
+        fake_cls = SimpleNamespace(model_fields={"id": field_info})
 
-        result = ModelMetaclass._parse_ferro_field_metadata(mock_cls)
+        result = ModelMetaclass._parse_ferro_field_metadata(fake_cls)
 
         assert "id" in result
         assert isinstance(result["id"], FerroField)
@@ -375,13 +381,29 @@ class TestParseFerroFieldMetadata:
     def test_dual_declaration_raises_error(self):
         """FerroField declared twice should raise TypeError."""
         ferro_meta = FerroField(primary_key=True)
-        mock_cls = Mock()
         field_info = FieldInfo(annotation=int, default=None)
         field_info.metadata = [ferro_meta]
         field_info.json_schema_extra = {FERRO_FIELD_EXTRA_KEY: {"primary_key": True}}
-        mock_cls.model_fields = {"id": field_info}
+        fake_cls = SimpleNamespace(model_fields={"id": field_info})
 
         with pytest.raises(
             TypeError, match="cannot declare Ferro field metadata twice"
         ):
-            ModelMetaclass._parse_ferro_field_metadata(mock_cls)
+            ModelMetaclass._parse_ferro_field_metadata(fake_cls)
+
+
+class TestGenerateAndRegisterSchema:
+    """Test _generate_and_register_schema bookkeeping."""
+
+    def test_defining_a_model_does_not_recompile_the_registry(self):
+        """Class creation stores only its own IR; the modelset is left alone."""
+        from ferro import state
+
+        before = state._SCHEMA_IR_MODELSET
+
+        class SchemaOnlyThing(Model):
+            id: int | None = None
+            name: str
+
+        assert "SchemaOnlyThing" in state._SCHEMA_IR_BY_MODEL
+        assert state._SCHEMA_IR_MODELSET is before
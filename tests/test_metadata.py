@@ -1,23 +1,41 @@
 import pytest
 import uuid
 from typing import Annotated
-from ferro import Model, connect, FerroField
+from ferro import Model, FerroField
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
+
+
+class AutoUser(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    name: str
+
+
+class ManualUser(Model):
+    id: Annotated[int, FerroField(primary_key=True, autoincrement=False)]
+    name: str
+
+
+class Session(Model):
+    token: Annotated[str, FerroField(primary_key=True)]
+    user_id: int
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
+
+    for model_cls in (AutoUser, ManualUser, Session):
+        model_cls._reregister_ferro()
+        _MODEL_REGISTRY_PY[model_cls.__name__] = model_cls
+    yield
 
 
 @pytest.mark.asyncio
-async def test_autoincrement_id_retrieval(db_url):
+async def test_autoincrement_id_retrieval(shared_db):
     """
     Test that saving a model with an autoincrementing PK retrieves the ID back from the DB.
     """
-
-    class AutoUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        name: str
-
-    await connect(db_url, auto_migrate=True)
-
     user = AutoUser(name="taylor")
     assert user.id is None
 
@@ -30,17 +48,10 @@ async def test_autoincrement_id_retrieval(db_url):
 
 
 @pytest.mark.asyncio
-async def test_manual_id_no_autoincrement(db_url):
+async def test_manual_id_no_autoincrement(shared_db):
     """
     Test that disabling autoincrement allows manual ID assignment.
     """
-
-    class ManualUser(Model):
-        id: Annotated[int, FerroField(primary_key=True, autoincrement=False)]
-        name: str
-
-    await connect(db_url, auto_migrate=True)
-
     user = ManualUser(id=999, name="jeff")
     await user.save()
 
@@ -53,17 +64,10 @@ async def test_manual_id_no_autoincrement(db_url):
 
 
 @pytest.mark.asyncio
-async def test_string_primary_key(db_url):
+async def test_string_primary_key(shared_db):
     """
     Test using a string as a primary key (implies autoincrement=False).
     """
-
-    class Session(Model):
-        token: Annotated[str, FerroField(primary_key=True)]
-        user_id: int
-
-    await connect(db_url, auto_migrate=True)
-
     token = str(uuid.uuid4())
     s = Session(token=token, user_id=1)
     await s.save()
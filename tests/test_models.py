@@ -39,6 +39,7 @@ def test_model_json_schema_sent_to_rust():
     class SchemaModel(Model):
         tag: str = Field(max_length=10)
 
-    schema = SchemaModel.model_json_schema()
+    # The metaclass keeps the schema it registered; no need to rebuild it.
+    schema = SchemaModel.__ferro_schema__
     assert "tag" in schema["properties"]
     assert schema["properties"]["tag"]["maxLength"] == 10
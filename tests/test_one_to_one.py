@@ -1,5 +1,4 @@
 import pytest
-import sqlite3
 from typing import Annotated
 from ferro import (
     Model,
@@ -10,35 +9,44 @@ from ferro import (
     reset_engine,
     clear_registry,
 )
+from ferro.raw import fetch_one
 
 pytestmark = pytest.mark.backend_matrix
 
 
+class User(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    username: str
+    profile: "Profile" = BackRef()
+
+
+class Profile(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    bio: str
+    user: Annotated[User, ForeignKey(related_name="profile", unique=True)]
+
+
 @pytest.fixture(autouse=True)
 def cleanup():
     reset_engine()
     clear_registry()
+    from ferro.relations import resolve_relationships
     from ferro.state import _MODEL_REGISTRY_PY, _PENDING_RELATIONS
 
     _MODEL_REGISTRY_PY.clear()
     _PENDING_RELATIONS.clear()
+
+    # Restore the module-level pair: schemas, then the FK/back-ref descriptors.
+    for model_cls in (User, Profile):
+        _MODEL_REGISTRY_PY[model_cls.__name__] = model_cls
+    _PENDING_RELATIONS.append(("Profile", "user", Profile.ferro_relations["user"]))
+    resolve_relationships()
     yield
 
 
 @pytest.mark.asyncio
 async def test_one_to_one_relationship(db_url):
     """Verify strict 1:1 relationship behavior."""
-
-    class User(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-        profile: "Profile" = BackRef()
-
-    class Profile(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        bio: str
-        user: Annotated[User, ForeignKey(related_name="profile", unique=True)]
-
     await connect(db_url, auto_migrate=True)
 
     # 1. Create User and Profile
@@ -57,7 +65,8 @@ async def test_one_to_one_relationship(db_url):
     assert p1_user.username == "alice"
 
     # 4. Verify Uniqueness Enforcement
-    with pytest.raises(Exception):
+    # SQLite reports "UNIQUE constraint failed", Postgres "violates unique constraint".
+    with pytest.raises(RuntimeError, match="(?i)unique constraint"):
         # Should fail because alice already has a profile
         await Profile.create(bio="Another bio", user=alice)
 
@@ -65,35 +74,17 @@ async def test_one_to_one_relationship(db_url):
 @pytest.mark.asyncio
 @pytest.mark.sqlite_only
 async def test_one_to_one_unique_index_in_sqlite(db_url):
-    class User(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-        profile: "Profile" = BackRef()
-
-    class Profile(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        bio: str
-        user: Annotated[User, ForeignKey(related_name="profile", unique=True)]
-
     await connect(db_url, auto_migrate=True)
 
-    db_path = db_url.replace("sqlite:", "").split("?")[0]
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA index_list('profile')")
-    indexes = cursor.fetchall()
+    # An inline UNIQUE column becomes an autoindex with no SQL text in
+    # sqlite_master, so join the index pragmas in one query instead.
+    row = await fetch_one(
+        "SELECT 1 AS hit FROM pragma_index_list('profile') AS il "
+        "JOIN pragma_index_info(il.name) AS ii "
+        "WHERE il.\"unique\" = 1 AND ii.name = 'user_id'"
+    )
 
-    has_unique_user_id = False
-    for idx in indexes:
-        idx_name = idx[1]
-        cursor.execute(f"PRAGMA index_info('{idx_name}')")
-        info = cursor.fetchall()
-        if any(row[2] == "user_id" for row in info) and idx[2] == 1:
-            has_unique_user_id = True
-            break
-
-    conn.close()
-    assert has_unique_user_id, "Expected unique index on profile.user_id"
+    assert row is not None, "Expected unique index on profile.user_id"
 
 
 @pytest.mark.asyncio
@@ -101,16 +92,6 @@ async def test_one_to_one_unique_index_in_sqlite(db_url):
 async def test_one_to_one_unique_index_in_postgres(
     db_url, postgres_base_url, db_schema_name
 ):
-    class User(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-        profile: "Profile" = BackRef()
-
-    class Profile(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        bio: str
-        user: Annotated[User, ForeignKey(related_name="profile", unique=True)]
-
     await connect(db_url, auto_migrate=True)
 
     import psycopg
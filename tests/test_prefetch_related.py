@@ -0,0 +1,236 @@
+from typing import Annotated
+
+import pytest
+
+from ferro import (
+    BackRef,
+    FerroField,
+    ForeignKey,
+    ManyToMany,
+    Model,
+    Relation,
+    clear_registry,
+    connect,
+    reset_engine,
+)
+
+pytestmark = pytest.mark.backend_matrix
+
+
+@pytest.fixture(autouse=True)
+def cleanup():
+    reset_engine()
+    clear_registry()
+    from ferro.state import _MODEL_REGISTRY_PY, _PENDING_RELATIONS
+
+    _MODEL_REGISTRY_PY.clear()
+    _PENDING_RELATIONS.clear()
+    yield
+
+
+@pytest.fixture
+def query_counter(monkeypatch):
+    """Count SELECTs issued through ``Query.all`` by wrapping the core call."""
+    from ferro.query import builder
+
+    calls: list[str] = []
+    original = builder.fetch_filtered
+
+    def counting_fetch_filtered(cls, *args, **kwargs):
+        calls.append(cls.__name__)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(builder, "fetch_filtered", counting_fetch_filtered)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_prefetch_forward_and_reverse_relations(db_url, query_counter):
+    class Author(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        books: Relation[list["Book"]] = BackRef()
+
+    class Book(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        title: str
+        author: Annotated[Author, ForeignKey(related_name="books")]
+
+    await connect(db_url, auto_migrate=True)
+    alice = await Author.create(name="alice")
+    bob = await Author.create(name="bob")
+    for title, author in [("a1", alice), ("a2", alice), ("b1", bob)]:
+        await Book.create(title=title, author=author)
+    carol = await Author.create(name="carol")
+
+    books = await Book.select().prefetch_related("author").all()
+    authors = await Author.select().prefetch_related("books").all()
+    assert query_counter == ["Book", "Author", "Author", "Book"]
+
+    query_counter.clear()
+    assert {(book.title, (await book.author).name) for book in books} == {
+        ("a1", "alice"),
+        ("a2", "alice"),
+        ("b1", "bob"),
+    }
+    titles = {
+        author.name: sorted(b.title for b in await author.books.all())
+        for author in authors
+    }
+    assert titles == {"alice": ["a1", "a2"], "bob": ["b1"], "carol": []}
+    assert query_counter == []
+
+    # Refining a prefetched relation goes back to the database.
+    assert await alice.books.where(lambda book: book.title == "a2").count() == 1
+    filtered = await alice.books.where(lambda book: book.title == "a1").all()
+    assert [b.title for b in filtered] == ["a1"]
+    assert query_counter == ["Book"]
+
+    # A later load without prefetch_related drops the cached relations.
+    await Book.create(title="c1", author=carol)
+    await Author.where(lambda author: author.id == carol.id).all()
+    assert [b.title for b in await carol.books.all()] == ["c1"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_splits_keys_past_the_chunk_size(
+    db_url, query_counter, monkeypatch
+):
+    from ferro.relations import prefetch
+
+    monkeypatch.setattr(prefetch, "_PREFETCH_CHUNK_SIZE", 2)
+
+    class Author(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        books: Relation[list["Book"]] = BackRef()
+
+    class Book(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        title: str
+        author: Annotated[Author, ForeignKey(related_name="books")]
+
+    await connect(db_url, auto_migrate=True)
+    for name in ["a", "b", "c", "d", "e"]:
+        author = await Author.create(name=name)
+        await Book.create(title=f"{name}1", author=author)
+
+    authors = await Author.select().prefetch_related("books").all()
+    books = await Book.select().prefetch_related("author").all()
+    assert query_counter == ["Author"] + ["Book"] * 3 + ["Book"] + ["Author"] * 3
+
+    query_counter.clear()
+    assert {a.name: [b.title for b in await a.books.all()] for a in authors} == {
+        name: [f"{name}1"] for name in ["a", "b", "c", "d", "e"]
+    }
+    assert {(await b.author).name for b in books} == {"a", "b", "c", "d", "e"}
+    assert query_counter == []
+
+
+@pytest.mark.asyncio
+async def test_model_all_drops_prefetched_relations(db_url):
+    class Author(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        books: Relation[list["Book"]] = BackRef()
+
+    class Book(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        title: str
+        author: Annotated[Author, ForeignKey(related_name="books")]
+
+    await connect(db_url, auto_migrate=True)
+    alice = await Author.create(name="alice")
+    await Book.create(title="a1", author=alice)
+    await Author.select().prefetch_related("books").all()
+
+    await Book.create(title="a2", author=alice)
+    [author] = await Author.all()
+    assert author is alice
+    assert sorted(b.title for b in await author.books.all()) == ["a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_drops_prefetched_relations(db_url):
+    class Author(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        books: Relation[list["Book"]] = BackRef()
+
+    class Book(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        title: str
+        author: Annotated[Author, ForeignKey(related_name="books")]
+
+    await connect(db_url, auto_migrate=True)
+    alice = await Author.create(name="alice")
+    await Book.create(title="a1", author=alice)
+    await Author.select().prefetch_related("books").all()
+
+    await Book.create(title="a2", author=alice)
+    await alice.refresh()
+    assert sorted(b.title for b in await alice.books.all()) == ["a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_one_to_one_and_null_foreign_key(db_url, query_counter):
+    class Account(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        profile: "Profile" = BackRef()
+        tickets: Relation[list["Ticket"]] = BackRef()
+
+    class Profile(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        bio: str
+        account: Annotated[Account, ForeignKey(related_name="profile", unique=True)]
+
+    class Ticket(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        subject: str
+        account: Annotated[
+            Account | None, ForeignKey(related_name="tickets", on_delete="SET NULL")
+        ] = None
+
+    await connect(db_url, auto_migrate=True)
+    with_profile = await Account.create(name="with")
+    await Account.create(name="without")
+    await Profile.create(bio="hello", account=with_profile)
+    await Ticket.create(subject="orphan")
+
+    accounts = await Account.select().prefetch_related("profile").all()
+    tickets = await Ticket.select().prefetch_related("account").all()
+    query_counter.clear()
+
+    profiles = {account.name: await account.profile for account in accounts}
+    assert profiles["with"].bio == "hello"
+    assert profiles["without"] is None
+    assert await tickets[0].account is None
+    assert query_counter == []
+
+
+@pytest.mark.asyncio
+async def test_prefetch_rejects_unknown_and_many_to_many_relations(db_url):
+    class Tag(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        notes: Relation[list["Note"]] = BackRef()
+
+    class Note(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        body: str
+        tags: Relation[list[Tag]] = ManyToMany(related_name="notes")
+
+    await connect(db_url, auto_migrate=True)
+
+    # Names are checked when prefetch_related() is called, even with no rows.
+    with pytest.raises(ValueError, match="'athor' is not a relationship on Note"):
+        Note.select().prefetch_related("athor")
+    with pytest.raises(NotImplementedError, match="many-to-many"):
+        Note.select().prefetch_related("tags")
+
+    await Note.create(body="n")
+    with pytest.raises(ValueError, match="'body' is not a relationship on Note"):
+        await Note.select().prefetch_related("body").all()
+    with pytest.raises(NotImplementedError, match="many-to-many"):
+        await Note.select().prefetch_related("tags").all()
@@ -6,19 +6,46 @@ from decimal import Decimal
 from enum import Enum
 
 import pytest
-from ferro import Model, connect
+from ferro import Model
 from ferro.query import Query, QueryNode, col
 from ferro.query.builder import _query_ir_payload_to_json
 from ferro.query.nodes import _serialize_query_value
 from pydantic import Field
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
 class QueryStatus(str, Enum):
     ACTIVE = "active"
 
 
+class QueryUser(Model):
+    id: int = Field(json_schema_extra={"primary_key": True})
+    username: str
+    age: int
+    status: QueryStatus = QueryStatus.ACTIVE
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
+
+    QueryUser._reregister_ferro()
+    _MODEL_REGISTRY_PY[QueryUser.__name__] = QueryUser
+    yield
+
+
+async def _seed_query_users() -> None:
+    """Insert taylor (30), jeff (25) and alice (35) in one statement."""
+    await QueryUser.bulk_create(
+        [
+            QueryUser(id=1, username="taylor", age=30),
+            QueryUser(id=2, username="jeff", age=25),
+            QueryUser(id=3, username="alice", age=35),
+        ]
+    )
+
+
 def test_serialize_query_value_normalizes_non_json_native_values():
     uid = uuid.uuid4()
     happened_at = datetime(2026, 4, 24, 18, 30, tzinfo=UTC)
@@ -75,6 +102,13 @@ def test_query_ir_payload_to_json_serializes_m2m_context_without_mutating_query_
     assert payload["payload"]["m2m"]["source_id"] == str(source_id)
 
 
+def test_query_ir_payload_to_json_rejects_values_it_cannot_encode():
+    query_def = {"model_name": "Tag", "where": [], "m2m": {"source_id": object()}}
+
+    with pytest.raises(TypeError, match="Object of type object"):
+        _query_ir_payload_to_json(query_def)
+
+
 def test_query_node_to_dict_serializes_uuid_values_inside_in_filters():
     uid1 = uuid.uuid4()
     uid2 = uuid.uuid4()
@@ -99,11 +133,6 @@ def test_field_proxy_operator_overloading():
     and that operators on it return a QueryNode.
     """
 
-    class QueryUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        age: int
-        username: str
-
     # 1. Accessing via class should return something that supports operators
     expr = QueryUser.age >= 18
 
@@ -113,16 +142,23 @@ def test_field_proxy_operator_overloading():
     assert expr.value == 18
 
 
+def test_query_nodes_use_slots():
+    """Predicate construction allocates no per-instance ``__dict__``."""
+
+    proxy = col(QueryUser.age)
+    expr = (proxy >= 18) & (proxy < 65)
+
+    assert not hasattr(proxy, "__dict__")
+    assert not hasattr(expr, "__dict__")
+    assert not hasattr(expr.left, "__dict__")
+
+
 @pytest.mark.deprecated_operator_path
 def test_model_where_clause():
     """
     Test that Model.where() returns a Query object with the correct condition.
     """
 
-    class QueryUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        age: int
-
     with pytest.deprecated_call(match="Operator predicate style.*v0\\.14\\.0"):
         query = QueryUser.where(QueryUser.age >= 21)
 
@@ -139,10 +175,6 @@ def test_query_chaining_placeholders():
     Test that Query object supports chaining (even if not yet executed).
     """
 
-    class QueryUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        age: int
-
     with pytest.deprecated_call(match="Operator predicate style.*v0\\.14\\.0"):
         query = QueryUser.where(QueryUser.age >= 18).limit(10).offset(5)
 
@@ -151,15 +183,23 @@ def test_query_chaining_placeholders():
     assert len(query.where_clause) == 1
 
 
+def test_chained_where_extends_one_query():
+    """Each ``.where()`` appends to the same Query, so a chain runs as one statement."""
+    query = QueryUser.where(lambda user: user.age < 35)
+    chained = query.where(lambda user: user.age > 20)
+
+    assert chained is query
+    assert [(n.column, n.operator, n.value) for n in query.where_clause] == [
+        ("age", "<", 35),
+        ("age", ">", 20),
+    ]
+
+
 def test_in_operator_lshift():
     """
     Test that the << operator correctly creates an IN condition.
     """
 
-    class QueryUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        username: str
-
     expr = QueryUser.username << ["taylor", "jeff"]
 
     assert isinstance(expr, QueryNode)
@@ -176,48 +216,34 @@ def test_in_operator_lshift():
 
 
 def test_col_style_where_does_not_emit_deprecation_warning():
-    class ColUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        age: int
-
     with warnings.catch_warnings(record=True) as captured:
         warnings.simplefilter("always", DeprecationWarning)
-        query = ColUser.where(col(ColUser.age) >= 21)
+        query = QueryUser.where(col(QueryUser.age) >= 21)
     assert isinstance(query, Query)
     assert not [w for w in captured if issubclass(w.category, DeprecationWarning)]
 
 
 @pytest.mark.asyncio
-async def test_query_execution(db_url):
+async def test_query_execution(shared_db):
     """
     Test that executing a filtered query actually returns data from the DB.
     """
 
-    class FilterUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        username: str
-        age: int
-
-    # Initialize connection and auto-migrate
-    await connect(db_url, auto_migrate=True)
-
     # Seed data
-    await FilterUser(id=1, username="taylor", age=30).save()
-    await FilterUser(id=2, username="jeff", age=25).save()
-    await FilterUser(id=3, username="alice", age=35).save()
+    await _seed_query_users()
 
     # 1. Test basic filter
-    results = await FilterUser.where(lambda t: t.age >= 30).all()
+    results = await QueryUser.where(lambda t: t.age >= 30).all()
     assert len(results) == 2
     assert {r.username for r in results} == {"taylor", "alice"}
 
     # 2. Test IN filter
-    results_in = await FilterUser.where(lambda t: t.username << ["jeff", "alice"]).all()
+    results_in = await QueryUser.where(lambda t: t.username << ["jeff", "alice"]).all()
     assert len(results_in) == 2
     assert {r.username for r in results_in} == {"jeff", "alice"}
 
     # 3. Test combined filters (Chaining)
-    results_chained = await FilterUser.where(lambda t: t.age < 35).where(
+    results_chained = await QueryUser.where(lambda t: t.age < 35).where(
         lambda t: t.age > 20
     ).all()
     assert len(results_chained) == 2
@@ -225,87 +251,93 @@ async def test_query_execution(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_first(db_url):
+async def test_query_first(shared_db):
     """
     Test that .first() returns a single record or None.
     """
 
-    class FirstUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-    await FirstUser(id=1, username="taylor").save()
+    await QueryUser(id=1, username="taylor", age=30).save()
 
     # 1. Match found
-    user = await FirstUser.where(lambda t: t.username == "taylor").first()
+    user = await QueryUser.where(lambda t: t.username == "taylor").first()
     assert user is not None
     assert user.username == "taylor"
 
     # 2. No match found
-    no_user = await FirstUser.where(lambda t: t.username == "nonexistent").first()
+    no_user = await QueryUser.where(lambda t: t.username == "nonexistent").first()
     assert no_user is None
 
 
 @pytest.mark.asyncio
-async def test_sql_injection_protection(db_url):
+async def test_query_values_selects_only_named_columns(shared_db):
+    """.values() returns dicts of the requested columns, in query order."""
+
+    await _seed_query_users()
+
+    rows = await (
+        QueryUser.where(lambda user: user.age >= 30)
+        .order_by(QueryUser.age, "desc")
+        .values("username", "status")
+    )
+    assert rows == [
+        {"username": "alice", "status": QueryStatus.ACTIVE},
+        {"username": "taylor", "status": QueryStatus.ACTIVE},
+    ]
+    assert isinstance(rows[0]["status"], QueryStatus)
+
+    assert await QueryUser.select().order_by(QueryUser.id).limit(1).values() == [
+        {"id": 1, "username": "taylor", "age": 30, "status": QueryStatus.ACTIVE}
+    ]
+    with pytest.raises(ValueError, match="'email' is not a column on QueryUser"):
+        await QueryUser.select().values("email")
+
+
+@pytest.mark.asyncio
+async def test_sql_injection_protection(shared_db):
     """
     Test that malicious strings are treated as literals and don't bypass filters.
     """
 
-    class SafeUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-    await SafeUser(id=1, username="taylor").save()
+    await QueryUser(id=1, username="taylor", age=30).save()
 
     # Attempt standard SQL injection
     injection_string = "' OR '1'='1"
 
     # If not parameterized, this might return the user.
     # If parameterized, it should look for the literal string and return None.
-    result = await SafeUser.where(lambda t: t.username == injection_string).first()
+    result = await QueryUser.where(lambda t: t.username == injection_string).first()
 
     assert result is None
 
 
 @pytest.mark.asyncio
-async def test_query_bitwise_logic(db_url):
+async def test_query_bitwise_logic(shared_db):
     """
     Test that bitwise | (OR) and & (AND) create correct logical conditions.
     """
 
-    class LogicUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        username: str
-        age: int
-
-    await connect(db_url, auto_migrate=True)
-    await LogicUser(id=1, username="taylor", age=30).save()
-    await LogicUser(id=2, username="jeff", age=25).save()
-    await LogicUser(id=3, username="alice", age=35).save()
+    await _seed_query_users()
 
     # 1. Test OR (|)
-    # SQL: SELECT * FROM logicuser WHERE age < 30 OR username == 'alice'
-    results_or = await LogicUser.where(
+    # SQL: SELECT * FROM queryuser WHERE age < 30 OR username == 'alice'
+    results_or = await QueryUser.where(
         lambda t: (t.age < 30) | (t.username == "alice")
     ).all()
     assert len(results_or) == 2
     assert {r.username for r in results_or} == {"jeff", "alice"}
 
     # 2. Test nested AND (&) within WHERE
-    # SQL: SELECT * FROM logicuser WHERE (age > 20) AND (username != 'taylor')
-    results_and = await LogicUser.where(
+    # SQL: SELECT * FROM queryuser WHERE (age > 20) AND (username != 'taylor')
+    results_and = await QueryUser.where(
         lambda t: (t.age > 20) & (t.username != "taylor")
     ).all()
     assert len(results_and) == 2
     assert {r.username for r in results_and} == {"jeff", "alice"}
 
     # 3. Test Complex Nesting: (A OR B) AND C
-    # SQL: SELECT * FROM logicuser WHERE (username == 'taylor' OR username == 'jeff') AND age > 28
+    # SQL: SELECT * FROM queryuser WHERE (username == 'taylor' OR username == 'jeff') AND age > 28
     # Only taylor (30) matches both. jeff (25) is under 28.
-    results_complex = await LogicUser.where(
+    results_complex = await QueryUser.where(
         lambda t: ((t.username == "taylor") | (t.username == "jeff")) & (t.age > 28)
     ).all()
     assert len(results_complex) == 1
@@ -313,23 +345,15 @@ async def test_query_bitwise_logic(db_url):
 
 
 @pytest.mark.asyncio
-async def test_query_bitwise_multiple_where(db_url):
+async def test_query_bitwise_multiple_where(shared_db):
     """
     Test that multiple .where() calls are AND-ed together with complex logic.
     """
 
-    class LogicUser(Model):
-        id: int = Field(json_schema_extra={"primary_key": True})
-        username: str
-        age: int
-
-    await connect(db_url, auto_migrate=True)
-    await LogicUser(id=1, username="taylor", age=30).save()
-    await LogicUser(id=2, username="jeff", age=25).save()
-    await LogicUser(id=3, username="alice", age=35).save()
+    await _seed_query_users()
 
     # (A OR B) AND (C)
-    query = LogicUser.where(lambda t: (t.username == "jeff") | (t.username == "alice"))
+    query = QueryUser.where(lambda t: (t.username == "jeff") | (t.username == "alice"))
     query = query.where(lambda t: t.age > 30)
 
     results = await query.all()
@@ -1,21 +1,28 @@
 import pytest
 from typing import Annotated
-from ferro import Model, connect, FerroField
+from ferro import Model, FerroField
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
-@pytest.mark.asyncio
-async def test_instance_refresh(db_url):
-    """Test that .refresh() updates the instance from the database."""
+class RefreshUser(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    username: str
+    points: int = 0
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
 
-    class RefreshUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-        points: int
+    RefreshUser._reregister_ferro()
+    _MODEL_REGISTRY_PY[RefreshUser.__name__] = RefreshUser
+    yield
 
-    await connect(db_url, auto_migrate=True)
 
+@pytest.mark.asyncio
+async def test_instance_refresh(shared_db):
+    """Test that .refresh() updates the instance from the database."""
     # 1. Create a user
     user = await RefreshUser.create(username="taylor", points=100)
     assert user.points == 100
@@ -35,15 +42,8 @@ async def test_instance_refresh(db_url):
 
 
 @pytest.mark.asyncio
-async def test_refresh_not_found(db_url):
+async def test_refresh_not_found(shared_db):
     """Test that .refresh() raises an error if the record is gone."""
-
-    class RefreshUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-
     user = await RefreshUser.create(username="deleted_soon")
 
     # Delete it from DB
@@ -51,3 +51,19 @@ async def test_refresh_not_found(db_url):
 
     with pytest.raises(RuntimeError, match="Instance not found in database"):
         await user.refresh()
+
+
+@pytest.mark.asyncio
+async def test_update_returning_refreshes_tracked_instance(shared_db):
+    """``update_returning()`` refreshes live instances without a refresh()."""
+    user = await RefreshUser.create(username="taylor", points=100)
+    other = await RefreshUser.create(username="jordan", points=5)
+
+    updated = await RefreshUser.where(
+        lambda refreshuser: refreshuser.id == user.id
+    ).update_returning(points=200)
+
+    assert updated == [user]
+    assert updated[0] is user
+    assert user.points == 200
+    assert other.points == 5
@@ -21,7 +21,7 @@ class RelationshipError(Exception):
     pass
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def cleanup():
     from ferro.state import _MODEL_REGISTRY_PY, _PENDING_RELATIONS
 
@@ -46,6 +46,7 @@ class Post(Model):
     author: Annotated[User, ForeignKey(related_name="posts")]
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_relation_back_ref_helper_declares_reverse_relation():
     """Relation[list[T]] = BackRef() declares a reverse collection relation."""
 
@@ -71,6 +72,7 @@ def test_relation_back_ref_helper_declares_reverse_relation():
     assert Role.candidates is not None
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_relation_back_ref_field_equivalent_declares_reverse_relation():
     """Field(back_ref=True) is the lower-level equivalent of BackRef()."""
 
@@ -93,6 +95,7 @@ def test_relation_back_ref_field_equivalent_declares_reverse_relation():
     assert hasattr(RoleViaField, "candidates")
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_relation_many_to_many_helper_declares_collection_relation():
     """Relation[list[T]] = ManyToMany(...) declares a many-to-many relation."""
 
@@ -119,6 +122,7 @@ def test_relation_many_to_many_helper_declares_collection_relation():
     assert hasattr(Course, "students")
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_relation_many_to_many_field_equivalent_declares_collection_relation():
     """Field(many_to_many=True, ...) is the lower-level equivalent of ManyToMany()."""
 
@@ -168,6 +172,7 @@ def test_many_to_many_field_import_removed_from_public_api():
     assert not hasattr(ferro, "ManyToManyField")
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_metadata_discovery():
     """Verify that the Metaclass finds ForeignKey and BackRef annotations."""
     # Before resolution
@@ -200,6 +205,7 @@ def test_pydantic_isolation():
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("cleanup")
 async def test_forward_ref_resolution():
     """Verify that string/ForwardRef model references are resolved during connect()."""
 
@@ -229,6 +235,7 @@ async def test_forward_ref_resolution():
     assert Post.model_fields["author_id"].annotation == (int | None)
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_relationship_validation_failure():
     """Verify that an error is raised if related_name doesn't match a field."""
 
@@ -245,55 +252,59 @@ def test_relationship_validation_failure():
     from ferro.relations import resolve_relationships
 
     with pytest.raises(
-        Exception, match="defines a relationship to 'User' with related_name='posts'"
+        RuntimeError,
+        match="defines a relationship to 'User' with related_name='posts'",
     ):
         resolve_relationships()
 
 
-def test_back_ref_via_field_default():
-    """Field(default=None, back_ref=True) declares a reverse relation like BackRef."""
+def _build_back_ref_pair(decl: str) -> tuple[type[Model], type[Model]]:
+    """Declare a user/post pair whose reverse side uses the ``decl`` syntax."""
+    if decl == "backref_marker":
 
-    class UserViaField(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-        posts: Relation[list["PostViaField"]] = Field(back_ref=True)
+        class BackRefUser(Model):
+            id: Annotated[int | None, FerroField(primary_key=True)] = None
+            username: str
+            posts: Relation[list["BackRefPost"]] = BackRef()
 
-    class PostViaField(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        title: str
-        author: Annotated[UserViaField, ForeignKey(related_name="posts")]
+    elif decl == "field_default":
 
-    assert "posts" in UserViaField.ferro_relations
-    assert UserViaField.ferro_relations["posts"] == "BackRef"
+        class BackRefUser(Model):
+            id: Annotated[int | None, FerroField(primary_key=True)] = None
+            username: str
+            posts: Relation[list["BackRefPost"]] = Field(back_ref=True)
 
-    from ferro.relations import resolve_relationships
+    else:
 
-    resolve_relationships()
-    assert hasattr(UserViaField, "posts")
+        class BackRefUser(Model):
+            id: Annotated[int | None, FerroField(primary_key=True)] = None
+            username: str
+            posts: Annotated[Relation[list["BackRefPost"]], Field(back_ref=True)]
 
+    class BackRefPost(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        title: str
+        author: Annotated[BackRefUser, ForeignKey(related_name="posts")]
 
-def test_back_ref_via_annotated_field():
-    """Annotated[list["Post"], Field(back_ref=True)] = None declares a reverse relation."""
+    return BackRefUser, BackRefPost
 
-    class UserAnnotated(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-        posts: Annotated[Relation[list["PostAnnotated"]], Field(back_ref=True)]
 
-    class PostAnnotated(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        title: str
-        author: Annotated[UserAnnotated, ForeignKey(related_name="posts")]
+@pytest.mark.usefixtures("cleanup")
+@pytest.mark.parametrize("decl", ["backref_marker", "field_default", "annotated_field"])
+def test_back_ref_declaration_syntaxes(decl):
+    """BackRef(), Field(back_ref=True) and its Annotated form declare the same relation."""
+    user_cls, _ = _build_back_ref_pair(decl)
 
-    assert "posts" in UserAnnotated.ferro_relations
-    assert UserAnnotated.ferro_relations["posts"] == "BackRef"
+    assert user_cls.ferro_relations["posts"] == "BackRef"
+    assert "posts" not in user_cls.model_fields
 
     from ferro.relations import resolve_relationships
 
     resolve_relationships()
-    assert hasattr(UserAnnotated, "posts")
+    assert hasattr(user_cls, "posts")
 
 
+@pytest.mark.usefixtures("cleanup")
 def test_back_ref_and_many_to_many_flags_raise():
     """Cannot mark one relation field as both reverse and many-to-many."""
 
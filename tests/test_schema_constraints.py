@@ -1,4 +1,3 @@
-import sqlite3
 from typing import Annotated
 
 import pytest
@@ -14,6 +13,7 @@ from ferro import (
     connect,
     reset_engine,
 )
+from ferro.raw import fetch_all
 
 pytestmark = pytest.mark.backend_matrix
 
@@ -36,14 +36,12 @@ async def test_runtime_create_tables_respects_explicit_nullable_override(db_url)
 
     await connect(db_url, auto_migrate=True)
 
-    db_path = db_url.replace("sqlite:", "").split("?")[0]
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info('nullableoverriderow')")
-    columns = {row[1]: row for row in cursor.fetchall()}
-    conn.close()
+    rows = await fetch_all("PRAGMA table_info('nullableoverriderow')")
+    columns = {row["name"]: row for row in rows}
 
-    assert columns["field_a"][3] == 1, "field_a should be NOT NULL in runtime DDL"
+    assert columns["field_a"]["notnull"] == 1, (
+        "field_a should be NOT NULL in runtime DDL"
+    )
 
 
 @pytest.mark.asyncio
@@ -66,24 +64,24 @@ async def test_foreign_key_constraint_exists(db_url):
     # 1. Connect and Migrate
     await connect(db_url, auto_migrate=True)
 
-    # 2. Inspect the SQLite schema directly
-    db_path = db_url.replace("sqlite:", "").split("?")[0]
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # PRAGMA foreign_key_list(table_name) returns rows like:
-    # (id, seq, table, from, to, on_update, on_delete, match)
-    cursor.execute("PRAGMA foreign_key_list('product')")
-    fk_list = cursor.fetchall()
-    conn.close()
+    # 2. Inspect the SQLite schema through the engine's own connection.
+    # PRAGMA foreign_key_list(table_name) returns rows with the columns
+    # id, seq, table, from, to, on_update, on_delete, match.
+    fk_list = await fetch_all("PRAGMA foreign_key_list('product')")
 
     assert len(fk_list) > 0, "No foreign key constraint found on 'product' table"
 
     fk = fk_list[0]
-    assert fk[2] == "category", f"Expected reference to 'category', got {fk[2]}"
-    assert fk[3] == "category_id", f"Expected column 'category_id', got {fk[3]}"
-    assert fk[4] == "id", f"Expected reference to 'id', got {fk[4]}"
-    assert fk[6] == "CASCADE", f"Expected ON DELETE CASCADE, got {fk[6]}"
+    assert fk["table"] == "category", (
+        f"Expected reference to 'category', got {fk['table']}"
+    )
+    assert fk["from"] == "category_id", (
+        f"Expected column 'category_id', got {fk['from']}"
+    )
+    assert fk["to"] == "id", f"Expected reference to 'id', got {fk['to']}"
+    assert fk["on_delete"] == "CASCADE", (
+        f"Expected ON DELETE CASCADE, got {fk['on_delete']}"
+    )
 
 
 @pytest.mark.asyncio
@@ -160,22 +158,15 @@ async def test_foreign_key_index_runtime_ddl_parity(db_url):
 
     await connect(db_url, auto_migrate=True)
 
-    db_path = db_url.replace("sqlite:", "").split("?")[0]
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    indexes = await fetch_all(
         "SELECT name, tbl_name, sql FROM sqlite_master "
         "WHERE type = 'index' AND tbl_name = 'project'"
     )
-    indexes = cursor.fetchall()
-    conn.close()
 
-    matching = [row for row in indexes if row[0] == "idx_project_org_id"]
-    assert matching, (
-        f"Expected idx_project_org_id on table 'project', got: {indexes!r}"
-    )
-    assert "org_id" in (matching[0][2] or ""), (
-        f"Index DDL should reference org_id column: {matching[0][2]!r}"
+    matching = [row for row in indexes if row["name"] == "idx_project_org_id"]
+    assert matching, f"Expected idx_project_org_id on table 'project', got: {indexes!r}"
+    assert "org_id" in (matching[0]["sql"] or ""), (
+        f"Index DDL should reference org_id column: {matching[0]['sql']!r}"
     )
 
 
@@ -85,6 +85,47 @@ def test_reconcile_upgrades_forward_ref_shadow(_cleanup_registry):
     assert ReconcileChild.model_fields["parent_id"].annotation == (int | None)
 
 
+def test_resolve_reruns_pydantic_json_schema_only_for_rebuilt_models(
+    _cleanup_registry, monkeypatch
+):
+    from ferro.relations import resolve_relationships
+    from ferro.schema_metadata import build_model_schema
+
+    class CachedSchemaChild(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        parent: Annotated["CachedSchemaParent", ForeignKey(related_name="children")]
+
+    class CachedSchemaParent(Model):
+        id: Annotated[int | None, FerroField(primary_key=True)] = None
+        name: str
+        children: Relation[list[CachedSchemaChild]] = BackRef()
+
+    calls: list[str] = []
+    original = Model.model_json_schema.__func__
+
+    def counting_model_json_schema(cls, *args, **kwargs):
+        calls.append(cls.__name__)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(
+        Model, "model_json_schema", classmethod(counting_model_json_schema)
+    )
+
+    resolve_relationships()
+    # Only the child's shadow parent_id was upgraded and model_rebuild()-ed.
+    assert calls == ["CachedSchemaChild"]
+    child_schema = build_model_schema(CachedSchemaChild)
+    assert child_schema["properties"]["parent_id"]["anyOf"][0]["type"] == "integer"
+
+    calls.clear()
+    resolve_relationships()
+    assert calls == []
+
+    # Each caller gets its own copy to enrich.
+    build_model_schema(CachedSchemaParent)["properties"].clear()
+    assert "name" in build_model_schema(CachedSchemaParent)["properties"]
+
+
 @pytest.mark.asyncio
 async def test_uuid_fk_create_get_dump(db_url):
     """Regression for GitHub #16: UUID PK through shadow FK without validation/serialization issues."""
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 
 
@@ -6,3 +8,17 @@ def test_query_methods_use_query_ir_serializer_instead_of_raw_json_dumps():
 
     assert source.count("def _query_ir_payload_to_json(") == 1
     assert "json.dumps(query_def)" not in source
+
+
+def test_import_ferro_does_not_load_migration_stack():
+    """Alembic/SQLAlchemy stay behind ``ferro.migrations`` so ``import ferro`` is cheap."""
+    probe = (
+        "import sys, ferro; "
+        "print(sorted(m for m in ('alembic', 'sqlalchemy', 'ferro.migrations') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -1,22 +1,30 @@
 import pytest
 from typing import Annotated
-from ferro import Model, connect, FerroField
+from ferro import Model, FerroField
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
-@pytest.mark.asyncio
-async def test_like_search(db_url):
-    """Test string searching with .like()."""
+class SearchableUser(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    name: str
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
 
-    class SearchableUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        name: str
+    SearchableUser._reregister_ferro()
+    _MODEL_REGISTRY_PY[SearchableUser.__name__] = SearchableUser
+    yield
 
-    await connect(db_url, auto_migrate=True)
 
-    await SearchableUser.create(name="Taylor")
-    await SearchableUser.create(name="Tyler")
+@pytest.mark.asyncio
+async def test_like_search(shared_db):
+    """Test string searching with .like()."""
+    await SearchableUser.bulk_create(
+        [SearchableUser(name="Taylor"), SearchableUser(name="Tyler")]
+    )
 
     # .like()
     results = await SearchableUser.where(SearchableUser.name.like("Tay%")).all()
@@ -25,18 +33,11 @@ async def test_like_search(db_url):
 
 
 @pytest.mark.asyncio
-async def test_in_helper(db_url):
+async def test_in_helper(shared_db):
     """Test .in_() as an alternative to <<."""
-
-    class SearchableUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        name: str
-
-    await connect(db_url, auto_migrate=True)
-
-    await SearchableUser.create(name="user1")
-    await SearchableUser.create(name="user2")
-    await SearchableUser.create(name="user3")
+    await SearchableUser.bulk_create(
+        [SearchableUser(name=name) for name in ("user1", "user2", "user3")]
+    )
 
     # Use .in_()
     results = await SearchableUser.where(
@@ -50,3 +51,16 @@ async def test_in_helper(db_url):
         SearchableUser.name << ["user1", "user3"]
     ).all()
     assert len(results_legacy) == 2
+
+
+@pytest.mark.asyncio
+async def test_like_backslash_escapes_wildcards(shared_db):
+    """A backslash escapes ``%`` in a LIKE pattern on every backend."""
+    await SearchableUser.bulk_create(
+        [SearchableUser(name="100%"), SearchableUser(name="1000")]
+    )
+
+    results = await SearchableUser.where(
+        lambda searchableuser: searchableuser.name.like("100\\%")
+    ).all()
+    assert [r.name for r in results] == ["100%"]
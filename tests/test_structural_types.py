@@ -6,9 +6,9 @@ from typing import Annotated, Dict, List
 
 from pydantic import BaseModel, Field
 
-from ferro import Model, connect, FerroField
+from ferro import FerroField, Model, connect, evict_instance
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
 class UserRole(str, Enum):
@@ -24,20 +24,45 @@ class TranscriptFormat(str, Enum):
     JSON = "json"
 
 
-@pytest.mark.asyncio
-async def test_structural_types_roundtrip(db_url):
-    """Test that UUID, JSON, Enum, BLOB, and Decimal objects are correctly saved and hydrated."""
+class ComplexModel(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    user_id: uuid.UUID
+    metadata: Dict[str, str] = Field(default_factory=dict)
+    tags: List[str] = Field(default_factory=list)
+    role: UserRole = UserRole.USER
+    data: bytes = b""
+    balance: Decimal = Decimal(0)
 
-    class ComplexModel(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        user_id: uuid.UUID
-        metadata: Dict[str, str]
-        tags: List[str]
-        role: UserRole
-        data: bytes
-        balance: Decimal
 
-    await connect(db_url, auto_migrate=True)
+class JsonListItem(BaseModel):
+    field_a: str
+    field_b: int
+
+
+class JsonListParent(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    items: list[JsonListItem] = Field(default_factory=list)
+
+
+class UuidMutationModel(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    run_id: uuid.UUID
+    label: str
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
+
+    for model_cls in (ComplexModel, JsonListParent, UuidMutationModel):
+        model_cls._reregister_ferro()
+        _MODEL_REGISTRY_PY[model_cls.__name__] = model_cls
+    yield
+
+
+@pytest.mark.asyncio
+async def test_structural_types_roundtrip(shared_db):
+    """Test that UUID, JSON, Enum, BLOB, and Decimal objects are correctly saved and hydrated."""
 
     uid = uuid.uuid4()
     raw_data = b"hello world"
@@ -54,8 +79,6 @@ async def test_structural_types_roundtrip(db_url):
     item_id = item.id
 
     # Force eviction from Identity Map to test database hydration
-    from ferro import evict_instance
-
     evict_instance("ComplexModel", str(item_id))
 
     fetched = await ComplexModel.get(item_id)
@@ -82,22 +105,10 @@ async def test_structural_types_roundtrip(db_url):
 
 
 @pytest.mark.asyncio
-async def test_json_column_list_of_nested_pydantic_models_roundtrip(db_url):
+async def test_json_column_list_of_nested_pydantic_models_roundtrip(shared_db):
     """list[BaseModel] stores as JSON; accepts models on write; reload yields dicts."""
 
-    class JsonListItem(BaseModel):
-        field_a: str
-        field_b: int
-
-    class JsonListParent(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        items: list[JsonListItem] = Field(default_factory=list)
-
-    await connect(db_url, auto_migrate=True)
-
     empty = await JsonListParent.create(items=[])
-    from ferro import evict_instance
-
     evict_instance("JsonListParent", str(empty.id))
     fetched_empty = await JsonListParent.get(empty.id)
     assert fetched_empty is not None
@@ -121,21 +132,18 @@ async def test_json_column_list_of_nested_pydantic_models_roundtrip(db_url):
 
 
 @pytest.mark.asyncio
-async def test_structural_filtering(db_url):
+async def test_structural_filtering(shared_db):
     """Test filtering by UUID and Decimal."""
 
-    class ComplexModel(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        user_id: uuid.UUID
-        balance: Decimal
-
-    await connect(db_url, auto_migrate=True)
-
     uid1 = uuid.uuid4()
     uid2 = uuid.uuid4()
 
-    await ComplexModel.create(user_id=uid1, balance=Decimal("10.0"))
-    await ComplexModel.create(user_id=uid2, balance=Decimal("20.0"))
+    await ComplexModel.bulk_create(
+        [
+            ComplexModel(user_id=uid1, balance=Decimal("10.0")),
+            ComplexModel(user_id=uid2, balance=Decimal("20.0")),
+        ]
+    )
 
     # Filter by UUID
     res = await ComplexModel.where(ComplexModel.user_id == uid1).first()
@@ -149,42 +157,33 @@ async def test_structural_filtering(db_url):
 
 
 @pytest.mark.asyncio
-async def test_uuid_in_filter_serializes_collection_values(db_url):
+async def test_uuid_in_filter_serializes_collection_values(shared_db):
     """UUID values inside IN filters should serialize the same way as scalar UUID filters."""
 
-    class ComplexModel(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        user_id: uuid.UUID
-
-    await connect(db_url, auto_migrate=True)
-
     uid1 = uuid.uuid4()
     uid2 = uuid.uuid4()
     uid3 = uuid.uuid4()
 
-    await ComplexModel.create(user_id=uid1)
-    await ComplexModel.create(user_id=uid2)
-    await ComplexModel.create(user_id=uid3)
+    await ComplexModel.bulk_create(
+        [ComplexModel(user_id=uid) for uid in (uid1, uid2, uid3)]
+    )
 
     results = await ComplexModel.where(ComplexModel.user_id << [uid1, uid3]).all()
     assert {row.user_id for row in results} == {uid1, uid3}
 
 
 @pytest.mark.asyncio
-async def test_uuid_filter_serializes_for_update_and_delete_queries(db_url):
+async def test_uuid_filter_serializes_for_update_and_delete_queries(shared_db):
     """UUID filters should serialize for mutating query payloads too."""
 
-    class UuidMutationModel(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        run_id: uuid.UUID
-        label: str
-
-    await connect(db_url, auto_migrate=True)
-
     uid1 = uuid.uuid4()
     uid2 = uuid.uuid4()
-    await UuidMutationModel.create(run_id=uid1, label="old")
-    await UuidMutationModel.create(run_id=uid2, label="keep")
+    await UuidMutationModel.bulk_create(
+        [
+            UuidMutationModel(run_id=uid1, label="old"),
+            UuidMutationModel(run_id=uid2, label="keep"),
+        ]
+    )
 
     updated = await UuidMutationModel.where(
         UuidMutationModel.run_id == uid1
@@ -1,21 +1,29 @@
 import pytest
 from datetime import datetime, date, timezone
 from typing import Annotated
-from ferro import Model, connect, FerroField
+from ferro import FerroField, Model, evict_instance
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
 
 
-@pytest.mark.asyncio
-async def test_temporal_types_roundtrip(db_url):
-    """Test that datetime and date objects are correctly saved and hydrated."""
+class TemporalModel(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    occurred_at: datetime
+    day: date
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
+
+    TemporalModel._reregister_ferro()
+    _MODEL_REGISTRY_PY[TemporalModel.__name__] = TemporalModel
+    yield
 
-    class TemporalModel(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        occurred_at: datetime
-        day: date
 
-    await connect(db_url, auto_migrate=True)
+@pytest.mark.asyncio
+async def test_temporal_types_roundtrip(shared_db):
+    """Test that datetime and date objects are correctly saved and hydrated."""
 
     # Create fixed timestamps (stripping microseconds for SQLite TEXT comparison stability)
     now = datetime.now(timezone.utc).replace(microsecond=0)
@@ -25,8 +33,6 @@ async def test_temporal_types_roundtrip(db_url):
     item_id = item.id
 
     # Force eviction from Identity Map to test database hydration
-    from ferro import evict_instance
-
     evict_instance("TemporalModel", str(item_id))
 
     fetched = await TemporalModel.get(item_id)
@@ -43,20 +49,18 @@ async def test_temporal_types_roundtrip(db_url):
 
 
 @pytest.mark.asyncio
-async def test_temporal_filtering(db_url):
+async def test_temporal_filtering(shared_db):
     """Test that we can filter records using datetime and date objects."""
 
-    class TemporalModel(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        occurred_at: datetime
-
-    await connect(db_url, auto_migrate=True)
-
     past = datetime(2020, 1, 1, tzinfo=timezone.utc)
     future = datetime(2030, 1, 1, tzinfo=timezone.utc)
 
-    await TemporalModel.create(occurred_at=past)
-    await TemporalModel.create(occurred_at=future)
+    await TemporalModel.bulk_create(
+        [
+            TemporalModel(occurred_at=past, day=past.date()),
+            TemporalModel(occurred_at=future, day=future.date()),
+        ]
+    )
 
     now = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
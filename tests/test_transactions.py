@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import uuid
 import sqlite3
@@ -11,12 +12,27 @@ from ferro import (
     Model,
     Relation,
     connect,
+    create_tables,
     evict_instance,
     execute,
     transaction,
 )
 
-pytestmark = pytest.mark.backend_matrix
+pytestmark = [pytest.mark.backend_matrix, pytest.mark.sqlite_memory]
+
+
+class TxUser(Model):
+    id: Annotated[int | None, FerroField(primary_key=True)] = None
+    username: str
+
+
+@pytest.fixture(autouse=True)
+def _ensure_models_registered():
+    from ferro.state import _MODEL_REGISTRY_PY
+
+    TxUser._reregister_ferro()
+    _MODEL_REGISTRY_PY[TxUser.__name__] = TxUser
+    yield
 
 
 @pytest.mark.asyncio
@@ -152,8 +168,6 @@ async def test_instance_methods_loaded_inside_named_transaction_keep_identity_sc
 
     await connect(f"sqlite:{app_db}?mode=rwc", name="app", default=True)
     await connect(f"sqlite:{service_db}?mode=rwc", name="service")
-    from ferro import create_tables
-
     await create_tables()
     await create_tables(using="service")
 
@@ -200,8 +214,6 @@ async def test_matching_explicit_using_inside_named_transaction_is_allowed(tmp_p
 
     await connect(f"sqlite:{app_db}?mode=rwc", name="app", default=True)
     await connect(f"sqlite:{service_db}?mode=rwc", name="service")
-    from ferro import create_tables
-
     await create_tables()
     await create_tables(using="service")
     await TxMatchingUsingUser.create(id=1, username="app")
@@ -230,15 +242,9 @@ async def test_matching_explicit_using_inside_named_transaction_is_allowed(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_transaction_commit(db_url):
+async def test_transaction_commit(shared_db):
     """Test that operations inside a transaction are committed on success."""
 
-    class TxUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-
     async with transaction():
         await TxUser.create(username="alice")
         await TxUser.create(username="bob")
@@ -249,15 +255,9 @@ async def test_transaction_commit(db_url):
 
 
 @pytest.mark.asyncio
-async def test_transaction_rollback(db_url):
+async def test_transaction_rollback(shared_db):
     """Test that operations inside a transaction are rolled back on exception."""
 
-    class TxUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-
     try:
         async with transaction():
             await TxUser.create(username="charlie")
@@ -270,22 +270,44 @@ async def test_transaction_rollback(db_url):
 
 
 @pytest.mark.asyncio
-async def test_transaction_atomicity(db_url):
-    """Test that if one operation fails, all are rolled back."""
-
-    class TxUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
+# Shared-cache in-memory SQLite uses table locks that fail instead of waiting.
+@pytest.mark.sqlite_memory(enabled=False)
+async def test_open_transaction_does_not_block_pooled_readers(db_url):
+    """A transaction pins its own pooled connection; other tasks keep reading
+    on the rest of the pool and do not see its uncommitted rows."""
 
     await connect(db_url, auto_migrate=True)
+    written = asyncio.Event()
+    observed = asyncio.Event()
+    counts: list[int] = []
+
+    async def writer():
+        async with transaction():
+            await TxUser.create(username="pending")
+            written.set()
+            await asyncio.wait_for(observed.wait(), timeout=5)
 
-    # Create initial user
-    await TxUser.create(username="dave")
+    async def reader():
+        await written.wait()
+        counts.append(await TxUser.select().count())
+        observed.set()
+
+    await asyncio.gather(writer(), reader())
+
+    assert counts == [0]
+    assert await TxUser.select().count() == 1
+
+
+@pytest.mark.asyncio
+async def test_transaction_atomicity(shared_db):
+    """Test that if one operation fails, all are rolled back."""
+
+    # Create initial user; create() already returns it with its id set
+    dave = await TxUser.create(username="dave")
 
     try:
         async with transaction():
             # Update dave
-            dave = await TxUser.where(TxUser.username == "dave").first()
             dave.username = "dave_updated"
             await dave.save()
 
@@ -298,9 +320,7 @@ async def test_transaction_atomicity(db_url):
         pass
 
     # dave should still be "dave", eve should not exist
-    from ferro import evict_instance
-
-    evict_instance("TxUser", "1")
+    evict_instance("TxUser", str(dave.id))
 
     dave_check = await TxUser.where(TxUser.username == "dave").first()
     assert dave_check is not None
@@ -309,15 +329,9 @@ async def test_transaction_atomicity(db_url):
 
 
 @pytest.mark.asyncio
-async def test_nested_transaction_rolls_back_with_outer(db_url):
+async def test_nested_transaction_rolls_back_with_outer(shared_db):
     """Nested transaction blocks should not commit independently of the outer transaction."""
 
-    class TxUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-
     try:
         async with transaction():
             await TxUser.create(username="outer")
@@ -334,15 +348,9 @@ async def test_nested_transaction_rolls_back_with_outer(db_url):
 
 
 @pytest.mark.asyncio
-async def test_bulk_create_participates_in_transaction(db_url):
+async def test_bulk_create_participates_in_transaction(shared_db):
     """bulk_create should use the active transaction instead of committing independently."""
 
-    class TxUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-
     rows = [TxUser(username="bulk_a"), TxUser(username="bulk_b")]
 
     try:
@@ -358,15 +366,9 @@ async def test_bulk_create_participates_in_transaction(db_url):
 
 
 @pytest.mark.asyncio
-async def test_nested_transaction_inner_rollback_allows_outer_commit(db_url):
+async def test_nested_transaction_inner_rollback_allows_outer_commit(shared_db):
     """An inner rollback should behave like a savepoint, not a separate transaction."""
 
-    class TxUser(Model):
-        id: Annotated[int | None, FerroField(primary_key=True)] = None
-        username: str
-
-    await connect(db_url, auto_migrate=True)
-
     async with transaction():
         await TxUser.create(username="outer_before")
 